@@ -4,7 +4,7 @@ import json
 import time
 import re
 import schedule
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 from datetime import datetime
 import concurrent.futures
 from threading import Lock
@@ -12,6 +12,12 @@ import logging
 import os
 import sys
 
+# 요청 속도 제한, 게시글 레코드, 저장소(JSON 파일/저널)는 API 서버(new/)와 같은 구현 사용
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'new'))
+from rate_limiter import HostRateLimiter
+from notice_record import compact_posts
+from storage import JournalNoticeStorage, JsonNoticeStorage, merge_posts
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -32,6 +38,10 @@ class MultiURLScheduledCrawler:
         self.data_file = self.config.get('data_file', 'multi_notices_data.json')
         self.check_interval = self.config.get('check_interval_minutes', 30)
         self.max_pages = self.config.get('max_pages', 2)
+        self.incremental_crawl = self.config.get('incremental_crawl', True)
+        self.journal_mode = self.config.get('journal_mode', False)
+        self.journal_file = self.config.get('journal_file') or f"{os.path.splitext(self.data_file)[0]}.journal.jsonl"
+        self.journal_compact_minutes = self.config.get('journal_compact_minutes', 60)
         self.data_lock = Lock()
         
         # 크롤링할 URL들과 카테고리 정보
@@ -43,6 +53,25 @@ class MultiURLScheduledCrawler:
             'https://csai.jbnu.ac.kr/csai/29108/subview.do': '취업정보'
         })
         
+        # 호스트별 요청 속도 제한
+        crawling_settings = self.config.get('crawling_settings', {})
+        self.max_workers = crawling_settings.get('max_workers', 5)
+        self.timeout = crawling_settings.get('timeout', 10)
+        self.rate_limiter = HostRateLimiter(
+            requests_per_second=crawling_settings.get('requests_per_second', 2.0),
+            burst=crawling_settings.get('burst', 2),
+            adaptive=crawling_settings.get('adaptive_rate_limit', True),
+            min_requests_per_second=crawling_settings.get('min_requests_per_second', 0.2),
+            slow_response_seconds=crawling_settings.get('slow_response_seconds', 3.0),
+            host_overrides=crawling_settings.get('host_requests_per_second', {})
+        )
+        
+        # 게시글 저장소 (저널 모드: 새/변경 게시글만 저널에 추가하고 journal_compact_minutes마다 스냅샷 압축)
+        if self.journal_mode:
+            self.storage = JournalNoticeStorage(self.data_file, self.journal_file, self.journal_compact_minutes * 60)
+        else:
+            self.storage = JsonNoticeStorage(self.data_file)
+        
         # 기존 데이터 로드
         self.existing_data = self.load_existing_data()
         
@@ -57,6 +86,9 @@ class MultiURLScheduledCrawler:
             "data_file": "multi_notices_data.json",
             "check_interval_minutes": 30,
             "max_pages": 2,
+            "incremental_crawl": True,
+            "journal_mode": False,
+            "journal_compact_minutes": 60,
             "target_urls": {
                 "https://csai.jbnu.ac.kr/csai/29105/subview.do": "학과소식",
                 "https://csai.jbnu.ac.kr/csai/29106/subview.do": "일반공지",
@@ -68,6 +100,15 @@ class MultiURLScheduledCrawler:
                 "enabled": False,
                 "webhook_url": "",
                 "message_template": "새로운 공지사항이 등록되었습니다: [{category}] {title}"
+            },
+            "crawling_settings": {
+                "max_workers": 5,
+                "requests_per_second": 2.0,
+                "burst": 2,
+                "adaptive_rate_limit": True,
+                "min_requests_per_second": 0.2,
+                "slow_response_seconds": 3.0,
+                "timeout": 10
             }
         }
         
@@ -92,19 +133,37 @@ class MultiURLScheduledCrawler:
 
     def load_existing_data(self):
         """
-        기존 크롤링 데이터 로드
+        기존 크롤링 데이터 로드 (저널 모드에서는 스냅샷 이후 추가된 새/변경 게시글까지 적용)
         """
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    logging.info(f"기존 데이터 로드 완료: {len(data)}개 게시글")
-                    return data
-            except Exception as e:
-                logging.error(f"기존 데이터 로드 실패: {e}")
+        try:
+            data = self.storage.load_all()
+        except Exception as e:
+            logging.error(f"기존 데이터 로드 실패: {e}")
+            return []
         
-        logging.info("기존 데이터 파일이 없습니다. 새로 시작합니다.")
-        return []
+        if data:
+            logging.info(f"기존 데이터 로드 완료: {len(data)}개 게시글")
+        else:
+            logging.info("기존 데이터 파일이 없습니다. 새로 시작합니다.")
+        return data
+
+    def _get(self, url, params=None):
+        """
+        호스트별 속도 제한을 적용한 GET 요청
+        """
+        host = urlparse(url).netloc
+        self.rate_limiter.acquire(host)
+        
+        started_at = time.monotonic()
+        try:
+            response = requests.get(url, params=params, timeout=self.timeout)
+        except requests.RequestException:
+            self.rate_limiter.record_response(host, None, time.monotonic() - started_at)
+            raise
+        
+        self.rate_limiter.record_response(host, response.status_code, time.monotonic() - started_at,
+                                          response.headers.get('Retry-After'))
+        return response
 
     def get_total_pages(self, soup):
         """
@@ -117,11 +176,11 @@ class MultiURLScheduledCrawler:
                 return min(int(re.search(r'\d+', total_page_span.text).group()), self.max_pages)
         return 1
 
-    def parse_page(self, html, category):
+    def parse_page(self, html, category, soup=None):
         """
-        페이지 파싱하여 게시글 데이터 추출
+        페이지 파싱하여 게시글 데이터 추출 (이미 파싱한 soup이 있으면 재사용)
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = soup or BeautifulSoup(html, 'html.parser')
         data = []
         
         table = soup.find('table', class_='artclTable')
@@ -176,10 +235,10 @@ class MultiURLScheduledCrawler:
 
     def get_post_content(self, url):
         """
-        게시글 상세 내용, HTML 원문, 이미지 URL들 가져오기
+        게시글 상세 내용, HTML 원문, 이미지 URL들 가져오기 (요청/파싱에 실패하면 None)
         """
         try:
-            response = requests.get(url, timeout=10)
+            response = self._get(url)
             response.raise_for_status()
             response.encoding = 'utf-8'
             
@@ -234,26 +293,23 @@ class MultiURLScheduledCrawler:
             
         except Exception as e:
             logging.error(f"상세 내용 가져오기 실패 ({url}): {e}")
-            return {
-                'content_text': '',
-                'content_html': '',
-                'image_urls': []
-            }
+            return None
 
-    def crawl_single_url(self, url, category, max_pages=2):
+    def crawl_single_url(self, url, category, max_pages=2, known_posts=None):
         """
         단일 URL 크롤링
+        known_posts(URL → 저장된 게시글)가 주어지면 저장된 게시글의 상세 페이지는 다시 가져오지 않음
         """
         logging.info(f"[{category}] 크롤링 시작: {url}")
         url_data = []
         
         try:
-            # 첫 페이지에서 총 페이지 수 확인
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
+            # 첫 페이지에서 총 페이지 수 확인 (응답과 soup은 1페이지 데이터로 재사용)
+            first_response = self._get(url)
+            first_response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            total_pages = self.get_total_pages(soup)
+            first_soup = BeautifulSoup(first_response.text, 'html.parser')
+            total_pages = self.get_total_pages(first_soup)
             
             logging.info(f"[{category}] 총 {total_pages}페이지 크롤링 예정")
             
@@ -261,23 +317,18 @@ class MultiURLScheduledCrawler:
                 params = {'page': page_num}
                 
                 try:
-                    response = requests.get(url, params=params, timeout=10)
-                    response.raise_for_status()
-                    
-                    page_data = self.parse_page(response.text, category)
+                    if page_num == 1:
+                        page_data = self.parse_page(first_response.text, category, first_soup)
+                    else:
+                        response = self._get(url, params=params)
+                        response.raise_for_status()
+                        page_data = self.parse_page(response.text, category)
                     
                     # 상세 내용 가져오기
-                    for post in page_data:
-                        if post['url']:
-                            content_data = self.get_post_content(post['url'])
-                            post['content'] = content_data['content_text']
-                            post['content_html'] = content_data['content_html']
-                            post['image_urls'] = content_data['image_urls']
-                            time.sleep(0.3)  # 서버 부하 방지
+                    page_data = self._enrich_posts_with_content(page_data, known_posts)
                     
                     url_data.extend(page_data)
                     logging.info(f"[{category}] 페이지 {page_num}/{total_pages} 완료: {len(page_data)}개 게시글")
-                    time.sleep(0.5)  # 페이지 간 딜레이
                     
                 except Exception as e:
                     logging.error(f"[{category}] 페이지 {page_num} 크롤링 실패: {e}")
@@ -290,20 +341,79 @@ class MultiURLScheduledCrawler:
         
         return url_data
 
-    def crawl_all_urls(self, max_pages=2, use_threading=True):
+    def _enrich_posts_with_content(self, page_data, known_posts=None):
+        """
+        게시글에 상세 내용 추가 (증분 모드에서는 변경 없는 기존 게시글의 내용 재사용)
+        """
+        reused_count = 0
+        failed_urls = set()
+        for post in page_data:
+            if not post['url']:
+                continue
+            
+            known_post = known_posts.get(post['url']) if known_posts else None
+            if known_post and not self._is_post_changed(post, known_post):
+                post['content'] = known_post.get('content', '')
+                post['content_html'] = known_post.get('content_html', '')
+                post['image_urls'] = known_post.get('image_urls', [])
+                reused_count += 1
+                continue
+            
+            content_data = self.get_post_content(post['url'])
+            if content_data is None:
+                failed_urls.add(post['url'])
+                continue
+            post['content'] = content_data['content_text']
+            post['content_html'] = content_data['content_html']
+            post['image_urls'] = content_data['image_urls']
+        
+        if reused_count:
+            logging.info(f"저장된 게시글 {reused_count}개의 상세 내용 재사용 (요청 생략)")
+        if failed_urls:
+            page_data = self._drop_failed_posts(page_data, failed_urls)
+        return page_data
+
+    def _drop_failed_posts(self, page_data, failed_urls):
+        """
+        상세 내용을 가져오지 못한 게시글을 저장된 게시글로 되돌림 (저장된 적 없으면 제외)
+        빈 내용으로 저장하면 다음 증분 크롤링에서 다시 가져오지 않으므로 다음 크롤링에서 다시 시도
+        """
+        with self.data_lock:
+            stored_posts = {post['url']: post for post in self.existing_data if post.get('url') in failed_urls}
+        
+        logging.warning(f"상세 내용을 가져오지 못한 게시글 {len(failed_urls)}개 - 다음 크롤링에서 다시 시도")
+        return [post if post['url'] not in failed_urls else stored_posts[post['url']]
+                for post in page_data if post['url'] not in failed_urls or post['url'] in stored_posts]
+
+    def _is_post_changed(self, post, known_post):
+        """
+        목록 페이지 정보로 게시글 변경 여부 확인 (조회수는 제외)
+        """
+        return any(post.get(field, '') != known_post.get(field, '') for field in ('title', 'date', 'attachments'))
+
+    def _get_known_posts(self):
+        """
+        저장된 게시글을 URL 기준으로 조회하는 딕셔너리 생성
+        """
+        with self.data_lock:
+            return {post['url']: post for post in self.existing_data if post.get('url')}
+
+    def crawl_all_urls(self, max_pages=2, use_threading=True, incremental=False):
         """
         모든 URL을 크롤링
         """
-        logging.info("다중 URL 크롤링 시작...")
+        logging.info(f"다중 URL 크롤링 시작... ({'증분' if incremental else '전체'} 모드)")
         start_time = time.time()
         all_data = []
+        known_posts = self._get_known_posts() if incremental else None
         
         if use_threading:
             # 병렬 처리로 크롤링
-            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            # 요청 속도는 호스트별로 제한되므로 워커 수와 관계없이 서버 부하가 일정함
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 # 각 URL에 대해 크롤링 작업 제출
                 future_to_url = {
-                    executor.submit(self.crawl_single_url, url, category, max_pages): (url, category)
+                    executor.submit(self.crawl_single_url, url, category, max_pages, known_posts): (url, category)
                     for url, category in self.target_urls.items()
                 }
                 
@@ -319,7 +429,7 @@ class MultiURLScheduledCrawler:
         else:
             # 순차 처리로 크롤링
             for url, category in self.target_urls.items():
-                url_data = self.crawl_single_url(url, category, max_pages)
+                url_data = self.crawl_single_url(url, category, max_pages, known_posts)
                 all_data.extend(url_data)
         
         end_time = time.time()
@@ -342,6 +452,21 @@ class MultiURLScheduledCrawler:
         
         return new_posts
 
+    def find_updated_posts(self, current_data):
+        """
+        목록 정보(제목, 날짜, 첨부)가 바뀐 기존 게시글 찾기
+        """
+        known_posts = self._get_known_posts()
+        
+        updated_posts = []
+        for post in current_data:
+            known_post = known_posts.get(post.get('url'))
+            if known_post and self._is_post_changed(post, known_post):
+                updated_posts.append(post)
+                logging.info(f"변경된 게시글 발견: [{post.get('category', 'Unknown')}] {post.get('title', 'N/A')[:50]}...")
+        
+        return updated_posts
+
     def crawl_new_posts(self):
         """
         새로운 게시글만 크롤링
@@ -349,19 +474,21 @@ class MultiURLScheduledCrawler:
         logging.info("새로운 게시글 확인 시작...")
         
         try:
-            # 모든 URL에서 최신 데이터 수집
-            current_data = self.crawl_all_urls(max_pages=self.max_pages, use_threading=True)
+            # 모든 URL에서 최신 데이터 수집 (증분 모드에서는 새/변경 게시글만 상세 조회)
+            current_data = self.crawl_all_urls(max_pages=self.max_pages, use_threading=True,
+                                               incremental=self.incremental_crawl)
             
-            # 새로운 게시글 찾기
-            new_posts = self.find_new_posts(current_data)
+            # 새로운 게시글 및 변경된 게시글 찾기
+            new_posts = compact_posts(self.find_new_posts(current_data))
+            updated_posts = compact_posts(self.find_updated_posts(current_data))
             
-            if new_posts:
-                # 새로운 데이터를 기존 데이터 앞에 추가
+            if new_posts or updated_posts:
                 with self.data_lock:
-                    self.existing_data = new_posts + self.existing_data
-                    self.save_data()
+                    # 저장에 성공한 뒤 변경된 게시글 교체 및 새로운 데이터를 기존 데이터 앞에 추가
+                    self.save_data(new_posts + updated_posts)
+                    self.existing_data = merge_posts(self.existing_data, new_posts + updated_posts)
                 
-                logging.info(f"새로운 게시글 {len(new_posts)}개 발견 및 저장 완료")
+                logging.info(f"새로운 게시글 {len(new_posts)}개, 변경된 게시글 {len(updated_posts)}개 저장 완료")
                 
                 # 알림 발송 (설정된 경우)
                 if self.config.get('notification', {}).get('enabled'):
@@ -376,16 +503,22 @@ class MultiURLScheduledCrawler:
             logging.error(f"크롤링 중 오류 발생: {e}")
             return []
 
-    def save_data(self):
+    def save_data(self, changed_posts=None):
         """
-        데이터를 JSON 파일로 저장
+        데이터 저장 (실패하면 예외 발생)
+        changed_posts가 주어지면 새/변경 게시글만 저장 (저널 모드에서는 저널에 한 줄 추가하고 fsync)
+        없으면 existing_data 전체를 data_file에 다시 씀
         """
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.existing_data, f, ensure_ascii=False, indent=2)
-            logging.info(f"데이터 저장 완료: {self.data_file}")
+            if changed_posts is not None:
+                self.storage.upsert(changed_posts)
+                logging.info(f"데이터 저장 완료: 새/변경 게시글 {len(changed_posts)}개")
+            else:
+                self.storage.replace_all(self.existing_data)
+                logging.info(f"데이터 저장 완료: {self.data_file}")
         except Exception as e:
             logging.error(f"데이터 저장 실패: {e}")
+            raise
 
     def send_notifications(self, new_posts):
         """
@@ -456,7 +589,7 @@ class MultiURLScheduledCrawler:
         else:
             print("새로운 게시글이 없습니다.")
         
-        # 주기적 실행 설정
+        # 주기적 실행 설정 (저널 압축은 저장소의 백그라운드 스레드가 실행)
         schedule.every(self.check_interval).minutes.do(self.crawl_new_posts)
         
         try:
@@ -467,6 +600,9 @@ class MultiURLScheduledCrawler:
             logging.info("사용자에 의해 스케줄러가 중단되었습니다.")
         except Exception as e:
             logging.error(f"스케줄러 오류: {e}")
+        finally:
+            # 저널 모드에서는 종료 전에 스냅샷 압축
+            self.storage.close()
 
     def run_once(self):
         """
@@ -480,7 +616,7 @@ class MultiURLScheduledCrawler:
         전체 크롤링 실행 (기존 데이터 무시)
         """
         logging.info("전체 크롤링 모드")
-        all_data = self.crawl_all_urls(max_pages=self.max_pages, use_threading=True)
+        all_data = compact_posts(self.crawl_all_urls(max_pages=self.max_pages, use_threading=True))
         
         with self.data_lock:
             self.existing_data = all_data
@@ -1,4 +1,4 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
@@ -30,6 +30,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],  # 다음 페이지 커서, 응답 캐시 검증자
 )
 
 # 크롤러 서비스 인스턴스
@@ -45,6 +46,16 @@ def cleanup_resources():
             crawler_service.stop_scheduler()
             print("✅ 스케줄러 중지 완료")
         
+        # 파싱 프로세스 풀 종료
+        if hasattr(crawler_service, 'parse_pool'):
+            crawler_service.parse_pool.shutdown()
+            print("✅ 파싱 프로세스 풀 종료 완료")
+        
+        # 게시글 저장소 정리
+        if hasattr(crawler_service, 'storage'):
+            crawler_service.storage.close()
+            print("✅ 저장소 정리 완료")
+        
         # Firebase 연결 정리
         if hasattr(crawler_service, 'firebase_service'):
             crawler_service.firebase_service.cleanup()
@@ -81,16 +92,44 @@ async def health_check():
     """헬스 체크 엔드포인트"""
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
+async def _cached_response(request: Request, build):
+    """조회 응답을 데이터 세대별로 캐시하여 직렬화된 JSON과 ETag로 응답
+
+    build()는 (JSON으로 변환할 값, 추가 응답 헤더)를 반환하며, 응답은 response_model로 다시 검증하지 않는다.
+    If-None-Match가 ETag와 같으면 본문 없이 304로 응답한다.
+    """
+    cache = crawler_service.response_cache
+    key = (request.url.path, tuple(sorted(request.query_params.multi_items())), cache.generation)
+    entry = cache.get(key)
+    if entry is None:
+        content, headers = await build()
+        entry = cache.put(key, cache.serialize(content, headers))
+    
+    headers = {"ETag": entry['etag'], "Cache-Control": "no-cache", **entry['headers']}
+    if cache.matches(request.headers.get("if-none-match"), entry['etag']):
+        cache.record_not_modified()
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry['body'], media_type="application/json", headers=headers)
+
 @app.get("/notices", response_model=List[NoticeResponse])
 async def get_notices(
+    request: Request,
     category: Optional[str] = None,
     limit: Optional[int] = None,
-    offset: Optional[int] = 0
+    offset: Optional[int] = 0,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
 ):
-    """공지사항 목록 조회"""
+    """공지사항 목록 조회 (cursor: 이전 응답의 X-Next-Cursor, fields: 'summary' 또는 쉼표로 구분한 필드)"""
+    async def build():
+        notices, next_cursor = await crawler_service.get_notice_page(category, limit, offset, cursor, fields)
+        # 다음 페이지 커서는 X-Next-Cursor 헤더로 전달
+        return notices, {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    
     try:
-        notices = await crawler_service.get_notices(category, limit, offset)
-        return notices
+        return await _cached_response(request, build)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -106,27 +145,37 @@ async def get_notice(notice_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/categories", response_model=List[str])
-async def get_categories():
+async def get_categories(request: Request):
     """카테고리 목록 조회"""
+    async def build():
+        return await crawler_service.get_categories(), {}
+    
     try:
-        categories = await crawler_service.get_categories()
-        return categories
+        return await _cached_response(request, build)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/summary", response_model=List[CategorySummary])
-async def get_summary():
+async def get_summary(request: Request):
     """카테고리별 요약 정보 조회"""
+    async def build():
+        return await crawler_service.get_summary(), {}
+    
     try:
-        summary = await crawler_service.get_summary()
-        return summary
+        return await _cached_response(request, build)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _ensure_not_crawling():
+    """크롤링이 실행 중이면 409 응답"""
+    if crawler_service.is_crawling():
+        raise HTTPException(status_code=409, detail="이미 크롤링이 실행 중입니다")
+
 @app.post("/crawl", response_model=CrawlStatus)
 async def start_crawl(background_tasks: BackgroundTasks):
     """크롤링 실행 (백그라운드)"""
     try:
+        _ensure_not_crawling()
         # 백그라운드에서 크롤링 실행
         background_tasks.add_task(crawler_service.crawl_new_posts)
         
@@ -135,6 +184,8 @@ async def start_crawl(background_tasks: BackgroundTasks):
             message="크롤링이 시작되었습니다",
             timestamp=datetime.now().isoformat()
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -142,6 +193,7 @@ async def start_crawl(background_tasks: BackgroundTasks):
 async def start_full_crawl(background_tasks: BackgroundTasks):
     """전체 크롤링 실행 (백그라운드)"""
     try:
+        _ensure_not_crawling()
         # 백그라운드에서 전체 크롤링 실행
         background_tasks.add_task(crawler_service.crawl_all_posts)
         
@@ -150,6 +202,8 @@ async def start_full_crawl(background_tasks: BackgroundTasks):
             message="전체 크롤링이 시작되었습니다",
             timestamp=datetime.now().isoformat()
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -164,27 +218,43 @@ async def get_crawl_status():
 
 @app.get("/search")
 async def search_notices(
+    request: Request,
     query: str,
     category: Optional[str] = None,
-    limit: Optional[int] = 20
+    limit: Optional[int] = 20,
+    offset: int = 0
 ):
-    """공지사항 검색"""
-    try:
-        results = await crawler_service.search_notices(query, category, limit)
+    """공지사항 검색 (점수순)"""
+    async def build():
+        total, results = await crawler_service.search_notices_page(query, category, limit, offset)
         return {
             "query": query,
             "results": results,
-            "total": len(results)
-        }
+            "total": total,
+            "offset": offset
+        }, {}
+    
+    try:
+        return await _cached_response(request, build)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/latest")
-async def get_latest_notices(limit: int = 10):
-    """최신 공지사항 조회"""
+async def get_latest_notices(
+    request: Request,
+    limit: int = Query(10, ge=1),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
+):
+    """최신 공지사항 조회 (cursor, fields는 /notices와 동일)"""
+    async def build():
+        notices, next_cursor = await crawler_service.get_notice_page(limit=limit, cursor=cursor, fields=fields)
+        return notices, {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    
     try:
-        notices = await crawler_service.get_latest_notices(limit)
-        return notices
+        return await _cached_response(request, build)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -236,11 +306,14 @@ async def update_crawl_interval(minutes: int):
 async def run_crawl_now():
     """즉시 크롤링 실행"""
     try:
+        _ensure_not_crawling()
         success = crawler_service.run_crawl_now()
         if success:
             return {"message": "크롤링이 즉시 실행되었습니다", "timestamp": datetime.now().isoformat()}
         else:
             raise HTTPException(status_code=500, detail="크롤링 실행 실패")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -254,10 +327,10 @@ async def get_firebase_stats():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/firebase/sync")
-async def sync_to_firebase():
-    """로컬 데이터를 Firebase에 동기화"""
+async def sync_to_firebase(force: bool = False):
+    """로컬 데이터 중 새/변경 게시글을 Firebase에 동기화 (force=true: 전체 다시 저장)"""
     try:
-        result = await crawler_service.sync_to_firebase()
+        result = await crawler_service.sync_to_firebase(force)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+게시글 레코드 메모리 벤치마크
+
+합성 공지사항 N개(기본 100,000개)를 JSON 파일에서 읽은 것처럼 만들고 (JSON 문자열 → json.loads),
+기존 dict 레코드와 NoticeRecord(__slots__ + 반복 문자열 intern)의 메모리 사용량을 tracemalloc으로 비교합니다.
+실제 저장소와 같은 경로로 읽은 경우(SQLite 저장소의 load_all)도 함께 측정합니다.
+NoticeIndex(검색 색인 포함)까지 만든 상태와 목록 응답 변환 시간도 함께 측정합니다.
+
+사용법:
+    python benchmark_memory.py [게시글 수]
+    python benchmark_memory.py 100000
+"""
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmark_responses import make_posts
+from notice_index import NoticeIndex
+from notice_record import compact_posts
+from models import NoticeResponse
+from storage import SqliteNoticeStorage
+
+AUTHORS = ['컴퓨터인공지능학부', '학사관리과', '취업지원과', '대학원행정실']
+
+
+def make_json(count):
+    """저장 파일과 같은 형태의 JSON 문자열 (content_html은 블롭 저장소 참조로 대체되어 빈 문자열)"""
+    posts = make_posts(count)
+    for i, post in enumerate(posts):
+        post.update({'author': AUTHORS[i % len(AUTHORS)], 'attachments': str(i % 3),
+                     'crawled_at': f"2025-09-{i % 28 + 1:02d} 16:14:31", 'content_ref': f"{i:064x}",
+                     'content': post['content'][:200], 'content_html': ''})
+    return json.dumps(posts, ensure_ascii=False)
+
+
+def make_sqlite(raw, db_file):
+    """같은 게시글을 저장한 SQLite 저장소"""
+    storage = SqliteNoticeStorage(db_file)
+    storage.replace_all(json.loads(raw))
+    return storage
+
+
+def measure_memory(build):
+    """build() 결과가 차지하는 메모리 (MB)"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current / 1024 / 1024
+
+
+def measure_time(func, repeat=5):
+    """반복 실행 시간 최솟값 (ms)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def to_response_dicts(posts):
+    """CrawlerService._to_response_dict와 같은 변환"""
+    fields = NoticeResponse.model_fields
+    return [{field: post.get(field, [] if field == 'image_urls' else '') for field in fields} for post in posts]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    raw = make_json(count)
+    print(f"공지사항 {count:,}개 (JSON {len(raw.encode('utf-8')) / 1024 / 1024:.0f}MB)\n")
+    print(f"{'레코드':<14}{'레코드(MB)':>12}{'+ 인덱스(MB)':>14}{'레코드당(B)':>13}{'응답 변환(ms)':>15}")
+
+    db_file = os.path.join(tempfile.mkdtemp(), 'notices.db')
+    storage = make_sqlite(raw, db_file)
+    
+    for name, load in [('dict', lambda: json.loads(raw)),
+                       ('NoticeRecord', lambda: compact_posts(json.loads(raw))),
+                       ('SQLite', storage.load_all)]:
+        posts, records_mb = measure_memory(load)
+        _, index_mb = measure_memory(lambda: NoticeIndex(posts))
+        page = posts[:10000]
+        convert_ms = measure_time(lambda: to_response_dicts(page))
+        print(f"{name:<14}{records_mb:>12.1f}{records_mb + index_mb:>14.1f}"
+              f"{records_mb * 1024 * 1024 / count:>13.0f}{convert_ms:>15.1f}")
+        del posts, page
+        gc.collect()
+    storage.close()
+    os.remove(db_file)
+    print("\nSQLite: SQLite 저장소의 load_all()로 읽은 NoticeRecord")
+    print("응답 변환: 게시글 10,000개를 목록 응답 dict로 변환하는 시간")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+HTML 파서 백엔드 벤치마크
+
+저장된 공지사항 데이터의 content_html을 각 파서 백엔드로 파싱(크롤러의 상세 페이지 본문 추출)하여 속도를 비교합니다.
+(BeautifulSoup: html.parser / lxml / html5lib, 설치되어 있으면 selectolax)
+
+사용법:
+    python benchmark_parsers.py [데이터 파일] [반복 횟수]
+    python benchmark_parsers.py ../multi_notices_data.json 5
+"""
+import json
+import logging
+import os
+import sys
+import time
+
+from bs4.builder import builder_registry
+
+from notice_parser import NoticeParser, SelectolaxParser
+
+DEFAULT_DATA_FILES = ['notices_data.json', os.path.join('..', 'multi_notices_data.json')]
+DEFAULT_URL = 'https://csai.jbnu.ac.kr/'
+
+
+def load_html_samples(data_file):
+    """데이터 파일에서 (URL, content_html) 목록 로드"""
+    with open(data_file, 'r', encoding='utf-8') as f:
+        notices = json.load(f)
+    return [(notice.get('url') or DEFAULT_URL, notice['content_html'])
+            for notice in notices if notice.get('content_html')]
+
+
+def get_backends():
+    """사용 가능한 파서 백엔드 목록 (크롤러와 같은 사이트별 본문 추출 사용)"""
+    logging.disable(logging.WARNING)
+    backends = {}
+    for name in ('html.parser', 'lxml', 'html5lib'):
+        if builder_registry.lookup(name) is not None:
+            backends[f"bs4/{name}"] = NoticeParser(html_parser=name)
+    if SelectolaxParser is not None:
+        backends['selectolax'] = NoticeParser(html_parser='selectolax')
+    logging.disable(logging.NOTSET)
+    return backends
+
+
+def run_benchmark(samples, repeat):
+    """백엔드별 파싱 시간 측정"""
+    total_bytes = sum(len(html.encode('utf-8')) for _, html in samples)
+    print(f"샘플 {len(samples)}개, 평균 {total_bytes / len(samples) / 1024:.1f} KB, 반복 {repeat}회\n")
+    print(f"{'백엔드':<18}{'총 시간(초)':>12}{'문서당(ms)':>12}{'MB/s':>10}{'상대 속도':>10}")
+
+    results = {}
+    for name, parser in get_backends().items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for url, html in samples:
+                parser.parse_post_content(html, url)
+        results[name] = time.perf_counter() - start
+
+    baseline = results.get('bs4/html.parser') or max(results.values())
+    for name, elapsed in results.items():
+        per_doc_ms = elapsed / (len(samples) * repeat) * 1000
+        throughput = total_bytes * repeat / elapsed / (1024 * 1024)
+        print(f"{name:<18}{elapsed:>12.3f}{per_doc_ms:>12.2f}{throughput:>10.1f}{baseline / elapsed:>9.1f}x")
+
+
+def main():
+    data_file = sys.argv[1] if len(sys.argv) > 1 else next((f for f in DEFAULT_DATA_FILES if os.path.exists(f)), None)
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    if not data_file or not os.path.exists(data_file):
+        print("❌ 데이터 파일을 찾을 수 없습니다")
+        print(__doc__)
+        sys.exit(1)
+
+    samples = load_html_samples(data_file)
+    if not samples:
+        print(f"❌ {data_file}에 content_html이 있는 게시글이 없습니다")
+        sys.exit(1)
+
+    print(f"📄 {data_file}")
+    run_benchmark(samples, repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+목록 응답 직렬화 벤치마크
+
+합성 공지사항 N개(기본 10,000개)의 목록 응답을 만드는 시간을 비교합니다.
+- 기존 방식: 게시글마다 NoticeResponse(**post) 생성 → FastAPI response_model 처리
+  (model_dump 후 List[NoticeResponse]로 다시 검증하고 직렬화) → json.dumps
+- 현재 방식: 크롤링 시 한 번 검증한 게시글을 dict로 변환 → ResponseCache.serialize (orjson, 없으면 json)
+
+사용법:
+    python benchmark_responses.py [게시글 수] [반복 횟수]
+    python benchmark_responses.py 10000 5
+"""
+import json
+import statistics
+import sys
+import time
+from typing import List
+
+from pydantic import TypeAdapter
+
+import response_cache
+from benchmark_search import make_notices
+from models import NoticeResponse
+from response_cache import ResponseCache
+
+RESPONSE_FIELDS = list(NoticeResponse.model_fields)
+
+
+def to_response_dict(post):
+    """CrawlerService._to_response_dict와 같은 변환"""
+    return {field: post.get(field, [] if field == 'image_urls' else '') for field in RESPONSE_FIELDS}
+
+
+def make_posts(count):
+    """합성 공지사항에 NoticeResponse 필드 채우기"""
+    posts = make_notices(count)
+    for i, post in enumerate(posts):
+        post.update({'number': str(count - i), 'author': '관리자', 'attachments': '', 'views': str(i % 1000),
+                     'content_ref': '', 'image_urls': [], 'crawled_at': '2025-01-01T00:00:00'})
+    return posts
+
+
+def legacy_response(posts, adapter):
+    """기존 방식 - 모델 생성(검증) → response_model 재검증/직렬화 → json.dumps"""
+    notices = [NoticeResponse(**post) for post in posts]
+    content = [notice.model_dump() for notice in notices]
+    validated = adapter.validate_python(content)
+    return json.dumps(adapter.dump_python(validated, mode='json'), ensure_ascii=False, allow_nan=False,
+                      indent=None, separators=(',', ':')).encode('utf-8')
+
+
+def fast_response(posts):
+    """현재 방식 - 검증 없이 dict 변환 후 직렬화"""
+    return ResponseCache.serialize([to_response_dict(post) for post in posts])['body']
+
+
+def measure(func, repeat):
+    """반복 실행 시간 중앙값 (ms)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(timings)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    posts = make_posts(count)
+    adapter = TypeAdapter(List[NoticeResponse])
+    print(f"공지사항 {count:,}개, 반복 {repeat}회 (orjson {'사용' if response_cache.orjson else '없음 - json 사용'})\n")
+
+    legacy_body, legacy_ms = measure(lambda: legacy_response(posts, adapter), repeat)
+    fast_body, fast_ms = measure(lambda: fast_response(posts), repeat)
+    _, construct_ms = measure(lambda: [NoticeResponse.model_construct(**to_response_dict(post)) for post in posts], repeat)
+    assert json.loads(legacy_body) == json.loads(fast_body), "응답 본문이 다릅니다"
+
+    print(f"{'방식':<36}{'요청당(ms)':>12}{'게시글당(µs)':>14}")
+    for name, elapsed in [('NoticeResponse(**post) + response_model', legacy_ms),
+                          ('dict + ResponseCache.serialize', fast_ms),
+                          ('model_construct (서비스 메서드)', construct_ms)]:
+        print(f"{name:<36}{elapsed:>12.2f}{elapsed / count * 1000:>14.2f}")
+    print(f"\n응답 본문 {len(fast_body) / 1024:.0f} KB, 기존 대비 {legacy_ms / fast_ms:.1f}배 빠름")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+검색 역색인 벤치마크
+
+합성 공지사항 N개로 NoticeIndex(bi-gram 역색인 포함)를 만들고,
+검색어별 응답 시간을 기존 방식(모든 게시글의 제목/본문 부분 문자열 검색 후 정렬)과 비교합니다.
+합성 게시글은 음절을 조합한 단어 사전에서 Zipf 분포(빈도 ∝ 1/순위)로 단어를 뽑아 만들며,
+공지사항에 자주 나오는 단어를 여러 빈도 순위에 섞어 두어 흔한/드문 검색어를 함께 측정합니다.
+
+사용법:
+    python benchmark_search.py [게시글 수 ...]
+    python benchmark_search.py 10000 100000
+"""
+import itertools
+import random
+import statistics
+import sys
+import time
+
+from notice_index import NoticeIndex
+
+CATEGORIES = ['학과소식', '일반공지', '학사공지', '사업단공지', '취업정보']
+SYLLABLES = '가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후기니디리미비시이지치키티피히'
+VOCABULARY_SIZE = 5000
+DOMAIN_WORDS = [
+    '장학금', '신청', '안내', '모집', '학생', '수강', '졸업', '논문', '심사', '일정', '프로그램', '참가자',
+    '인공지능', '소프트웨어', '컴퓨터', '공학', '세미나', '특강', '채용', '인턴십', '설명회', '계절학기',
+    '등록금', '납부', '기간', '변경', '공모전', '해커톤', '연구실', '대학원', '교환학생', '튜터링',
+    '멘토링', '비교과', '캡스톤', '디자인', '경진대회', '결과', '발표', '제출', '서류', '마감',
+    'AI', 'SW', 'Python', 'GPU', 'LINC', 'K-MOOC'
+]
+QUERIES = ['안내', '장학금', '수강 신청', '인공지능 세미나', '캡스톤 디자인 경진대회', 'k-mooc', '없는검색어']
+SEARCH_LIMIT = 20
+
+
+def make_vocabulary(rng):
+    """빈도 순위순 단어 사전 (DOMAIN_WORDS는 i번째 단어를 순위 i * 50 + 1에 배치)"""
+    words = set(DOMAIN_WORDS)
+    vocabulary = []
+    while len(vocabulary) < VOCABULARY_SIZE - len(DOMAIN_WORDS):
+        word = ''.join(rng.choices(SYLLABLES, k=rng.randint(2, 4)))
+        if word not in words:
+            words.add(word)
+            vocabulary.append(word)
+    for i, word in enumerate(DOMAIN_WORDS):
+        vocabulary.insert(i * 50 + 1, word)
+    return vocabulary
+
+
+def make_notices(count, seed=0):
+    """합성 공지사항 생성 (제목 6단어, 본문 80단어)"""
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(rng)
+    cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+    notices = []
+    for i in range(count):
+        notices.append({
+            'id': f"notice_{i}",
+            'category': rng.choice(CATEGORIES),
+            'title': ' '.join(rng.choices(vocabulary, cum_weights=cum_weights, k=6)),
+            'date': f"20{rng.randint(20, 25)}.{rng.randint(1, 12):02d}.{rng.randint(1, 28):02d}",
+            'url': f"https://example.com/notice/{i}",
+            'content': ' '.join(rng.choices(vocabulary, cum_weights=cum_weights, k=80)),
+        })
+    return notices
+
+
+def scan_search(notices, query, category=None, limit=SEARCH_LIMIT):
+    """기존 방식 - 부분 문자열 검색 후 날짜순 정렬"""
+    query_lower = query.lower()
+    results = [post for post in notices
+               if (not category or post['category'] == category)
+               and (query_lower in post['title'].lower() or query_lower in post['content'].lower())]
+    return sorted(results, key=lambda x: x.get('date', ''), reverse=True)[:limit]
+
+
+def measure(func, repeat):
+    """반복 실행 시간 (ms) 중앙값과 최댓값"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(timings), max(timings)
+
+
+def run_benchmark(count):
+    notices = make_notices(count)
+    start = time.perf_counter()
+    index = NoticeIndex(notices)
+    build_seconds = time.perf_counter() - start
+    stats = index.search_index.get_stats()
+    print(f"\n게시글 {count:,}개 - 색인 생성 {build_seconds:.2f}초, bi-gram {stats['tokens']:,}개, 포스팅 {stats['postings']:,}개")
+    print(f"{'검색어':<24}{'카테고리':<10}{'결과 수':>9}{'색인(ms)':>11}{'최대':>9}{'스캔(ms)':>11}{'배율':>8}")
+
+    repeat = 20 if count <= 10000 else 5
+    for query in QUERIES:
+        for category in (None, '학사공지'):
+            (total, _), index_ms, index_max_ms = measure(lambda: index.search(query, category, 0, SEARCH_LIMIT), repeat)
+            _, scan_ms, _ = measure(lambda: scan_search(notices, query, category), max(repeat // 5, 1))
+            print(f"{query:<24}{category or '-':<10}{total:>9,}{index_ms:>11.2f}{index_max_ms:>9.2f}"
+                  f"{scan_ms:>11.2f}{scan_ms / index_ms:>7.1f}x")
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [10000, 100000]
+    for count in counts:
+        run_benchmark(count)
+
+
+if __name__ == "__main__":
+    main()
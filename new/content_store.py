@@ -0,0 +1,109 @@
+import gzip
+import hashlib
+import logging
+import os
+import threading
+from typing import Iterable
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 압축 방식별 블롭 파일 확장자
+BLOB_SUFFIXES = {'zstd': '.zst', 'gzip': '.gz'}
+
+
+class ContentBlobStore:
+    """상세 페이지 HTML(content_html)을 내용 해시로 저장하는 압축 블롭 저장소
+
+    게시글 레코드에는 HTML의 sha256 해시(content_ref)만 남기고, 본문은
+    directory/<해시 앞 2자리>/<해시>.zst(.gz) 파일로 한 번만 저장한다.
+    같은 HTML은 같은 파일을 가리키므로 다시 쓰지 않는다.
+    zstandard가 설치되어 있지 않으면 gzip으로 압축하며, 읽을 때는 두 형식 모두 찾는다.
+    """
+
+    def __init__(self, directory: str, compression: str = 'zstd'):
+        self.directory = directory
+        if compression == 'zstd' and zstandard is None:
+            logging.warning("zstandard가 설치되어 있지 않아 본문을 gzip으로 압축합니다.")
+            compression = 'gzip'
+        if compression not in BLOB_SUFFIXES:
+            logging.warning(f"알 수 없는 압축 방식 '{compression}' - gzip을 사용합니다.")
+            compression = 'gzip'
+        self.compression = compression
+        self.stats = {'writes': 0, 'dedup_hits': 0, 'reads': 0, 'missing': 0, 'bytes_written': 0}
+        os.makedirs(directory, exist_ok=True)
+
+    def _get_path(self, key: str, compression: str) -> str:
+        """블롭 파일 경로"""
+        return os.path.join(self.directory, key[:2], key + BLOB_SUFFIXES[compression])
+
+    def _find_path(self, key: str):
+        """저장된 블롭 파일 경로 반환 (없으면 None)"""
+        for compression in (self.compression, *(c for c in BLOB_SUFFIXES if c != self.compression)):
+            path = self._get_path(key, compression)
+            if os.path.exists(path):
+                return path, compression
+        return None, None
+
+    def put(self, html: str) -> str:
+        """HTML을 저장하고 참조 키(sha256) 반환 (빈 본문은 빈 키)"""
+        if not html:
+            return ''
+        data = html.encode('utf-8')
+        key = hashlib.sha256(data).hexdigest()
+        if self._find_path(key)[0]:
+            self.stats['dedup_hits'] += 1
+            return key
+
+        path = self._get_path(key, self.compression)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        compressed = zstandard.ZstdCompressor().compress(data) if self.compression == 'zstd' else gzip.compress(data)
+        # 동시에 같은 본문을 저장해도 완성된 파일만 보이도록 임시 파일에 쓰고 교체
+        temp_file = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_file, 'wb') as f:
+            f.write(compressed)
+        os.replace(temp_file, path)
+        self.stats['writes'] += 1
+        self.stats['bytes_written'] += len(compressed)
+        return key
+
+    def get(self, key: str) -> str:
+        """참조 키로 HTML 로드 (없으면 빈 문자열)"""
+        if not key:
+            return ''
+        path, compression = self._find_path(key)
+        if path is None:
+            self.stats['missing'] += 1
+            logging.warning(f"본문 블롭을 찾을 수 없습니다: {key}")
+            return ''
+        with open(path, 'rb') as f:
+            data = f.read()
+        if compression == 'zstd':
+            if zstandard is None:
+                logging.error(f"zstandard가 설치되어 있지 않아 본문을 읽을 수 없습니다: {path}")
+                return ''
+            data = zstandard.ZstdDecompressor().decompress(data)
+        else:
+            data = gzip.decompress(data)
+        self.stats['reads'] += 1
+        return data.decode('utf-8')
+
+    def prune(self, keep_keys: Iterable[str]) -> int:
+        """참조되지 않는 블롭 삭제 후 삭제한 개수 반환"""
+        keep_keys = set(keep_keys)
+        removed = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                key = name.split('.', 1)[0]
+                if key not in keep_keys:
+                    os.remove(os.path.join(root, name))
+                    removed += 1
+        if removed:
+            logging.info(f"참조되지 않는 본문 블롭 {removed}개 삭제")
+        return removed
+
+    def get_stats(self) -> dict:
+        """블롭 저장/읽기 통계 반환"""
+        return {**self.stats, 'compression': self.compression}
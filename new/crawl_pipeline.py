@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+# 큐에 넣어 다음 단계에 입력이 끝났음을 알리는 값
+_DONE = object()
+
+# 단계 이름 (목록 → 상세 → 저장)
+STAGES = ('list', 'detail', 'persist')
+
+
+class CrawlPipeline:
+    """목록 페이지 → 상세 페이지 → 저장 단계로 이어지는 크롤링 파이프라인
+
+    목록 단계(produce)가 게시판별로 페이지를 가져와 파싱한 게시글 목록을 emit하면,
+    상세 단계 작업자들이 상세 내용을 채우고(enrich), 저장 단계가 모인 게시글을 묶어 persist한다.
+    단계 사이의 큐는 크기가 제한되어 있어 다음 단계가 밀리면 앞 단계가 기다리므로
+    max_pages와 관계없이 처리 중인 페이지 수가 queue_size 이내로 유지된다.
+    """
+
+    def __init__(self, produce: Callable[[Callable[..., Awaitable[None]]], Awaitable[None]],
+                 enrich: Callable[[List[dict]], Awaitable[List[dict]]],
+                 persist: Callable[[List[dict]], Awaitable[None]],
+                 queue_size: int = 8, detail_workers: int = 4):
+        self.produce = produce
+        self.enrich = enrich
+        self.persist = persist
+        self.detail_workers = max(1, detail_workers)
+        self.detail_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+        self.persist_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.stats: Dict[str, Dict[str, float]] = {
+            stage: {'pages': 0, 'posts': 0, 'busy_seconds': 0.0, 'errors': 0, 'max_queue_depth': 0}
+            for stage in STAGES
+        }
+
+    def _record(self, stage: str, page_data: List[dict], started_at: float, pages: int = 1):
+        """단계별 처리량 기록"""
+        stats = self.stats[stage]
+        stats['pages'] += pages
+        stats['posts'] += len(page_data)
+        stats['busy_seconds'] += time.monotonic() - started_at
+
+    async def _put(self, queue: asyncio.Queue, stage: str, item):
+        """다음 단계 큐에 넣기 (가득 차 있으면 대기)"""
+        await queue.put(item)
+        stats = self.stats[stage]
+        stats['max_queue_depth'] = max(stats['max_queue_depth'], queue.qsize())
+
+    async def _emit(self, page_data: List[dict], started_at: Optional[float] = None):
+        """목록 단계에서 파싱한 페이지를 상세 단계로 전달 (started_at: 페이지 요청 시작 시각)"""
+        self._record('list', page_data, started_at or time.monotonic())
+        await self._put(self.detail_queue, 'detail', page_data)
+
+    async def _run_detail_worker(self):
+        """상세 단계 작업자"""
+        while True:
+            page_data = await self.detail_queue.get()
+            if page_data is _DONE:
+                return
+            started_at = time.monotonic()
+            try:
+                page_data = await self.enrich(page_data)
+            except Exception as e:
+                # 상세 내용이 없는 게시글은 저장하지 않음
+                self.stats['detail']['errors'] += 1
+                logging.error(f"상세 내용 단계 오류 - 게시글 {len(page_data)}개 저장 생략: {e}")
+                continue
+            self._record('detail', page_data, started_at)
+            await self._put(self.persist_queue, 'persist', page_data)
+
+    async def _run_persist_worker(self):
+        """저장 단계 - 대기 중인 페이지를 모두 묶어 한 번에 저장"""
+        done = False
+        while not done:
+            pages = [await self.persist_queue.get()]
+            while not self.persist_queue.empty():
+                pages.append(self.persist_queue.get_nowait())
+            done = _DONE in pages
+            batch = [post for page_data in pages if page_data is not _DONE for post in page_data]
+            if not batch:
+                continue
+            started_at = time.monotonic()
+            await self.persist(batch)
+            self._record('persist', batch, started_at, pages=len(pages) - done)
+
+    async def run(self):
+        """파이프라인 실행 (저장 단계 오류는 호출자에게 전달)"""
+        self.started_at = time.monotonic()
+        persist_task = asyncio.create_task(self._run_persist_worker())
+        detail_tasks = [asyncio.create_task(self._run_detail_worker()) for _ in range(self.detail_workers)]
+        producer = asyncio.create_task(self._produce_all(detail_tasks))
+        try:
+            # 저장 단계가 실패하면 목록/상세 단계가 큐에서 영원히 기다리지 않도록 함께 감시
+            done, _ = await asyncio.wait({producer, persist_task}, return_when=asyncio.FIRST_EXCEPTION)
+            if persist_task in done and persist_task.exception():
+                raise persist_task.exception()
+            await producer
+            await persist_task
+        finally:
+            for task in [producer, *detail_tasks, persist_task]:
+                task.cancel()
+            self.finished_at = time.monotonic()
+
+    async def _produce_all(self, detail_tasks):
+        """목록 단계 실행 후 상세/저장 단계에 종료 알림"""
+        try:
+            await self.produce(self._emit)
+        except Exception as e:
+            self.stats['list']['errors'] += 1
+            logging.error(f"목록 단계 오류: {e}")
+        for _ in detail_tasks:
+            await self.detail_queue.put(_DONE)
+        await asyncio.gather(*detail_tasks)
+        await self.persist_queue.put(_DONE)
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """단계별 처리량과 큐 길이 반환 (실행 중에도 조회 가능)"""
+        elapsed = ((self.finished_at or time.monotonic()) - self.started_at) if self.started_at else 0
+        queue_depths = {'list': 0, 'detail': self.detail_queue.qsize(), 'persist': self.persist_queue.qsize()}
+        return {
+            stage: {
+                **stats,
+                'busy_seconds': round(stats['busy_seconds'], 2),
+                'posts_per_second': round(stats['posts'] / elapsed, 2) if elapsed else 0.0,
+                'queue_depth': queue_depths[stage]
+            }
+            for stage, stats in self.stats.items()
+        }
@@ -1,20 +1,31 @@
+import asyncio
+import hashlib
 import json
 import os
 import time
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import logging
 from threading import Lock
-import concurrent.futures
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
-import re
 from dotenv import load_dotenv
+import httpx
+from pydantic import ValidationError
 import urllib3
 
-from models import NoticeResponse, CrawlStatus, CategorySummary
+from models import NoticeResponse, NoticeSummary, CrawlStatus, CategorySummary
+from http_client import AsyncHttpClient, DEFAULT_USER_AGENT
+from http_cache import ValidatorCache
+from response_cache import ResponseCache
+from rate_limiter import HostRateLimiter
+from notice_parser import NoticeParser
+from parse_pool import ParsePool
+from crawl_pipeline import CrawlPipeline
+from storage import create_storage, unique_posts
+from content_store import ContentBlobStore
+from notice_index import NoticeIndex, decode_cursor
+from notice_record import compact_posts
 from firebase_service import FirebaseService
+from sync_ledger import SyncLedger
 from scheduler_service import SchedulerService
 
 # SSL 경고 비활성화
@@ -31,10 +42,40 @@ class CrawlerService:
         self.config = self.load_config(config_file)
         self.base_url = self.config.get('base_url', 'https://csai.jbnu.ac.kr')
         self.data_file = self.config.get('data_file', 'notices_data.json')
+        self.storage_backend = self.config.get('storage', 'sqlite')
+        self.storage_file = self.config.get('storage_file') or f"{os.path.splitext(self.data_file)[0]}.db"
+        self.journal_file = self.config.get('journal_file') or f"{os.path.splitext(self.data_file)[0]}.journal.jsonl"
+        self.journal_compact_minutes = self.config.get('journal_compact_minutes', 10)
+        self.content_store_dir = self.config.get('content_store_dir') or f"{os.path.splitext(self.data_file)[0]}_content"
         self.max_pages = self.config.get('max_pages', 3)
+        self.parser = NoticeParser(self.base_url, self.max_pages, self.config.get('html_parser', 'selectolax'))
+        self.incremental_crawl = self.config.get('incremental_crawl', True)
+        self.stop_at_watermark = self.config.get('stop_at_watermark', True)
+        self.watermark_known_rows = self.config.get('watermark_known_rows', 5)
+        self.watermark_file = self.config.get('watermark_file') or f"{os.path.splitext(self.data_file)[0]}_watermarks.json"
+        self.http_cache_enabled = self.config.get('http_cache_enabled', True)
+        self.http_cache_file = self.config.get('http_cache_file') or f"{os.path.splitext(self.data_file)[0]}_http_cache.json"
+        self.firebase_ledger_file = self.config.get('firebase_ledger_file') or f"{os.path.splitext(self.data_file)[0]}_firebase_ledger.jsonl"
+        self.crawling_settings = {**self._get_default_config()['crawling_settings'], **self.config.get('crawling_settings', {})}
+        
+        # 호스트별 요청 속도 제한 (크롤링 실행 간에 공유하여 조정된 속도 유지)
+        self.rate_limiter = HostRateLimiter(
+            requests_per_second=self.crawling_settings['requests_per_second'],
+            burst=self.crawling_settings['burst'],
+            adaptive=self.crawling_settings['adaptive_rate_limit'],
+            min_requests_per_second=self.crawling_settings['min_requests_per_second'],
+            slow_response_seconds=self.crawling_settings['slow_response_seconds'],
+            host_overrides=self.crawling_settings['host_requests_per_second']
+        )
+        
         self.data_lock = Lock()
+        # 크롤링은 한 번에 하나만 실행 (스케줄러 스레드와 API가 각자의 이벤트 루프에서 실행하므로 스레드 락 사용)
+        self.crawl_lock = Lock()
         self.crawl_status = "idle"
         self.last_crawl_time = None
+        self.http_stats = {}
+        self.last_crawl_stats = {}
+        self.crawl_pipeline = None
         
         # 크롤링할 URL들과 카테고리 정보
         self.target_urls = self.config.get('target_urls', {
@@ -45,12 +86,41 @@ class CrawlerService:
             'https://csai.jbnu.ac.kr/csai/29108/subview.do': '취업정보'
         })
         
-        # 기존 데이터 로드
+        # HTML 파싱 단계 (CPU 작업을 프로세스 풀에서 실행, 게시판마다 목록 페이지를 동시에 파싱)
+        self.parse_pool = ParsePool(self.parser, self.crawling_settings['parse_workers'], len(self.target_urls))
+        
+        # 상세 페이지 HTML 블롭 저장소 (게시글에는 content_ref만 보관)
+        self.content_store = ContentBlobStore(self.content_store_dir, self.config.get('content_compression', 'zstd'))
+        
+        # 게시글 저장소 (sqlite/journal: 새/변경 게시글만 저장, json: 파일 전체 저장)
+        self.storage = create_storage(self.storage_backend, self.data_file, self.storage_file,
+                                      self.journal_file, self.journal_compact_minutes * 60)
+        
+        # 기존 데이터 및 카테고리별 워터마크 로드
         self.existing_data = self.load_existing_data()
+        self.notice_index = NoticeIndex(self.existing_data)
+        self.watermarks = self.load_watermarks()
+        self.pending_watermarks = {}
+        
+        # 조건부 요청(ETag/Last-Modified) 캐시
+        self.http_cache = ValidatorCache(self.http_cache_file) if self.http_cache_enabled else None
+        
+        # 조회 API 응답 캐시 (크롤링 결과가 반영될 때마다 세대를 올려 무효화)
+        self.response_cache = ResponseCache(self.config.get('response_cache_entries', 256))
+        
+        # (게시판, 페이지)별 마지막 목록 페이지 본문 해시와 파싱 결과
+        self.page_digests = {}
+        self.pending_page_digests = {}
+        
+        # 이번 크롤링에서 상세 내용을 가져오지 못한 게시글 URL (저장하지 않고 다음 크롤링에서 다시 시도)
+        self.pending_failed_urls = set()
         
         # Firebase 서비스 초기화
         self.firebase_service = FirebaseService()
         
+        # Firebase 동기화 장부 (마지막으로 저장한 게시글 해시 - 새/변경 게시글만 동기화)
+        self.firebase_ledger = SyncLedger(self.firebase_ledger_file, self.firebase_service.collection_name)
+        
         # 스케줄러 서비스 초기화
         self.scheduler_service = SchedulerService()
         self.scheduler_service.set_crawl_callback(self.crawl_new_posts)
@@ -61,19 +131,6 @@ class CrawlerService:
         logging.info(f"크롤러 서비스 초기화 완료 - {len(self.target_urls)}개 URL")
         logging.info(f"Firebase 동기화: {'활성화' if self.firebase_enabled else '비활성화'}")
     
-    def get_base_url(self, url):
-        """URL에 따라 적절한 base_url 반환"""
-        if 'swuniv.jbnu.ac.kr' in url:
-            return 'https://swuniv.jbnu.ac.kr'
-        elif 'csai.jbnu.ac.kr' in url:
-            return 'https://csai.jbnu.ac.kr'
-        elif 'sw.kunsan.ac.kr' in url:
-            return 'https://sw.kunsan.ac.kr'
-        elif 'www.kunsan.ac.kr' in url:
-            return 'https://www.kunsan.ac.kr'
-        else:
-            return self.base_url
-
     def load_config(self, config_file):
         """설정 파일 로드"""
         default_config = self._get_default_config()
@@ -95,7 +152,16 @@ class CrawlerService:
         return {
             "base_url": "https://csai.jbnu.ac.kr",
             "data_file": "notices_data.json",
+            "storage": "sqlite",
+            "journal_compact_minutes": 10,
+            "content_compression": "zstd",
             "max_pages": 2,
+            "html_parser": "selectolax",
+            "incremental_crawl": True,
+            "stop_at_watermark": True,
+            "watermark_known_rows": 5,
+            "http_cache_enabled": True,
+            "response_cache_entries": 256,
             "target_urls": {
                 "https://csai.jbnu.ac.kr/csai/29105/subview.do": "학과소식",
                 "https://csai.jbnu.ac.kr/csai/29106/subview.do": "일반공지",
@@ -109,6 +175,27 @@ class CrawlerService:
                 "https://sw.kunsan.ac.kr/main/sw?gc=483ZJFR": "군산대SW사업단소식",
                 "https://www.kunsan.ac.kr/cie/board/list.kunsan?boardId=BBS_0000758&menuCd=DOM_000011204001000000&contentsSid=4535&cpath=%2Fcie": "군산대컴퓨터정보공학과공지사항",
                 "https://www.kunsan.ac.kr/cie/board/list.kunsan?boardId=BBS_0000761&menuCd=DOM_000011204003000000&contentsSid=4550&cpath=%2Fcie": "군산대컴퓨터정보공학과취업공고"
+            },
+            "crawling_settings": {
+                "max_concurrency_per_host": 4,
+                "max_connections_per_host": 4,
+                "max_keepalive_connections": 4,
+                "keepalive_expiry": 30,
+                "max_retries": 2,
+                "retry_backoff": 0.5,
+                "requests_per_second": 2.0,
+                "burst": 2,
+                "adaptive_rate_limit": True,
+                "min_requests_per_second": 0.2,
+                "slow_response_seconds": 3.0,
+                "host_requests_per_second": {},
+                "timeout": 10,
+                "connect_timeout": 5,
+                "verify_ssl": False,
+                "user_agent": DEFAULT_USER_AGENT,
+                "parse_workers": None,
+                "detail_workers": 4,
+                "pipeline_queue_size": 8
             }
         }
     
@@ -127,721 +214,793 @@ class CrawlerService:
 
     def load_existing_data(self):
         """기존 크롤링 데이터 로드"""
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    logging.info(f"기존 데이터 로드 완료: {len(data)}개 게시글")
-                    return data
-            except Exception as e:
-                logging.error(f"기존 데이터 로드 실패: {e}")
+        try:
+            data = self.storage.load_all()
+            if data:
+                logging.info(f"기존 데이터 로드 완료: {len(data)}개 게시글")
+                self._migrate_inline_content(data)
+                self._validate_posts(data)
+                return data
+        except Exception as e:
+            logging.error(f"기존 데이터 로드 실패: {e}")
+            return []
         
-        logging.info("기존 데이터 파일이 없습니다. 새로 시작합니다.")
+        logging.info("기존 데이터가 없습니다. 새로 시작합니다.")
         return []
 
-    def get_total_pages(self, soup, url=''):
-        """총 페이지 수 가져오기"""
-        # 기존 csai.jbnu.ac.kr 사이트 페이지네이션
-        if 'csai.jbnu.ac.kr' in url or not url:
-            return self._get_csai_pages(soup)
-        
-        # 새로운 swuniv.jbnu.ac.kr 사이트 페이지네이션
-        elif 'swuniv.jbnu.ac.kr' in url:
-            return self._get_swuniv_pages(soup)
-        
-        # 군산대학교 사이트 페이지네이션
-        elif 'kunsan.ac.kr' in url:
-            return self._get_kunsan_pages(soup)
-        
-        return 1
-    
-    def _get_csai_pages(self, soup):
-        """CSAI 사이트 페이지 수 계산"""
-        paging_div = soup.find('div', class_='_paging')
-        if paging_div:
-            total_page_span = paging_div.find('span', class_='_totPage')
-            if total_page_span:
-                return min(int(re.search(r'\d+', total_page_span.text).group()), self.max_pages)
-        return 1
-    
-    def _get_swuniv_pages(self, soup):
-        """SWUNIV 사이트 페이지 수 계산"""
-        # 프로그램 신청 페이지의 경우 숫자 링크에서 최대 페이지 찾기
-        number_links = soup.find_all('a', href=True)
-        page_numbers = [int(link.get_text().strip()) for link in number_links 
-                       if link.get_text().strip().isdigit()]
-        
-        if page_numbers:
-            return min(max(page_numbers), self.max_pages)
-        
-        # 다양한 페이지네이션 구조 시도
-        paging_selectors = [
-            'div.paging', 'div.pagination', 'div.page-navigation',
-            'div.page-nav', 'ul.pagination', 'div.pager'
-        ]
-        
-        for selector in paging_selectors:
-            paging_div = soup.find('div', class_=selector) or soup.find('ul', class_=selector)
-            if paging_div:
-                page_links = paging_div.find_all('a', href=True)
-                if page_links:
-                    max_page = 1
-                    for link in page_links:
-                        page_text = link.get_text().strip()
-                        if page_text.isdigit():
-                            max_page = max(max_page, int(page_text))
-                    return min(max_page, self.max_pages)
-        
-        # 숫자 텍스트에서 페이지 수 찾기
-        page_text = soup.get_text()
-        page_match = re.search(r'(\d+)\s*/\s*(\d+)', page_text)
-        if page_match:
-            return min(int(page_match.group(2)), self.max_pages)
-        
-        return 1
-    
-    def _get_kunsan_pages(self, soup):
-        """군산대학교 사이트 페이지 수 계산"""
-        # 페이지네이션 요소 찾기
-        pagination_divs = soup.find_all('div', class_='paging')
-        if pagination_divs:
-            # 페이지 번호들 찾기
-            page_links = []
-            for div in pagination_divs:
-                links = div.find_all('a')
-                for link in links:
-                    page_text = link.text.strip()
-                    if page_text.isdigit():
-                        page_links.append(int(page_text))
-            
-            if page_links:
-                return min(max(page_links), self.max_pages)
-        
-        # 기본값
-        return 1
-
-    def parse_page(self, html, category):
-        """페이지 파싱하여 게시글 데이터 추출"""
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        logging.info(f"[{category}] 파싱 시작 - HTML 크기: {len(html)} bytes")
-        
-        # 사이트 구조에 따른 파싱 방법 선택
-        if 'SW중심대학사업단' in category:
-            logging.info(f"[{category}] swuniv.jbnu.ac.kr 사이트 구조로 파싱")
-            return self._parse_swuniv_page(soup, category)
-        elif self._is_csai_category(category):
-            logging.info(f"[{category}] csai.jbnu.ac.kr 사이트 구조로 파싱")
-            return self._parse_csai_page(soup, category)
-        elif self._is_kunsan_category(category):
-            logging.info(f"[{category}] kunsan.ac.kr 사이트 구조로 파싱")
-            return self._parse_kunsan_page(soup, category)
-        else:
-            logging.warning(f"[{category}] 알 수 없는 사이트 구조입니다.")
-            return []
-    
-    def _is_csai_category(self, category):
-        """CSAI 사이트 카테고리인지 확인"""
-        csai_categories = ['학과소식', '일반공지', '학사공지', '사업단공지', '취업정보']
-        return 'csai.jbnu.ac.kr' in category or category in csai_categories
-    
-    def _is_kunsan_category(self, category):
-        """군산대학교 사이트 카테고리인지 확인"""
-        kunsan_categories = ['군산대SW사업단공지', '군산대SW사업단소식', '군산대컴퓨터정보공학과공지사항', '군산대컴퓨터정보공학과취업공고']
-        return 'kunsan.ac.kr' in category or category in kunsan_categories
-    
-    def _parse_csai_page(self, soup, category):
-        """기존 csai.jbnu.ac.kr 사이트 파싱"""
-        data = []
-        
-        table = soup.find('table', class_='artclTable')
-        if not table:
-            logging.warning(f"[{category}] 공지사항 테이블을 찾을 수 없습니다.")
-            return []
-        
-        rows = table.find('tbody').find_all('tr')
-        
-        for row in rows:
-            cols = row.find_all('td')
-            if len(cols) < 6:
-                continue
-                
-            number = cols[0].text.strip()
-            
-            # 제목과 링크 추출
-            title_cell = cols[1]
-            title_link = title_cell.find('a')
-            if title_link:
-                title = title_link.get_text()
-                title = ' '.join(title.split())
-                href = title_link.get('href', '')
-                full_url = urljoin(self.base_url, href) if href else ''
-            else:
-                title = title_cell.get_text()
-                title = ' '.join(title.split())
-                full_url = ''
-            
-            author = cols[2].text.strip()
-            date = cols[3].text.strip()
-            attachments = cols[4].text.strip()
-            views = cols[5].text.strip()
-            
-            # 고유 ID 생성 (URL 기반)
-            notice_id = f"{category}_{number}_{hash(full_url) % 100000}"
-            
-            post_data = {
-                'id': notice_id,
-                'category': category,
-                'number': number,
-                'title': title,
-                'author': author,
-                'date': date,
-                'attachments': attachments,
-                'views': views,
-                'url': full_url,
-                'content': '',
-                'content_html': '',
-                'image_urls': [],
-                'crawled_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            data.append(post_data)
-        
-        return data
-    
-    def _parse_swuniv_page(self, soup, category):
-        """새로운 swuniv.jbnu.ac.kr 사이트 파싱 (프로그램 신청 페이지)"""
-        data = []
-        
-        logging.info(f"[{category}] 프로그램 신청 페이지 파싱 시작")
-        
-        # 프로그램 링크 찾기
-        program_links = self._extract_program_links(soup)
-        logging.info(f"[{category}] 프로그램 링크 {len(program_links)}개 발견")
-        
-        # 각 프로그램 정보 파싱
-        for i, link in enumerate(program_links):
+    def _migrate_inline_content(self, data):
+        """content_html이 레코드에 들어 있는 기존 데이터를 블롭 저장소로 옮기고 저장소에 반영"""
+        inline_posts = [post for post in data if post.get('content_html')]
+        for post in data:
+            self._offload_content(post)
+        if inline_posts:
+            self.storage.replace_all(data)
+            logging.info(f"게시글 {len(inline_posts)}개의 HTML 본문을 블롭 저장소로 이전: {self.content_store_dir}")
+
+    def _offload_content(self, post):
+        """content_html을 블롭 저장소에 저장하고 게시글에는 참조(content_ref)만 남김"""
+        html = post.pop('content_html', '')
+        post['content_ref'] = self.content_store.put(html) if html else post.get('content_ref', '')
+        return post
+
+    def _validate_posts(self, posts):
+        """게시글을 NoticeResponse 형식으로 한 번만 검증 (조회 API는 다시 검증하지 않고 응답)
+
+        크롤링/로드 시점에 검증하고, 형식이 맞지 않는 필드는 기본값이나 문자열로 바꿔 저장된 게시글을 고친다.
+        """
+        for post in posts:
             try:
-                post_data = self._create_swuniv_post_data(link, category, i+1)
-                data.append(post_data)
+                NoticeResponse.model_validate(self._to_response_dict(post))
+            except ValidationError as e:
+                logging.warning(f"게시글 형식 오류 수정 ({post.get('url', '')}): {e.error_count()}개 필드")
+                for field in NoticeResponse.model_fields:
+                    if field == 'content_html':
+                        continue
+                    value = post.get(field)
+                    if field == 'image_urls':
+                        post[field] = [str(url) for url in value] if isinstance(value, list) else []
+                    elif not isinstance(value, str):
+                        post[field] = '' if value is None else str(value)
+
+    def _to_response_dict(self, post, fields=None):
+        """게시글을 NoticeResponse 필드(또는 fields)만 담은 dict로 변환"""
+        return {field: post.get(field, [] if field == 'image_urls' else '')
+                for field in fields or NoticeResponse.model_fields}
+
+    def _to_response(self, post):
+        """검증된 게시글로 NoticeResponse 생성 (검증 생략)"""
+        return NoticeResponse.model_construct(**self._to_response_dict(post))
+
+    def _load_content(self, post):
+        """블롭 저장소에서 content_html을 읽어 채운 게시글 사본 반환"""
+        return {**post, 'content_html': self.content_store.get(post.get('content_ref', ''))}
+
+    def _load_contents(self, posts):
+        """여러 게시글의 content_html 채우기 (Firebase 저장용)"""
+        return [self._load_content(post) for post in posts]
+
+    def load_watermarks(self):
+        """카테고리별 워터마크(마지막으로 확인한 최신 게시글) 로드"""
+        if os.path.exists(self.watermark_file):
+            try:
+                with open(self.watermark_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
             except Exception as e:
-                logging.warning(f"[{category}] 프로그램 파싱 중 오류: {e}")
-                continue
-        
-        return data
-    
-    def _extract_program_links(self, soup):
-        """프로그램 링크 추출"""
-        program_links = []
-        links = soup.find_all('a', href=True)
-        
-        for link in links:
-            href = link.get('href', '')
-            text = link.get_text().strip()
-            
-            # 프로그램 관련 링크 필터링 (신청하기, 접수마감 등)
-            if ('신청하기' in text or '접수마감' in text) and text and len(text) > 10:
-                full_url = self._normalize_swuniv_url(href)
-                program_links.append({
-                    'href': full_url,
-                    'text': text
-                })
-        
-        return program_links
-    
-    def _normalize_swuniv_url(self, href):
-        """SWUNIV URL 정규화"""
-        if href.startswith('/'):
-            return 'https://swuniv.jbnu.ac.kr' + href
-        elif href.startswith('http'):
-            return href
-        else:
-            return f"https://swuniv.jbnu.ac.kr/main/{href}"
-    
-    def _create_swuniv_post_data(self, link, category, index):
-        """SWUNIV 게시글 데이터 생성"""
-        title = link['text']
-        program_category = self._extract_program_category(title)
-        notice_id = f"{category}_{index}_{hash(link['href']) % 100000}"
-        
-        return {
-            'id': notice_id,
-            'category': f"{category}_{program_category}",
-            'number': str(index),
-            'title': title,
-            'author': 'SW중심대학사업단',
-            'date': datetime.now().strftime("%Y-%m-%d"),
-            'attachments': '',
-            'views': '0',
-            'url': link['href'],
-            'content': '',
-            'content_html': '',
-            'image_urls': [],
-            'crawled_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-    
-    def _extract_program_category(self, title):
-        """프로그램 카테고리 추출"""
-        category_map = {
-            'SW가치확산': 'SW가치확산',
-            'SW융합': 'SW융합',
-            'SW전공': 'SW전공',
-            '산학협력': '산학협력',
-            '교육환경지원': '교육환경지원'
-        }
-        
-        for keyword, category in category_map.items():
-            if keyword in title:
-                return category
-        return '프로그램'
-    
-    def _parse_kunsan_page(self, soup, category):
-        """군산대학교 사이트 파싱"""
-        data = []
-        
-        # 테이블 찾기 (클래스가 없으므로 첫 번째 테이블 사용)
-        table = soup.find('table')
-        if not table:
-            logging.warning(f"[{category}] 공지사항 테이블을 찾을 수 없습니다.")
-            return []
-        
-        rows = table.find_all('tr')
-        
-        for row in rows:
-            cols = row.find_all(['td', 'th'])
-            if len(cols) < 6:
-                continue
-                
-            # 헤더 행 건너뛰기
-            if cols[0].name == 'th':
-                continue
-                
-            number = cols[0].text.strip()
-            
-            # 제목과 링크 추출
-            title_cell = cols[1]
-            title_link = title_cell.find('a')
-            if title_link:
-                title = title_link.get_text()
-                title = ' '.join(title.split())
-                href = title_link.get('href', '')
-                full_url = urljoin(self.get_base_url('www.kunsan.ac.kr'), href) if href else ''
-            else:
-                title = title_cell.get_text()
-                title = ' '.join(title.split())
-                full_url = ''
-            
-            author = cols[2].text.strip()
-            date = cols[3].text.strip()
-            views = cols[4].text.strip()
-            attachments = cols[5].text.strip() if len(cols) > 5 else ''
-            
-            # 고유 ID 생성 (URL 기반)
-            notice_id = f"{category}_{number}_{hash(full_url) % 100000}"
-            
-            post_data = {
-                'id': notice_id,
-                'category': category,
-                'number': number,
-                'title': title,
-                'author': author,
-                'date': date,
-                'attachments': attachments,
-                'views': views,
-                'url': full_url,
-                'content': '',
-                'content_html': '',
-                'image_urls': [],
-                'crawled_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            data.append(post_data)
-        
-        return data
+                logging.error(f"워터마크 로드 실패: {e}")
+        return {}
 
-    def get_post_content(self, url):
-        """게시글 상세 내용, HTML 원문, 이미지 URL들 가져오기"""
+    def save_watermarks(self):
+        """카테고리별 워터마크 저장"""
         try:
-            # SSL 검증 비활성화 (일부 사이트에서 SSL 문제 발생)
-            response = requests.get(url, timeout=10, verify=False)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 사이트별 내용 추출
-            if 'csai.jbnu.ac.kr' in url:
-                return self._get_csai_content(soup, url)
-            elif 'swuniv.jbnu.ac.kr' in url:
-                return self._get_swuniv_content(soup, url)
-            elif 'kunsan.ac.kr' in url:
-                return self._get_kunsan_content(soup, url)
-            else:
-                return self._get_default_content(soup, url)
-                
+            with open(self.watermark_file, 'w', encoding='utf-8') as f:
+                json.dump(self.watermarks, f, ensure_ascii=False, indent=2)
         except Exception as e:
-            logging.error(f"상세 내용 가져오기 실패 ({url}): {e}")
-            return self._get_empty_content()
-    
-    def _get_empty_content(self):
-        """빈 내용 반환"""
-        return {
-            'content_text': '',
-            'content_html': '',
-            'image_urls': []
-        }
-    
-    def _get_csai_content(self, soup, url):
-        """기존 csai.jbnu.ac.kr 사이트 내용 추출"""
-        base_url = self.get_base_url(url)
-        
-        # artclView div에서 내용 추출
-        artcl_view = soup.find('div', class_='artclView')
-        if artcl_view:
-            result = self._extract_content_from_element(artcl_view, base_url)
-            # 제목 부분 제거
-            if result['content_text']:
-                lines = result['content_text'].split()
-                if len(lines) > 10:
-                    result['content_text'] = ' '.join(lines[5:])
-            return result
-        
-        # hwp_editor_board_content div에서 내용 추출
-        hwp_content = soup.find('div', class_='hwp_editor_board_content')
-        if hwp_content:
-            return self._extract_content_from_element(hwp_content, base_url)
-        
-        return self._get_empty_content()
-    
-    def _get_kunsan_content(self, soup, url):
-        """군산대학교 사이트 내용 추출"""
-        base_url = self.get_base_url(url)
-        
-        # 다양한 가능한 컨텐츠 영역 시도
-        content_selectors = [
-            'div.view_content', 'div.content', 'div.article-content',
-            'div.board-content', 'div.post-content', 'div.main-content',
-            'div.text-content', 'div.body-content', 'div.entry-content',
-            'div.article-body', 'div.board-view', 'div.view'
-        ]
-        
-        # 다양한 선택자로 내용 찾기
-        for selector in content_selectors:
-            content_div = soup.find('div', class_=selector)
-            if content_div:
-                result = self._extract_content_from_element(content_div, base_url)
-                if result['content_text'] and len(result['content_text'].strip()) > 10:
-                    return result
-        
-        # 메인 컨텐츠 영역에서 찾기
-        main_content = soup.find('main') or soup.find('article') or soup.find('div', id='content')
-        if main_content:
-            return self._extract_content_from_element(main_content, base_url)
-        
-        return self._get_empty_content()
-    
-    def _get_swuniv_content(self, soup, url):
-        """새로운 swuniv.jbnu.ac.kr 사이트 내용 추출"""
-        content_selectors = [
-            'div.content', 'div.article-content', 'div.board-content',
-            'div.view-content', 'div.post-content', 'div.main-content',
-            'div.text-content', 'div.body-content', 'div.entry-content',
-            'div.article-body', 'div.board-view', 'div.view'
-        ]
-        
-        # 다양한 선택자로 내용 찾기
-        for selector in content_selectors:
-            content_div = soup.find('div', class_=selector)
-            if content_div:
-                result = self._extract_content_from_element(content_div, 'swuniv.jbnu.ac.kr')
-                if result['content_text'] and len(result['content_text'].strip()) > 10:
-                    return result
-        
-        # 메인 컨텐츠 영역에서 찾기
-        main_content = soup.find('main') or soup.find('article') or soup.find('div', id='content')
-        if main_content:
-            return self._extract_content_from_element(main_content, 'swuniv.jbnu.ac.kr')
-        
-        return self._get_empty_content()
-    
-    def _extract_content_from_element(self, element, base_url):
-        """요소에서 내용 추출"""
-        content_html = str(element)
-        content_text = element.get_text()
-        content_text = ' '.join(content_text.split())
-        
-        # 이미지 URL들 추출
-        image_urls = []
-        img_tags = element.find_all('img')
-        for img in img_tags:
-            src = img.get('src')
-            if src:
-                if base_url.startswith('http'):
-                    full_img_url = urljoin(base_url, src)
-                else:
-                    full_img_url = self._normalize_image_url(src, base_url)
-                image_urls.append(full_img_url)
+            logging.error(f"워터마크 저장 실패: {e}")
+
+    def _commit_crawl_state(self):
+        """크롤링 중 수집한 워터마크, 목록 페이지 해시, HTTP 캐시 검증자를 반영 (데이터 저장 후 호출)
+
+        상세 내용을 가져오지 못한 게시글이 있으면 반영하지 않고 버려서,
+        다음 크롤링이 목록 페이지를 다시 확인하여 그 게시글을 다시 가져오도록 한다.
+        """
+        with self.data_lock:
+            failed_count = len(self.pending_failed_urls)
+        if failed_count:
+            logging.warning(f"상세 내용을 가져오지 못한 게시글 {failed_count}개 - 다음 크롤링에서 다시 시도")
+            self._reset_crawl_state()
+            return
         
-        return {
-            'content_text': content_text,
-            'content_html': content_html,
-            'image_urls': image_urls
-        }
-    
-    def _normalize_image_url(self, src, base_domain):
-        """이미지 URL 정규화"""
-        if src.startswith('/'):
-            return f"https://{base_domain}" + src
-        elif src.startswith('http'):
-            return src
-        else:
-            return f"https://{base_domain}/" + src
+        self._commit_watermarks()
+        with self.data_lock:
+            self.page_digests.update(self.pending_page_digests)
+            self.pending_page_digests = {}
+        if self.http_cache:
+            self.http_cache.commit()
+
+    def _reset_crawl_state(self):
+        """반영하지 않은 크롤링 상태(워터마크, 목록 페이지 해시, HTTP 캐시 검증자, 실패 게시글) 폐기"""
+        with self.data_lock:
+            self.pending_watermarks = {}
+            self.pending_page_digests = {}
+            self.pending_failed_urls = set()
+        if self.http_cache:
+            self.http_cache.discard_pending()
+
+    def _commit_watermarks(self):
+        """크롤링 중 수집한 워터마크를 반영"""
+        with self.data_lock:
+            if not self.pending_watermarks:
+                return
+            self.watermarks.update(self.pending_watermarks)
+            self.pending_watermarks = {}
+            self.save_watermarks()
+
+    async def get_post_content(self, client, url, conditional=False):
+        """게시글 상세 내용, HTML 원문, 이미지 URL들 가져오기
+
+        conditional이 True이고 저장된 내용 이후 변경이 없으면 None을 반환한다.
+        요청이나 파싱에 실패하면 예외가 발생한다. (없는 게시글(4xx)은 빈 내용 반환)
+        """
+        try:
+            response = await self._get_if_modified(client, url, conditional=conditional)
+        except httpx.HTTPStatusError as e:
+            status_code = e.response.status_code
+            if 400 <= status_code < 500 and status_code != 429:
+                # 다시 요청해도 같은 결과이므로 빈 내용으로 저장
+                logging.error(f"상세 내용 가져오기 실패 ({url}): {e}")
+                return self.parser.get_empty_content()
+            raise
+        if response is None:
+            return None
+        response.encoding = 'utf-8'
+        
+        # 파싱은 이벤트 루프를 막지 않도록 파싱 프로세스 풀에서 실행
+        return await self.parse_pool.run('parse_post_content', response.text, url)
     
-    def _get_default_content(self, soup, url):
-        """기본 내용 추출 방법"""
-        # 일반적인 컨텐츠 영역 찾기
-        content_div = (soup.find('div', class_='content') or 
-                      soup.find('div', class_='article') or 
-                      soup.find('div', class_='post'))
-        
-        if content_div:
-            return self._extract_content_from_element(content_div, url)
-        
-        return self._get_empty_content()
+    async def crawl_single_url(self, client, url, category, max_pages=2, known_posts=None):
+        """단일 URL 크롤링
 
-    def crawl_single_url(self, url, category, max_pages=2):
-        """단일 URL 크롤링"""
-        logging.info(f"[{category}] 크롤링 시작: {url}")
+        known_posts(URL → 저장된 게시글)가 주어지면 증분 모드로 동작하여
+        이미 저장된 게시글의 상세 페이지는 다시 가져오지 않는다.
+        """
         url_data = []
+        async for page_data in self._iter_board_pages(client, url, category, known_posts):
+            url_data.extend(await self._enrich_posts_with_content(client, page_data, known_posts))
+        return url_data
+    
+    async def _iter_board_pages(self, client, url, category, known_posts=None):
+        """게시판의 목록 페이지를 순서대로 가져와 파싱한 게시글 목록을 페이지 단위로 반환 (상세 내용 제외)"""
+        logging.info(f"[{category}] 크롤링 시작: {url}")
+        post_count = 0
         
         try:
-            # SSL 검증 비활성화 (일부 사이트에서 SSL 문제 발생)
-            response = requests.get(url, timeout=10, verify=False)
-            response.raise_for_status()
+            # 증분 모드에서는 조건부 요청 - 첫 페이지가 그대로면 최신순 게시판에 새 글이 없음
+            response = await self._get_if_modified(client, url, conditional=known_posts is not None)
+            if response is None:
+                logging.info(f"[{category}] 목록 페이지 변경 없음 - 크롤링 생략")
+                return
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            total_pages = self.get_total_pages(soup, url)
+            # 첫 응답을 1페이지로 재사용 - 한 번의 파싱으로 총 페이지 수와 게시글 추출
+            first_page_unchanged = self._is_page_unchanged(category, 1, response)
+            if first_page_unchanged:
+                total_pages = self.page_digests[(category, 1)]['total_pages']
+            else:
+                total_pages, first_page_data = await self.parse_pool.run('parse_first_page', response.text, url, category)
+                self._record_page_digest(category, 1, response, first_page_data, total_pages)
             
             logging.info(f"[{category}] 총 {total_pages}페이지 크롤링 예정")
             
+            watermark = self.watermarks.get(category)
+            use_watermark = known_posts is not None and self.stop_at_watermark
+            known_streak = 0
+            
             for page_num in range(1, total_pages + 1):
                 try:
-                    page_response = self._get_page_response(url, page_num)
-                    page_data = self.parse_page(page_response.text, category)
+                    if page_num == 1:
+                        page_response, unchanged = response, first_page_unchanged
+                    else:
+                        page_response = await self._get_page_response(client, url, page_num, conditional=known_posts is not None)
+                        unchanged = self._is_page_unchanged(category, page_num, page_response)
                     
-                    # 상세 내용 가져오기
-                    page_data = self._enrich_posts_with_content(page_data)
+                    if unchanged and known_posts is not None:
+                        # 지난 크롤링 이후 변경 없는 페이지 - 모든 게시글이 이미 반영되어 파싱과 비교 생략
+                        logging.info(f"[{category}] 페이지 {page_num}/{total_pages} 변경 없음 - 파싱 생략")
+                        if use_watermark:
+                            break
+                        continue
                     
-                    url_data.extend(page_data)
+                    if unchanged:
+                        page_data = self._get_cached_page_rows(category, page_num)
+                    elif page_num == 1:
+                        page_data = first_page_data
+                    else:
+                        page_data = await self.parse_pool.run('parse_page', page_response.text, category)
+                        self._record_page_digest(category, page_num, page_response, page_data)
+                    
+                    if page_num == 1:
+                        self._record_watermark(category, page_data)
+                    
+                    # 워터마크 도달 여부는 상세 내용을 채우기 전에 판단
+                    stop_reason = None
+                    if use_watermark:
+                        stop_reason, known_streak = self._check_watermark(page_data, known_posts, watermark, known_streak)
+                    
+                    post_count += len(page_data)
                     logging.info(f"[{category}] 페이지 {page_num}/{total_pages} 완료: {len(page_data)}개 게시글")
-                    time.sleep(0.5)  # 페이지 간 딜레이
+                    yield page_data
+                    
+                    if stop_reason:
+                        logging.info(f"[{category}] {stop_reason} - 페이지 {page_num}에서 크롤링 중단")
+                        break
                     
                 except Exception as e:
                     logging.error(f"[{category}] 페이지 {page_num} 크롤링 실패: {e}")
                     continue
             
-            logging.info(f"[{category}] 크롤링 완료: 총 {len(url_data)}개 게시글")
+            logging.info(f"[{category}] 목록 크롤링 완료: 총 {post_count}개 게시글")
             
         except Exception as e:
             logging.error(f"[{category}] 크롤링 중 오류 발생: {e}")
+    
+    def _is_page_unchanged(self, category, page_num, page_response):
+        """목록 페이지가 지난 크롤링과 같은지 확인 (304 응답 또는 같은 본문 해시)"""
+        if page_response is None:
+            unchanged = True
+        else:
+            cached_page = self.page_digests.get((category, page_num))
+            unchanged = bool(cached_page) and cached_page['digest'] == hashlib.sha256(page_response.content).hexdigest()
         
-        return url_data
+        self._count_page(category, 'short_circuited_pages' if unchanged else 'parsed_pages')
+        return unchanged
     
-    def _get_page_response(self, url, page_num):
-        """페이지별 응답 가져오기"""
-        if 'swuniv.jbnu.ac.kr' in url:
-            # SW중심대학사업단 사이트는 URL에 페이지 파라미터 추가
-            page_url = f"{url}&page={page_num}" if '?' in url else f"{url}?page={page_num}"
-            return requests.get(page_url, timeout=10, verify=False)
-        elif 'kunsan.ac.kr' in url:
-            # 군산대학교 사이트는 URL에 페이지 파라미터 추가
+    def _get_cached_page_rows(self, category, page_num):
+        """지난 크롤링의 목록 페이지 파싱 결과 복사"""
+        crawled_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return [{**row, 'crawled_at': crawled_at} for row in self.page_digests[(category, page_num)]['rows']]
+    
+    def _record_page_digest(self, category, page_num, page_response, page_data, total_pages=None):
+        """목록 페이지 본문 해시와 파싱 결과 기록 (데이터 저장 후 반영, 첫 페이지는 총 페이지 수 포함)"""
+        with self.data_lock:
+            self.pending_page_digests[(category, page_num)] = {
+                'digest': hashlib.sha256(page_response.content).hexdigest(),
+                'rows': [dict(row) for row in page_data],
+                'total_pages': total_pages
+            }
+    
+    def _count_page(self, category, key):
+        """이번 크롤링의 카테고리별 페이지 처리 수 집계"""
+        with self.data_lock:
+            counts = self.last_crawl_stats.setdefault(key, {})
+            counts[category] = counts.get(category, 0) + 1
+    
+    def _is_ordered_post(self, post):
+        """번호가 있는 일반 게시글인지 확인 (상단 고정 공지는 최신순 정렬에서 제외)"""
+        return post.get('number', '').isdigit()
+
+    def _record_watermark(self, category, page_data):
+        """첫 페이지의 최신 게시글을 워터마크 후보로 기록"""
+        newest = next((post for post in page_data if self._is_ordered_post(post) and post.get('url')), None)
+        if newest:
+            with self.data_lock:
+                self.pending_watermarks[category] = {
+                    'number': newest['number'],
+                    'url': newest['url'],
+                    'date': newest.get('date', ''),
+                    'updated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                }
+
+    def _check_watermark(self, page_data, known_posts, watermark, known_streak):
+        """페이지가 이미 저장된 구간에 도달했는지 확인
+
+        (중단 사유 또는 None, 갱신된 연속 기존 게시글 수)를 반환한다.
+        """
+        ordered_posts = [post for post in page_data if self._is_ordered_post(post) and post.get('url')]
+        if not ordered_posts:
+            return None, known_streak
+        
+        if watermark and any(post['url'] == watermark.get('url') for post in ordered_posts):
+            return f"워터마크 도달 (번호 {watermark.get('number')})", known_streak
+        
+        for post in ordered_posts:
+            known_streak = known_streak + 1 if post['url'] in known_posts else 0
+            if self.watermark_known_rows and known_streak >= self.watermark_known_rows:
+                return f"기존 게시글 {known_streak}개 연속", known_streak
+        
+        if all(post['url'] in known_posts for post in ordered_posts):
+            return "페이지의 모든 게시글이 기존 게시글", known_streak
+        
+        return None, known_streak
+
+    def _get_page_request(self, url, page_num):
+        """페이지별 요청 URL과 파라미터 반환"""
+        if 'swuniv.jbnu.ac.kr' in url or 'kunsan.ac.kr' in url:
+            # SW중심대학사업단, 군산대학교 사이트는 URL에 페이지 파라미터 추가
             page_url = f"{url}&page={page_num}" if '?' in url else f"{url}?page={page_num}"
-            return requests.get(page_url, timeout=10, verify=False)
+            return page_url, None
         else:
             # 기존 csai.jbnu.ac.kr 사이트는 파라미터 방식
-            params = {'page': page_num}
-            return requests.get(url, params=params, timeout=10, verify=False)
+            return url, {'page': page_num}
+    
+    async def _get_page_response(self, client, url, page_num, conditional=False):
+        """페이지별 응답 가져오기 (conditional이면 변경 없는 페이지는 None)"""
+        page_url, params = self._get_page_request(url, page_num)
+        return await self._get_if_modified(client, page_url, params, conditional=conditional)
+    
+    async def _get_if_modified(self, client, url, params=None, conditional=False):
+        """조건부 GET 요청
+
+        HTTP 캐시에 검증자가 있으면 If-None-Match/If-Modified-Since를 보내고,
+        conditional이 True일 때 304 응답이거나 본문 해시가 지난번과 같으면 None을 반환한다.
+        """
+        if not self.http_cache:
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            return response
+        
+        cache_key = self.http_cache.make_key(url, params)
+        headers = self.http_cache.get_conditional_headers(cache_key) if conditional else None
+        response = await client.get(url, params=params, headers=headers)
+        
+        if response.status_code == 304:
+            self.http_cache.record_not_modified(cache_key)
+            return None
+        
+        response.raise_for_status()
+        unchanged = self.http_cache.record_response(cache_key, response.headers, response.content, count=conditional)
+        return None if (unchanged and conditional) else response
     
-    def _enrich_posts_with_content(self, page_data):
-        """게시글에 상세 내용 추가"""
+    async def _enrich_posts_with_content(self, client, page_data, known_posts=None):
+        """게시글에 상세 내용 추가 (상세 페이지는 동시에 요청)"""
+        reused_count = 0
+        posts_to_fetch = []
         for post in page_data:
-            if post['url']:
-                content_data = self.get_post_content(post['url'])
-                post['content'] = content_data['content_text']
-                post['content_html'] = content_data['content_html']
-                post['image_urls'] = content_data['image_urls']
-                time.sleep(0.3)  # 서버 부하 방지
+            if not post['url']:
+                continue
+            
+            # 증분 모드: 저장된 게시글과 목록 정보가 같으면 상세 내용 재사용
+            known_post = known_posts.get(post['url']) if known_posts else None
+            if known_post:
+                self._keep_first_seen_date(post, known_post)
+            if known_post and not self._is_post_changed(post, known_post):
+                post['content'] = known_post.get('content', '')
+                post['content_ref'] = known_post.get('content_ref', '')
+                post['image_urls'] = known_post.get('image_urls', [])
+                reused_count += 1
+                continue
+            
+            posts_to_fetch.append(post)
+        
+        failed_urls = set()
+        
+        async def fetch_content(post):
+            # 변경된 기존 게시글은 조건부 요청 - 본문이 그대로면 저장된 내용 재사용
+            known_post = known_posts.get(post['url']) if known_posts else None
+            try:
+                content_data = await self.get_post_content(client, post['url'], conditional=known_post is not None)
+            except Exception as e:
+                logging.error(f"상세 내용 가져오기 실패 ({post['url']}): {e}")
+                failed_urls.add(post['url'])
+                return
+            if content_data is None:
+                post['content'] = known_post.get('content', '')
+                post['content_ref'] = known_post.get('content_ref', '')
+                post['image_urls'] = known_post.get('image_urls', [])
+                return
+            post['content'] = content_data['content_text']
+            # HTML 원문은 블롭 저장소에 저장하고 참조만 보관
+            post['content_ref'] = await asyncio.to_thread(self.content_store.put, content_data['content_html'])
+            post['image_urls'] = content_data['image_urls']
+        
+        await asyncio.gather(*(fetch_content(post) for post in posts_to_fetch))
+        
+        if reused_count:
+            logging.info(f"저장된 게시글 {reused_count}개의 상세 내용 재사용 (요청 생략)")
+        if failed_urls:
+            page_data = self._drop_failed_posts(page_data, failed_urls)
         return page_data
+    
+    def _drop_failed_posts(self, page_data, failed_urls):
+        """상세 내용을 가져오지 못한 게시글을 저장된 게시글로 되돌림 (저장된 적 없으면 제외)
 
-    def crawl_all_urls(self, max_pages=2, use_threading=True):
-        """모든 URL을 크롤링"""
-        logging.info("다중 URL 크롤링 시작...")
-        start_time = time.time()
-        all_data = []
+        빈 내용으로 저장하면 다음 증분 크롤링에서 변경 없는 게시글로 보고 다시 가져오지 않으므로
+        이번 크롤링에서는 반영하지 않고, 크롤링 상태도 반영하지 않아 다음 크롤링에서 다시 시도한다.
+        """
+        with self.data_lock:
+            self.pending_failed_urls.update(failed_urls)
+            stored_posts = {url: self.notice_index.get_by_url(url) for url in failed_urls}
         
-        if use_threading:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                future_to_url = {
-                    executor.submit(self.crawl_single_url, url, category, max_pages): (url, category)
-                    for url, category in self.target_urls.items()
-                }
-                
-                for future in concurrent.futures.as_completed(future_to_url):
-                    url, category = future_to_url[future]
-                    try:
-                        url_data = future.result()
-                        all_data.extend(url_data)
-                        logging.info(f"[{category}] {len(url_data)}개 게시글 수집 완료")
-                    except Exception as e:
-                        logging.error(f"[{category}] 크롤링 실패: {e}")
-        else:
-            for url, category in self.target_urls.items():
-                url_data = self.crawl_single_url(url, category, max_pages)
-                all_data.extend(url_data)
+        kept = []
+        for post in page_data:
+            if post['url'] not in failed_urls:
+                kept.append(post)
+            elif stored_posts[post['url']] is not None:
+                kept.append(stored_posts[post['url']])
+        return kept
+    
+    def _keep_first_seen_date(self, post, known_post):
+        """목록에 작성일이 없는 게시판은 처음 수집한 날짜 유지 (수집한 날짜가 바뀌어 변경된 게시글로 보지 않도록)"""
+        if not self.parser.has_list_date(post.get('category', '')) and known_post.get('date'):
+            post['date'] = known_post['date']
+    
+    def _is_post_changed(self, post, known_post):
+        """목록 페이지 정보로 게시글 변경 여부 확인 (조회수는 제외)"""
+        return any(post.get(field, '') != known_post.get(field, '') for field in ('title', 'date', 'attachments'))
+    
+    def _get_known_posts(self):
+        """저장된 게시글을 URL 기준으로 조회하는 딕셔너리 생성"""
+        with self.data_lock:
+            return self.notice_index.get_known_posts()
+
+    async def crawl_all_urls(self, max_pages=2, use_threading=True, incremental=False):
+        """모든 URL을 크롤링하여 수집한 게시글 반환"""
+        all_data = []
         
-        end_time = time.time()
-        logging.info(f"전체 크롤링 완료: {len(all_data)}개 게시글, 소요시간: {end_time - start_time:.2f}초")
+        async def collect(batch):
+            all_data.extend(batch)
         
+        await self._run_crawl_pipeline(collect, use_threading, incremental)
         return all_data
+    
+    async def _run_crawl_pipeline(self, persist, use_threading=True, incremental=False):
+        """목록 → 상세 → 저장 파이프라인으로 모든 URL 크롤링
+        
+        상세 내용을 채운 게시글은 모든 게시판이 끝나기를 기다리지 않고 바로 persist로 전달된다.
+        use_threading이 True이면 모든 게시판의 목록 페이지를 동시에 크롤링한다.
+        (호스트별 동시 요청 수는 crawling_settings.max_concurrency_per_host로 제한)
+        """
+        logging.info(f"다중 URL 크롤링 시작... ({'증분' if incremental else '전체'} 모드)")
+        start_time = time.time()
+        known_posts = self._get_known_posts() if incremental else None
+        self._reset_crawl_state()
+        with self.data_lock:
+            self.last_crawl_stats = {'short_circuited_pages': {}, 'parsed_pages': {}}
+        
+        async with self._create_http_client() as client:
+            async def crawl_board(emit, url, category):
+                started_at = time.monotonic()
+                async for page_data in self._iter_board_pages(client, url, category, known_posts):
+                    await emit(page_data, started_at)
+                    started_at = time.monotonic()
+            
+            async def produce(emit):
+                targets = list(self.target_urls.items())
+                if use_threading:
+                    results = await asyncio.gather(
+                        *(crawl_board(emit, url, category) for url, category in targets),
+                        return_exceptions=True
+                    )
+                    for (url, category), result in zip(targets, results):
+                        if isinstance(result, Exception):
+                            logging.error(f"[{category}] 크롤링 실패: {result}")
+                else:
+                    for url, category in targets:
+                        await crawl_board(emit, url, category)
+            
+            async def enrich(page_data):
+                try:
+                    return await self._enrich_posts_with_content(client, page_data, known_posts)
+                except Exception as e:
+                    logging.error(f"상세 내용 추가 실패: {e}")
+                    return self._drop_failed_posts(page_data, {post['url'] for post in page_data if post['url']})
+            
+            self.crawl_pipeline = CrawlPipeline(
+                produce, enrich, persist,
+                queue_size=self.crawling_settings['pipeline_queue_size'],
+                detail_workers=self.crawling_settings['detail_workers']
+            )
+            try:
+                await self.crawl_pipeline.run()
+            finally:
+                self._update_http_stats(client.get_stats())
+        
+        end_time = time.time()
+        stage_stats = self.crawl_pipeline.get_stats()
+        short_circuited = sum(self.last_crawl_stats['short_circuited_pages'].values())
+        logging.info(f"전체 크롤링 완료: {stage_stats['persist']['posts']}개 게시글, 변경 없는 페이지 {short_circuited}개 파싱 생략, "
+                     f"소요시간: {end_time - start_time:.2f}초")
+        for stage, stats in stage_stats.items():
+            logging.info(f"[{stage}] 페이지 {stats['pages']}개, 게시글 {stats['posts']}개, "
+                         f"처리 시간 {stats['busy_seconds']}초, 최대 대기 {stats['max_queue_depth']}개")
+
+    def _create_http_client(self):
+        """crawling_settings 기반 호스트별 연결 풀 클라이언트 생성"""
+        settings = self.crawling_settings
+        return AsyncHttpClient(
+            max_concurrency_per_host=settings['max_concurrency_per_host'],
+            timeout=settings['timeout'],
+            verify_ssl=settings['verify_ssl'],
+            user_agent=settings['user_agent'],
+            max_connections_per_host=settings['max_connections_per_host'],
+            max_keepalive_connections=settings['max_keepalive_connections'],
+            keepalive_expiry=settings['keepalive_expiry'],
+            connect_timeout=settings['connect_timeout'],
+            max_retries=settings['max_retries'],
+            retry_backoff=settings['retry_backoff'],
+            rate_limiter=self.rate_limiter
+        )
+
+    def _update_http_stats(self, run_stats):
+        """크롤링 1회의 호스트별 요청 통계를 누적"""
+        for host, host_stats in run_stats.items():
+            total = self.http_stats.setdefault(host, {key: 0 for key in host_stats})
+            for key, value in host_stats.items():
+                total[key] = total.get(key, 0) + value
+        
+        for host, host_stats in run_stats.items():
+            logging.info(f"[{host}] 요청 {host_stats['requests']}회, 새 연결 {host_stats['new_connections']}회, "
+                         f"연결 재사용 {host_stats['reused_connections']}회, 재시도 {host_stats['retries']}회")
 
     def find_new_posts(self, current_data):
         """새로운 게시글 찾기"""
-        existing_urls = {post.get('url', '') for post in self.existing_data if post.get('url')}
+        with self.data_lock:
+            existing_urls = {post['url'] for post in current_data if post.get('url') and self.notice_index.has_url(post['url'])}
         
         new_posts = []
         for post in current_data:
             if post.get('url') and post['url'] not in existing_urls:
+                existing_urls.add(post['url'])
                 new_posts.append(post)
                 logging.info(f"새 게시글 발견: [{post.get('category', 'Unknown')}] {post.get('title', 'N/A')[:50]}...")
         
         return new_posts
 
-    def save_data(self):
-        """데이터를 JSON 파일로 저장"""
+    def find_updated_posts(self, current_data):
+        """목록 정보(제목, 날짜, 첨부)가 바뀐 기존 게시글 찾기"""
+        with self.data_lock:
+            known_posts = {post['url']: self.notice_index.get_by_url(post['url']) for post in current_data if post.get('url')}
+        
+        updated_posts = []
+        for post in current_data:
+            known_post = known_posts.get(post.get('url'))
+            if known_post:
+                self._keep_first_seen_date(post, known_post)
+            if known_post and self._is_post_changed(post, known_post):
+                # 기존 ID 유지
+                post['id'] = known_post.get('id', post.get('id'))
+                updated_posts.append(post)
+                logging.info(f"변경된 게시글 발견: [{post.get('category', 'Unknown')}] {post.get('title', 'N/A')[:50]}...")
+        
+        return updated_posts
+
+    def _merge_updated_posts(self, updated_posts):
+        """변경된 게시글로 기존 데이터 교체 (data_lock 보유 상태에서 호출)"""
+        updated_by_url = {post['url']: post for post in updated_posts}
+        self.existing_data = [updated_by_url.get(post.get('url'), post) for post in self.existing_data]
+
+    def save_data(self, posts=None):
+        """전체 데이터를 저장소에 저장 (실패하면 예외 발생)"""
+        posts = self.existing_data if posts is None else posts
+        try:
+            self.storage.replace_all(posts)
+            logging.info(f"데이터 저장 완료: {len(posts)}개 게시글")
+        except Exception as e:
+            logging.error(f"데이터 저장 실패: {e}")
+            raise
+    
+    def save_changes(self, posts):
+        """새/변경 게시글만 저장소에 저장 (실패하면 예외 발생)"""
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.existing_data, f, ensure_ascii=False, indent=2)
-            logging.info(f"데이터 저장 완료: {self.data_file}")
+            self.storage.upsert(posts)
+            logging.info(f"데이터 저장 완료: 새/변경 게시글 {len(posts)}개")
         except Exception as e:
             logging.error(f"데이터 저장 실패: {e}")
+            raise
 
     # 비동기 메서드들
     async def get_notices(self, category: Optional[str] = None, limit: Optional[int] = None, offset: int = 0) -> List[NoticeResponse]:
         """공지사항 목록 조회"""
-        with self.data_lock:
-            data = self.existing_data.copy()
-        
-        # 카테고리 필터링
-        if category:
-            data = [post for post in data if post.get('category') == category]
-        
-        # 정렬 (최신순)
-        data = sorted(data, key=lambda x: x.get('date', ''), reverse=True)
+        notices, _ = await self.get_notice_page(category, limit, offset)
+        return [NoticeResponse.model_construct(**notice) for notice in notices]
+
+    async def get_notice_page(self, category: Optional[str] = None, limit: Optional[int] = None, offset: int = 0,
+                              cursor: Optional[str] = None, fields: Optional[str] = None):
+        """공지사항 목록 한 페이지 조회 → (공지사항 목록, 다음 페이지 커서)
+
+        cursor가 있으면 offset 대신 커서의 (날짜, id) 게시글 다음부터 가져온다.
+        공지사항은 NoticeResponse 필드를 담은 dict이며(크롤링 시 검증됨),
+        fields(쉼표로 구분한 필드 이름, 'summary'는 NoticeSummary 필드)가 있으면 해당 필드만 담는다.
+        다음 페이지가 없으면 커서는 None이다.
+        잘못된 cursor나 fields는 ValueError.
+        """
+        projection = self._parse_fields(fields)
         
-        # 페이징
-        if offset:
-            data = data[offset:]
-        if limit:
-            data = data[:limit]
+        # 카테고리별 날짜순 인덱스에서 필요한 구간만 가져옴 (다음 페이지 확인용으로 1개 더)
+        fetch_limit = limit + 1 if limit else None
+        with self.data_lock:
+            if cursor:
+                data = self.notice_index.get_page_after(decode_cursor(cursor), category or None, fetch_limit)
+            else:
+                data = self.notice_index.get_page(category or None, offset, fetch_limit)
+            
+            next_cursor = None
+            if limit and len(data) > limit:
+                data = data[:limit]
+                next_cursor = self.notice_index.get_cursor(data[-1])
         
-        return [NoticeResponse(**post) for post in data]
+        return [self._to_response_dict(post, projection) for post in data], next_cursor
+
+    def _parse_fields(self, fields):
+        """fields 파라미터를 필드 이름 목록으로 변환 (없으면 None)"""
+        if not fields:
+            return None
+        if fields == 'summary':
+            return list(NoticeSummary.model_fields)
+        projection = list(dict.fromkeys(field.strip() for field in fields.split(',') if field.strip()))
+        unknown = [field for field in projection if field not in NoticeResponse.model_fields]
+        if unknown:
+            raise ValueError(f"알 수 없는 필드입니다: {', '.join(unknown)}")
+        return projection
 
     async def get_notice_by_id(self, notice_id: str) -> Optional[NoticeResponse]:
-        """특정 공지사항 조회"""
+        """특정 공지사항 조회 (HTML 본문은 블롭 저장소에서 로드)"""
         with self.data_lock:
-            for post in self.existing_data:
-                if post.get('id') == notice_id:
-                    return NoticeResponse(**post)
-        return None
+            post = self.notice_index.get_by_id(notice_id)
+        if post is None:
+            return None
+        return self._to_response(await asyncio.to_thread(self._load_content, post))
 
     async def get_categories(self) -> List[str]:
         """카테고리 목록 조회"""
         with self.data_lock:
-            categories = list(set(post.get('category', 'Unknown') for post in self.existing_data))
-        return sorted(categories)
+            return self.notice_index.get_categories()
 
     async def get_summary(self) -> List[CategorySummary]:
         """카테고리별 요약 정보 조회"""
         with self.data_lock:
-            summary_dict = {}
-            for post in self.existing_data:
-                category = post.get('category', 'Unknown')
-                if category not in summary_dict:
-                    summary_dict[category] = {'count': 0, 'dates': []}
-                summary_dict[category]['count'] += 1
-                summary_dict[category]['dates'].append(post.get('date', ''))
+            category_stats = self.notice_index.get_category_stats()
         
         summary = []
-        for category, data in summary_dict.items():
-            latest_date = max(data['dates']) if data['dates'] else None
+        for category, (count, latest_date) in category_stats.items():
             summary.append(CategorySummary(
                 category=category,
-                count=data['count'],
+                count=count,
                 latest_date=latest_date
             ))
         
         return sorted(summary, key=lambda x: x.count, reverse=True)
 
-    async def search_notices(self, query: str, category: Optional[str] = None, limit: int = 20) -> List[NoticeResponse]:
+    async def search_notices(self, query: str, category: Optional[str] = None, limit: int = 20,
+                             offset: int = 0) -> List[NoticeResponse]:
         """공지사항 검색"""
+        _, results = await self.search_notices_page(query, category, limit, offset)
+        return [NoticeResponse.model_construct(**notice) for notice in results]
+
+    async def search_notices_page(self, query: str, category: Optional[str] = None, limit: int = 20,
+                                  offset: int = 0) -> Tuple[int, List[dict]]:
+        """공지사항 검색 → (전체 결과 수, offset부터 limit개의 결과 - NoticeResponse 필드 dict)
+
+        bi-gram 역색인으로 검색어 단어를 모두 포함하는 게시글을 찾아 점수순으로 정렬한다.
+        검색어가 한 글자 단어로만 이루어져 색인을 쓸 수 없으면 최신순으로 훑으며 부분 문자열을 찾는다.
+        """
         with self.data_lock:
-            data = self.existing_data.copy()
-        
-        # 카테고리 필터링
-        if category:
-            data = [post for post in data if post.get('category') == category]
+            result = self.notice_index.search(query, category or None, offset, limit)
+            if result is None:
+                result = self._scan_notices(query, category or None, offset, limit)
         
-        # 검색어 필터링
+        total, data = result
+        return total, [self._to_response_dict(post) for post in data]
+
+    def _scan_notices(self, query, category=None, offset=0, limit=20):
+        """제목/본문 부분 문자열 검색 (data_lock 보유 상태에서 호출)"""
         query_lower = query.lower()
         filtered_data = []
-        for post in data:
+        for post in self.notice_index.iter_latest(category):
             title = post.get('title', '').lower()
             content = post.get('content', '').lower()
             if query_lower in title or query_lower in content:
                 filtered_data.append(post)
         
-        # 정렬 및 제한
-        filtered_data = sorted(filtered_data, key=lambda x: x.get('date', ''), reverse=True)
-        if limit:
-            filtered_data = filtered_data[:limit]
-        
-        return [NoticeResponse(**post) for post in filtered_data]
+        end = offset + limit if limit else None
+        return len(filtered_data), filtered_data[offset:end]
 
     async def get_latest_notices(self, limit: int = 10) -> List[NoticeResponse]:
         """최신 공지사항 조회"""
         with self.data_lock:
-            data = sorted(self.existing_data, key=lambda x: x.get('date', ''), reverse=True)
+            data = self.notice_index.get_page(limit=limit) if limit else []
         
-        return [NoticeResponse(**post) for post in data[:limit]]
+        return [self._to_response(post) for post in data]
+
+    def _apply_crawl_results(self, new_posts, updated_posts):
+        """새/변경 게시글을 저장하고 기존 데이터에 반영
+
+        저장에 실패하면 예외가 발생하며 메모리 데이터와 크롤링 상태는 반영하지 않으므로
+        다음 크롤링에서 같은 게시글을 다시 새/변경 게시글로 찾는다.
+        저장은 조회 API가 기다리지 않도록 data_lock 밖에서 실행하고, 저장에 성공한 뒤에 data_lock 안에서 반영한다.
+        """
+        self._validate_posts(new_posts + updated_posts)
+        self.save_changes(new_posts + updated_posts)
+        with self.data_lock:
+            if updated_posts:
+                self._merge_updated_posts(updated_posts)
+            # 새로운 데이터를 기존 데이터 앞에 추가
+            self.existing_data = new_posts + self.existing_data
+            self.notice_index.apply(new_posts, updated_posts)
+            self.response_cache.invalidate()
+
+    def _replace_all_data(self, all_data):
+        """전체 크롤링 결과를 저장하고 기존 데이터를 교체 (저장에 실패하면 예외 발생)
+
+        저장, 새 인덱스 생성, 블롭 정리는 data_lock 밖에서 실행하고 (조회 API가 기다리지 않도록)
+        data_lock 안에서는 기존 데이터와 인덱스만 바꾼다. 크롤링은 한 번에 하나만 실행되므로 (crawl_lock)
+        저장 도중 다른 크롤링이 데이터를 바꾸지 않는다.
+        """
+        self._validate_posts(all_data)
+        self.save_data(all_data)
+        notice_index = NoticeIndex(all_data)
+        with self.data_lock:
+            self.existing_data = all_data
+            self.notice_index = notice_index
+            self.response_cache.invalidate()
+        self.content_store.prune(post.get('content_ref') for post in all_data)
+
+    async def _save_crawl_batch(self, batch):
+        """파이프라인 저장 단계 - 새/변경 게시글을 바로 반영하고 (새 게시글 수, 변경 게시글 수) 반환"""
+        new_posts = compact_posts(self.find_new_posts(batch))
+        updated_posts = compact_posts(unique_posts(self.find_updated_posts(batch)))
+        if not (new_posts or updated_posts):
+            return 0, 0
+        
+        # 파일 저장은 이벤트 루프를 막지 않도록 별도 스레드에서 실행
+        await asyncio.to_thread(self._apply_crawl_results, new_posts, updated_posts)
+        
+        # Firebase에 새/변경 게시글 저장
+        if self.firebase_enabled and self.firebase_service.is_initialized():
+            try:
+                firebase_result = await self.firebase_service.sync_notices(
+                    new_posts + updated_posts, self.firebase_ledger, self._load_contents)
+                logging.info(f"Firebase 저장 완료: 성공 {firebase_result['success']}개, 실패 {firebase_result['failed']}개")
+            except Exception as e:
+                logging.error(f"Firebase 저장 실패: {e}")
+        
+        logging.info(f"새로운 게시글 {len(new_posts)}개, 변경된 게시글 {len(updated_posts)}개 저장 완료")
+        return len(new_posts), len(updated_posts)
+
+    def is_crawling(self) -> bool:
+        """크롤링 실행 중인지 확인"""
+        return self.crawl_lock.locked()
+
+    async def _run_exclusive(self, crawl):
+        """다른 크롤링이 실행 중이 아니면 crawl 실행 (실행 중이면 건너뛰고 False 반환)
+
+        크롤링마다 공유하는 대기 중인 상태(워터마크, 목록 페이지 해시, HTTP 캐시 검증자)를
+        다른 크롤링이 반영하거나 버리지 않도록 한다.
+        """
+        if not self.crawl_lock.acquire(blocking=False):
+            logging.warning("이미 크롤링이 실행 중이어서 건너뜁니다.")
+            return False
+        try:
+            await crawl()
+            return True
+        finally:
+            self.crawl_lock.release()
 
     async def crawl_new_posts(self):
-        """새로운 게시글만 크롤링 (백그라운드)"""
+        """새로운 게시글만 크롤링 (백그라운드, 이미 실행 중이면 건너뜀)"""
+        return await self._run_exclusive(self._crawl_new_posts)
+
+    async def _crawl_new_posts(self):
+        """새로운 게시글만 크롤링"""
         self.crawl_status = "running"
         try:
             logging.info("새로운 게시글 확인 시작...")
+            saved_counts = {'new': 0, 'updated': 0}
             
-            # 모든 URL에서 최신 데이터 수집
-            current_data = self.crawl_all_urls(max_pages=self.max_pages, use_threading=True)
+            async def persist(batch):
+                new_count, updated_count = await self._save_crawl_batch(batch)
+                saved_counts['new'] += new_count
+                saved_counts['updated'] += updated_count
             
-            # 새로운 게시글 찾기
-            new_posts = self.find_new_posts(current_data)
+            # 모든 URL에서 최신 데이터 수집 (증분 모드에서는 새/변경 게시글만 상세 조회)
+            # 새/변경 게시글은 다른 게시판의 크롤링이 끝나기를 기다리지 않고 수집되는 대로 저장
+            await self._run_crawl_pipeline(persist, use_threading=True, incremental=self.incremental_crawl)
             
-            if new_posts:
-                # 새로운 데이터를 기존 데이터 앞에 추가
-                with self.data_lock:
-                    self.existing_data = new_posts + self.existing_data
-                    self.save_data()
-                
-                # Firebase에 새 게시글 저장
-                if self.firebase_enabled and self.firebase_service.is_initialized():
-                    try:
-                        firebase_result = await self.firebase_service.save_notices_batch(new_posts)
-                        logging.info(f"Firebase 저장 완료: 성공 {firebase_result['success']}개, 실패 {firebase_result['failed']}개")
-                    except Exception as e:
-                        logging.error(f"Firebase 저장 실패: {e}")
-                
-                logging.info(f"새로운 게시글 {len(new_posts)}개 발견 및 저장 완료")
+            if saved_counts['new'] or saved_counts['updated']:
+                logging.info(f"새로운 게시글 {saved_counts['new']}개, 변경된 게시글 {saved_counts['updated']}개 저장 완료")
             else:
                 logging.info("새로운 게시글이 없습니다.")
             
+            await asyncio.to_thread(self._commit_crawl_state)
+            
             self.crawl_status = "completed"
             self.last_crawl_time = datetime.now().isoformat()
             
@@ -850,22 +1009,27 @@ class CrawlerService:
             self.crawl_status = "error"
 
     async def crawl_all_posts(self):
-        """전체 크롤링 실행 (백그라운드)"""
+        """전체 크롤링 실행 (백그라운드, 이미 실행 중이면 건너뜀)"""
+        return await self._run_exclusive(self._crawl_all_posts)
+
+    async def _crawl_all_posts(self):
+        """전체 크롤링 실행"""
         self.crawl_status = "running"
         try:
             logging.info("전체 크롤링 시작...")
             
-            all_data = self.crawl_all_urls(max_pages=self.max_pages, use_threading=True)
+            # 여러 게시판에 같은 URL의 게시글이 있으면 처음 수집한 것만 저장 (저장소에서 URL은 고유)
+            all_data = compact_posts(unique_posts(await self.crawl_all_urls(max_pages=self.max_pages, use_threading=True)))
             
-            with self.data_lock:
-                self.existing_data = all_data
-                self.save_data()
+            await asyncio.to_thread(self._replace_all_data, all_data)
+            await asyncio.to_thread(self._commit_crawl_state)
             
             # Firebase에 전체 데이터 저장
             if self.firebase_enabled and self.firebase_service.is_initialized():
                 try:
-                    firebase_result = await self.firebase_service.save_notices_batch(all_data)
-                    logging.info(f"Firebase 전체 저장 완료: 성공 {firebase_result['success']}개, 실패 {firebase_result['failed']}개")
+                    firebase_result = await self.firebase_service.sync_notices(all_data, self.firebase_ledger, self._load_contents)
+                    logging.info(f"Firebase 전체 저장 완료: 저장 {firebase_result['pushed']}개, 변경 없음 {firebase_result['skipped']}개, "
+                                 f"실패 {firebase_result['failed']}개")
                 except Exception as e:
                     logging.error(f"Firebase 전체 저장 실패: {e}")
             
@@ -880,14 +1044,21 @@ class CrawlerService:
     async def get_crawl_status(self) -> CrawlStatus:
         """크롤링 상태 조회"""
         with self.data_lock:
-            total_notices = len(self.existing_data)
+            total_notices = len(self.notice_index)
         
         return CrawlStatus(
             status=self.crawl_status,
             message=f"현재 상태: {self.crawl_status}",
             timestamp=datetime.now().isoformat(),
             last_crawl_time=self.last_crawl_time,
-            total_notices=total_notices
+            total_notices=total_notices,
+            http_stats=self.http_stats,
+            http_cache_stats=self.http_cache.get_stats() if self.http_cache else None,
+            last_crawl_stats=self.last_crawl_stats,
+            rate_limit_stats=self.rate_limiter.get_stats(),
+            parse_stats=self.parse_pool.get_stats(),
+            pipeline_stats=self.crawl_pipeline.get_stats() if self.crawl_pipeline else None,
+            response_cache_stats=self.response_cache.get_stats()
         )
     
     def start_scheduler(self):
@@ -917,10 +1088,13 @@ class CrawlerService:
         if not self.firebase_enabled or not self.firebase_service.is_initialized():
             return {"error": "Firebase가 초기화되지 않았거나 비활성화되어 있습니다."}
         
-        return await self.firebase_service.get_collection_stats()
+        with self.data_lock:
+            categories = self.notice_index.get_categories()
+        stats = await self.firebase_service.get_collection_stats(categories)
+        return {**stats, 'sync_ledger': self.firebase_ledger.get_stats()}
     
-    async def sync_to_firebase(self) -> dict:
-        """로컬 데이터를 Firebase에 동기화"""
+    async def sync_to_firebase(self, force: bool = False) -> dict:
+        """로컬 데이터 중 새/변경 게시글을 Firebase에 동기화 (force: 장부를 비우고 전체 저장)"""
         if not self.firebase_enabled or not self.firebase_service.is_initialized():
             return {"error": "Firebase가 초기화되지 않았거나 비활성화되어 있습니다."}
         
@@ -928,15 +1102,17 @@ class CrawlerService:
             data = self.existing_data.copy()
         
         if not data:
-            return {"message": "동기화할 데이터가 없습니다.", "success": 0, "failed": 0}
+            return {"message": "동기화할 데이터가 없습니다.", "success": 0, "failed": 0, "pushed": 0, "skipped": 0}
         
         try:
-            result = await self.firebase_service.save_notices_batch(data)
-            logging.info(f"Firebase 동기화 완료: 성공 {result['success']}개, 실패 {result['failed']}개")
+            if force:
+                await asyncio.to_thread(self.firebase_ledger.clear)
+            result = await self.firebase_service.sync_notices(data, self.firebase_ledger, self._load_contents)
+            logging.info(f"Firebase 동기화 완료: 저장 {result['pushed']}개, 변경 없음 {result['skipped']}개, 실패 {result['failed']}개")
             return result
         except Exception as e:
             logging.error(f"Firebase 동기화 실패: {e}")
-            return {"error": str(e), "success": 0, "failed": len(data)}
+            return {"error": str(e), "success": 0, "failed": len(data), "pushed": 0, "skipped": 0}
     
     async def test_firebase_connection(self) -> dict:
         """Firebase 연결 테스트"""
@@ -1,20 +1,55 @@
+import asyncio
 import firebase_admin
 from firebase_admin import credentials, firestore
+import hashlib
 import json
 import os
 import logging
+import time
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from dotenv import load_dotenv
+from google.api_core.exceptions import (AlreadyExists, Aborted, DeadlineExceeded, InternalServerError,
+                                         InvalidArgument, ResourceExhausted, ServiceUnavailable)
+
+from search_index import ordered_tokens, split_terms
+from sync_ledger import SyncLedger
 
 # .env 파일 로드
 load_dotenv()
 
+# Firestore 배치 쓰기 최대 문서 수
+FIRESTORE_BATCH_LIMIT = 500
+
+# 다시 시도하는 일시적인 Firestore 오류
+FIRESTORE_RETRY_ERRORS = (Aborted, DeadlineExceeded, InternalServerError, ResourceExhausted, ServiceUnavailable)
+
+# 특정 문서 때문에 배치가 실패하는 오류 (문서·요청 크기 초과, 잘못된 필드 값 등) - 배치를 나누어 해당 문서만 골라낸다
+FIRESTORE_DOCUMENT_ERRORS = (InvalidArgument,)
+
+# 목록 조회 시 읽는 필드 (content_html, search_tokens 제외)
+LIST_FIELDS = ['category', 'number', 'title', 'author', 'date', 'attachments', 'views', 'url', 'content',
+               'image_urls', 'crawled_at', 'firebase_created_at', 'firebase_updated_at']
+
+# 검색 - 문서마다 저장하는 bi-gram 최대 수, 서버 필터로 쓸 bi-gram을 고를 때 문서 수를 세어 보는 후보 수,
+# 페이지 크기와 최대 확인 문서 수
+SEARCH_TOKEN_LIMIT = 1000
+SEARCH_TOKEN_CANDIDATES = 3
+SEARCH_PAGE_SIZE = 100
+SEARCH_SCAN_LIMIT = 2000
+
 class FirebaseService:
     def __init__(self):
         """Firebase 서비스 초기화"""
         self.db = None
         self.collection_name = os.getenv('FIREBASE_COLLECTION_NAME', 'notices')
+        # 배치 커밋 동시 실행 수와 재시도 설정
+        self.commit_concurrency = max(1, int(os.getenv('FIREBASE_COMMIT_CONCURRENCY', '4')))
+        self.commit_max_retries = int(os.getenv('FIREBASE_COMMIT_MAX_RETRIES', '3'))
+        self.commit_retry_backoff = float(os.getenv('FIREBASE_COMMIT_RETRY_BACKOFF', '0.5'))
+        # 컬렉션 통계 캐시 (카테고리 목록 → (조회 시각, 통계))
+        self.stats_cache_ttl = float(os.getenv('FIREBASE_STATS_CACHE_TTL', '60'))
+        self._stats_cache: Dict[tuple, tuple] = {}
         self.initialized = False
         
         try:
@@ -27,7 +62,15 @@ class FirebaseService:
         if os.getenv('ENABLE_FIREBASE_SYNC', 'false').lower() != 'true':
             logging.info("Firebase 동기화가 비활성화되어 있습니다.")
             return
-        
+
+        # Firestore 에뮬레이터 (서비스 계정 없이 익명 인증으로 연결)
+        emulator_host = os.getenv('FIRESTORE_EMULATOR_HOST')
+        if emulator_host:
+            self.db = firestore.Client(project=os.getenv('FIREBASE_PROJECT_ID') or 'demo-notices')
+            self.initialized = True
+            logging.info(f"Firestore 에뮬레이터 연결: {emulator_host}")
+            return
+
         # Firebase 설정 정보
         firebase_config = {
             "type": "service_account",
@@ -68,47 +111,59 @@ class FirebaseService:
         """Firebase가 초기화되었는지 확인"""
         return self.initialized and self.db is not None
     
+    def _to_firebase_data(self, notice_data: Dict[str, Any], now: str) -> Dict[str, Any]:
+        """Firebase에 저장할 문서 필드 (firebase_created_at은 새 문서에만 추가)"""
+        return {
+            'category': notice_data.get('category', ''),
+            'number': notice_data.get('number', ''),
+            'title': notice_data.get('title', ''),
+            'author': notice_data.get('author', ''),
+            'date': notice_data.get('date', ''),
+            'attachments': notice_data.get('attachments', ''),
+            'views': notice_data.get('views', ''),
+            'url': notice_data.get('url', ''),
+            'content': notice_data.get('content', ''),
+            'content_html': notice_data.get('content_html', ''),
+            'image_urls': notice_data.get('image_urls', []),
+            'crawled_at': notice_data.get('crawled_at', ''),
+            'search_tokens': self._search_tokens(notice_data),
+            'firebase_updated_at': now
+        }
+    
+    @staticmethod
+    def _search_tokens(notice_data: Dict[str, Any]) -> List[str]:
+        """검색용 bi-gram 배열 (제목 먼저, 최대 SEARCH_TOKEN_LIMIT개)
+        
+        한도를 넘는 긴 본문의 뒷부분에만 나오는 bi-gram은 저장하지 않으므로 서버 검색으로 찾을 수 없다.
+        """
+        text = f"{notice_data.get('title', '')} {notice_data.get('content', '')}"
+        return ordered_tokens(text)[:SEARCH_TOKEN_LIMIT]
+    
     async def save_notice(self, notice_data: Dict[str, Any]) -> Optional[str]:
-        """단일 공지사항을 Firebase에 저장"""
+        """단일 공지사항을 Firebase에 저장
+        
+        먼저 새 문서로 생성(create)을 시도하고, 이미 있으면 firebase_created_at을 유지한 채 병합 저장한다.
+        새 게시글은 쓰기 요청 1회로 끝난다.
+        """
         if not self.is_initialized():
             logging.warning("Firebase가 초기화되지 않았습니다.")
             return None
         
         try:
-            # Firebase에 저장할 데이터 준비
-            firebase_data = {
-                'category': notice_data.get('category', ''),
-                'number': notice_data.get('number', ''),
-                'title': notice_data.get('title', ''),
-                'author': notice_data.get('author', ''),
-                'date': notice_data.get('date', ''),
-                'attachments': notice_data.get('attachments', ''),
-                'views': notice_data.get('views', ''),
-                'url': notice_data.get('url', ''),
-                'content': notice_data.get('content', ''),
-                'content_html': notice_data.get('content_html', ''),
-                'image_urls': notice_data.get('image_urls', []),
-                'crawled_at': notice_data.get('crawled_at', ''),
-                'firebase_created_at': datetime.now().isoformat(),
-                'firebase_updated_at': datetime.now().isoformat()
-            }
+            now = datetime.now().isoformat()
+            firebase_data = self._to_firebase_data(notice_data, now)
             
             # URL을 기반으로 문서 ID 생성 (중복 방지)
             doc_id = self._generate_doc_id(notice_data)
-            
-            # 기존 문서 확인
             doc_ref = self.db.collection(self.collection_name).document(doc_id)
-            existing_doc = doc_ref.get()
             
-            if existing_doc.exists:
-                # 기존 문서가 있으면 업데이트
-                firebase_data['firebase_updated_at'] = datetime.now().isoformat()
-                doc_ref.update(firebase_data)
-                logging.info(f"Firebase 문서 업데이트: {doc_id}")
-            else:
-                # 새 문서 생성
-                doc_ref.set(firebase_data)
+            self._stats_cache.clear()
+            try:
+                doc_ref.create({**firebase_data, 'firebase_created_at': now})
                 logging.info(f"Firebase 새 문서 생성: {doc_id}")
+            except AlreadyExists:
+                doc_ref.set(firebase_data, merge=True)
+                logging.info(f"Firebase 문서 업데이트: {doc_id}")
             
             return doc_id
             
@@ -116,104 +171,177 @@ class FirebaseService:
             logging.error(f"Firebase 저장 실패 ({notice_data.get('title', 'N/A')}): {e}")
             return None
     
-    async def save_notices_batch(self, notices_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """여러 공지사항을 배치로 Firebase에 저장"""
+    def _get_existing_doc_ids(self, doc_refs: List[Any]) -> Set[str]:
+        """여러 문서의 존재 여부를 get_all 한 번으로 확인 (본문은 받지 않도록 필드 마스크 적용)"""
+        snapshots = self.db.get_all(doc_refs, field_paths=['firebase_created_at'])
+        return {snapshot.id for snapshot in snapshots if snapshot.exists}
+    
+    def _commit_entries(self, entries: List[tuple], now: str) -> Set[str]:
+        """기존 문서 확인 후 배치 하나로 커밋 (별도 스레드에서 실행) → 기존 문서 ID 집합"""
+        doc_refs = list({doc_id: doc_ref for doc_id, doc_ref, _, _ in entries}.values())
+        existing_ids = self._get_existing_doc_ids(doc_refs)
+        
+        batch = self.db.batch()
+        for doc_id, doc_ref, firebase_data, _ in entries:
+            if doc_id in existing_ids:
+                batch.set(doc_ref, firebase_data, merge=True)
+            else:
+                batch.set(doc_ref, {**firebase_data, 'firebase_created_at': now})
+        batch.commit()
+        return existing_ids
+    
+    async def _save_entries(self, entries: List[tuple], now: str, ledger: Optional[SyncLedger],
+                            semaphore: asyncio.Semaphore, stats: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """배치 하나를 커밋하고 문서별 결과 반환
+        
+        일시적인 오류(FIRESTORE_RETRY_ERRORS)는 commit_retry_backoff * 2^시도 초 뒤 commit_max_retries회까지 다시 시도한다.
+        배치는 전체가 성공하거나 실패하므로, 문서 단위 오류(FIRESTORE_DOCUMENT_ERRORS)는 배치를 반으로 나누어
+        다시 커밋해 실패한 문서만 골라낸다. 그 밖의 오류(권한, 인증, 프로젝트 설정 등)는 어떤 문서도 저장할 수 없으므로
+        배치 전체를 바로 실패로 처리하고, 아직 커밋하지 않은 배치도 커밋하지 않는다. (stats['fatal_error'])
+        """
+        error = None
+        async with semaphore:
+            for attempt in range(self.commit_max_retries + 1):
+                if stats.get('fatal_error') is not None:
+                    error = stats['fatal_error']
+                    break
+                try:
+                    existing_ids = await asyncio.to_thread(self._commit_entries, entries, now)
+                    self._stats_cache.clear()
+                    error = None
+                    break
+                except FIRESTORE_RETRY_ERRORS as e:
+                    error = e
+                    if attempt >= self.commit_max_retries:
+                        break
+                    stats['retries'] += 1
+                    logging.warning(f"Firebase 배치 커밋 재시도 ({attempt + 1}/{self.commit_max_retries}): {e}")
+                    await asyncio.sleep(self.commit_retry_backoff * (2 ** attempt))
+                except FIRESTORE_DOCUMENT_ERRORS as e:
+                    error = e
+                    break
+                except Exception as e:
+                    error = e
+                    if stats.get('fatal_error') is None:
+                        stats['fatal_error'] = e
+                        logging.error(f"Firebase 배치 커밋 실패, 남은 배치를 커밋하지 않습니다: {e!r}")
+                    break
+        
+        if error is None:
+            if ledger is not None:
+                await asyncio.to_thread(ledger.record, [(doc_id, notice_data) for doc_id, _, _, notice_data in entries])
+            logging.info(f"Firebase 배치 커밋: {len(entries)}개 문서")
+            return [{
+                'doc_id': doc_id,
+                'title': notice_data.get('title', 'N/A')[:50],
+                'status': 'updated' if doc_id in existing_ids else 'created'
+            } for doc_id, _, _, notice_data in entries]
+        
+        if len(entries) > 1 and isinstance(error, FIRESTORE_DOCUMENT_ERRORS):
+            middle = len(entries) // 2
+            halves = await asyncio.gather(self._save_entries(entries[:middle], now, ledger, semaphore, stats),
+                                          self._save_entries(entries[middle:], now, ledger, semaphore, stats))
+            return halves[0] + halves[1]
+        
+        logging.error(f"Firebase 배치 저장 중 오류 ({len(entries)}개 문서): {error}")
+        return [{
+            'doc_id': doc_id,
+            'title': notice_data.get('title', 'N/A')[:50],
+            'status': 'failed',
+            'error': str(error)
+        } for doc_id, _, _, notice_data in entries]
+    
+    async def save_notices_batch(self, notices_data: List[Dict[str, Any]],
+                                 ledger: Optional[SyncLedger] = None) -> Dict[str, Any]:
+        """여러 공지사항을 배치로 Firebase에 저장
+        
+        최대 FIRESTORE_BATCH_LIMIT개씩 나누어, 배치마다 get_all로 기존 문서를 한 번에 확인한 뒤
+        새 문서는 firebase_created_at과 함께 set, 기존 문서는 merge set으로 저장하고 커밋한다.
+        배치 커밋은 스레드에서 최대 commit_concurrency개까지 동시에 실행하고 실패하면 재시도한다. (_save_entries)
+        ledger가 주어지면 커밋한 배치마다 장부에 기록한다.
+        """
         if not self.is_initialized():
             logging.warning("Firebase가 초기화되지 않았습니다.")
             return {'success': 0, 'failed': len(notices_data), 'details': []}
         
-        success_count = 0
-        failed_count = 0
         details = []
+        stats = {'retries': 0, 'fatal_error': None}
+        semaphore = asyncio.Semaphore(self.commit_concurrency)
+        collection_ref = self.db.collection(self.collection_name)
+        now = datetime.now().isoformat()
         
-        # Firestore 배치 작업 사용
-        batch = self.db.batch()
-        batch_count = 0
-        max_batch_size = 500  # Firestore 배치 제한
-        
-        try:
-            for notice_data in notices_data:
+        batches = []
+        for start in range(0, len(notices_data), FIRESTORE_BATCH_LIMIT):
+            entries = []
+            for notice_data in notices_data[start:start + FIRESTORE_BATCH_LIMIT]:
                 try:
-                    firebase_data = {
-                        'category': notice_data.get('category', ''),
-                        'number': notice_data.get('number', ''),
-                        'title': notice_data.get('title', ''),
-                        'author': notice_data.get('author', ''),
-                        'date': notice_data.get('date', ''),
-                        'attachments': notice_data.get('attachments', ''),
-                        'views': notice_data.get('views', ''),
-                        'url': notice_data.get('url', ''),
-                        'content': notice_data.get('content', ''),
-                        'content_html': notice_data.get('content_html', ''),
-                        'image_urls': notice_data.get('image_urls', []),
-                        'crawled_at': notice_data.get('crawled_at', ''),
-                        'firebase_created_at': datetime.now().isoformat(),
-                        'firebase_updated_at': datetime.now().isoformat()
-                    }
-                    
                     doc_id = self._generate_doc_id(notice_data)
-                    doc_ref = self.db.collection(self.collection_name).document(doc_id)
-                    
-                    # 기존 문서 확인
-                    existing_doc = doc_ref.get()
-                    if existing_doc.exists:
-                        firebase_data['firebase_updated_at'] = datetime.now().isoformat()
-                        batch.update(doc_ref, firebase_data)
-                    else:
-                        batch.set(doc_ref, firebase_data)
-                    
-                    batch_count += 1
-                    details.append({
-                        'doc_id': doc_id,
-                        'title': notice_data.get('title', 'N/A')[:50],
-                        'status': 'pending'
-                    })
-                    
-                    # 배치 크기 제한 체크
-                    if batch_count >= max_batch_size:
-                        batch.commit()
-                        logging.info(f"Firebase 배치 커밋: {batch_count}개 문서")
-                        batch = self.db.batch()
-                        batch_count = 0
-                        
+                    entries.append((doc_id, collection_ref.document(doc_id), self._to_firebase_data(notice_data, now),
+                                    notice_data))
                 except Exception as e:
                     logging.error(f"배치 처리 중 오류 ({notice_data.get('title', 'N/A')}): {e}")
-                    failed_count += 1
                     details.append({
                         'title': notice_data.get('title', 'N/A')[:50],
                         'status': 'failed',
                         'error': str(e)
                     })
-            
-            # 남은 배치 커밋
-            if batch_count > 0:
-                batch.commit()
-                logging.info(f"Firebase 최종 배치 커밋: {batch_count}개 문서")
-            
-            success_count = len(notices_data) - failed_count
-            
-            logging.info(f"Firebase 배치 저장 완료: 성공 {success_count}개, 실패 {failed_count}개")
-            
-        except Exception as e:
-            logging.error(f"Firebase 배치 저장 중 오류: {e}")
-            failed_count = len(notices_data)
-            success_count = 0
+            if entries:
+                batches.append(self._save_entries(entries, now, ledger, semaphore, stats))
+        
+        for batch_details in await asyncio.gather(*batches):
+            details.extend(batch_details)
+        
+        failed_count = sum(1 for detail in details if detail['status'] == 'failed')
+        success_count = len(details) - failed_count
+        logging.info(f"Firebase 배치 저장 완료: 성공 {success_count}개, 실패 {failed_count}개, 재시도 {stats['retries']}회")
         
         return {
             'success': success_count,
             'failed': failed_count,
             'total': len(notices_data),
+            'retries': stats['retries'],
             'details': details
         }
     
+    async def sync_notices(self, notices_data: List[Dict[str, Any]], ledger: SyncLedger,
+                           prepare: Optional[Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
+        """동기화 장부와 비교하여 새/변경 게시글만 저장
+        
+        prepare: 저장할 게시글만 변환하는 함수 (HTML 본문 채우기 등, 별도 스레드에서 실행)
+        결과에는 save_notices_batch 결과와 함께 저장한 수(pushed)와 건너뛴 수(skipped)가 들어간다.
+        """
+        def get_pending():
+            documents = [(self._generate_doc_id(notice_data), notice_data) for notice_data in notices_data]
+            return [notice_data for _, notice_data in ledger.get_pending(documents)]
+        
+        # 게시글 해시 계산은 이벤트 루프를 막지 않도록 별도 스레드에서 실행
+        pending = await asyncio.to_thread(get_pending)
+        skipped = len(notices_data) - len(pending)
+        
+        if pending:
+            if prepare:
+                pending = await asyncio.to_thread(prepare, pending)
+            result = await self.save_notices_batch(pending, ledger)
+            # 장부 파일 다시 쓰기는 이벤트 루프를 막지 않도록 별도 스레드에서 실행
+            await asyncio.to_thread(ledger.compact)
+        else:
+            result = {'success': 0, 'failed': 0, 'details': []}
+        
+        logging.info(f"Firebase 동기화: 저장 {result['success']}개, 변경 없음 {skipped}개, 실패 {result['failed']}개")
+        return {**result, 'total': len(notices_data), 'pushed': result['success'], 'skipped': skipped}
+    
     def _generate_doc_id(self, notice_data: Dict[str, Any]) -> str:
-        """공지사항 데이터를 기반으로 고유 문서 ID 생성"""
+        """공지사항 데이터를 기반으로 고유 문서 ID 생성
+        
+        hash()는 프로세스마다 값이 달라지므로 URL(없으면 카테고리+번호)의 SHA-1을 사용해
+        다시 실행해도 같은 게시글은 같은 문서에 저장되도록 한다.
+        """
         category = notice_data.get('category', 'unknown')
         number = notice_data.get('number', '0')
         url = notice_data.get('url', '')
         
         # URL 해시를 사용하여 고유 ID 생성
-        url_hash = str(abs(hash(url))) if url else str(abs(hash(category + number)))
+        url_hash = hashlib.sha1((url or category + number).encode('utf-8')).hexdigest()[:16]
         return f"{category}_{number}_{url_hash}"
     
     async def get_notice_by_id(self, doc_id: str) -> Optional[Dict[str, Any]]:
@@ -227,6 +355,7 @@ class FirebaseService:
             
             if doc.exists:
                 data = doc.to_dict()
+                data.pop('search_tokens', None)
                 data['id'] = doc_id
                 return data
             return None
@@ -235,135 +364,191 @@ class FirebaseService:
             logging.error(f"Firebase 문서 조회 실패 ({doc_id}): {e}")
             return None
     
-    async def search_notices(self, query: str, category: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
-        """Firebase에서 공지사항 검색"""
-        if not self.is_initialized():
-            return []
+    def _list_query(self, category: Optional[str] = None):
+        """목록 조회 쿼리 - 최신순, 목록 필드만 읽음 (content_html, search_tokens 제외)"""
+        query = self.db.collection(self.collection_name)
+        if category:
+            query = query.where('category', '==', category)
+        return query.order_by('firebase_created_at', direction=firestore.Query.DESCENDING).select(LIST_FIELDS)
+    
+    def _start_after(self, query, start_after: Optional[str]):
+        """start_after(이전 페이지 마지막 문서 ID) 다음부터 조회하도록 커서 적용
+        
+        커서 문서는 정렬 필드(firebase_created_at)만 읽는다. 문서가 삭제되었으면 처음부터 조회한다.
+        """
+        if start_after:
+            snapshot = self.db.collection(self.collection_name).document(start_after).get(field_paths=['firebase_created_at'])
+            if snapshot.exists:
+                return query.start_after(snapshot)
+        return query
+    
+    @staticmethod
+    def _to_result(doc) -> Dict[str, Any]:
+        data = doc.to_dict()
+        data['id'] = doc.id
+        return data
+    
+    def _fetch_page(self, query, limit: Optional[int], start_after: Optional[str]) -> List[Dict[str, Any]]:
+        """쿼리 한 페이지 조회 (별도 스레드에서 실행)"""
+        query = self._start_after(query, start_after)
+        if limit:
+            query = query.limit(limit)
+        return [self._to_result(doc) for doc in query.stream()]
+    
+    def _select_token(self, terms: List[str]) -> Optional[str]:
+        """서버 필터(array_contains)로 쓸 bi-gram 선택
+        
+        긴 단어의 bi-gram부터 SEARCH_TOKEN_CANDIDATES개를 골라 count 집계로 포함 문서 수를 세고,
+        가장 적은 bi-gram을 반환한다. 집계에 실패하면 첫 후보를 쓴다. 두 글자 이상인 단어가 없으면 None.
+        """
+        candidates = list(dict.fromkeys(token for term in sorted(terms, key=len, reverse=True)
+                                        for token in ordered_tokens(term)))[:SEARCH_TOKEN_CANDIDATES]
+        if len(candidates) <= 1:
+            return candidates[0] if candidates else None
         
+        collection_ref = self.db.collection(self.collection_name)
         try:
-            collection_ref = self.db.collection(self.collection_name)
-            
-            # 카테고리 필터
-            if category:
-                collection_ref = collection_ref.where('category', '==', category)
-            
-            # 최신순 정렬
-            collection_ref = collection_ref.order_by('firebase_created_at', direction=firestore.Query.DESCENDING)
-            
-            # 제한
-            if limit:
-                collection_ref = collection_ref.limit(limit)
-            
-            docs = collection_ref.stream()
-            results = []
-            
+            counts = [collection_ref.where('search_tokens', 'array_contains', token).count().get()[0][0].value
+                      for token in candidates]
+        except Exception as e:
+            logging.warning(f"Firebase 검색 bi-gram 문서 수 집계 실패: {e}")
+            return candidates[0]
+        return min(zip(counts, candidates))[1]
+    
+    def _search(self, query: str, category: Optional[str], limit: int,
+                start_after: Optional[str]) -> Tuple[List[Dict[str, Any]], bool]:
+        """검색 (별도 스레드에서 실행) → (결과, 잘림 여부)
+        
+        가장 드문 검색어 bi-gram 하나를 포함하는 문서만 array_contains로 서버에서 거른 뒤 (_select_token),
+        검색어 단어가 모두 제목이나 본문에 있는 문서만 남긴다. (로컬 검색과 같은 기준)
+        결과가 limit개가 될 때까지 SEARCH_PAGE_SIZE개씩 이어서 조회하며, 최대 SEARCH_SCAN_LIMIT개까지만 확인한다.
+        limit개를 채우기 전에 확인할 문서가 남은 채로 한도에 이르면 잘림 여부가 True이다.
+        두 글자 이상인 단어가 없으면 서버 필터 없이 최신 문서를 확인한다.
+        """
+        terms = split_terms(query)
+        token = self._select_token(terms)
+        base_query = self._list_query(category)
+        if token:
+            base_query = base_query.where('search_tokens', 'array_contains', token)
+        
+        results = []
+        page_query = self._start_after(base_query, start_after)
+        scanned = 0
+        while scanned < SEARCH_SCAN_LIMIT:
+            docs = list(page_query.limit(SEARCH_PAGE_SIZE).stream())
+            scanned += len(docs)
             for doc in docs:
-                data = doc.to_dict()
-                data['id'] = doc.id
-                
-                # 검색어 필터링 (제목과 내용에서 검색)
+                data = self._to_result(doc)
                 title = data.get('title', '').lower()
                 content = data.get('content', '').lower()
-                query_lower = query.lower()
-                
-                if query_lower in title or query_lower in content:
+                if all(term in title or term in content for term in terms):
                     results.append(data)
-            
-            return results
-            
+                    if len(results) >= limit:
+                        return results, False
+            if len(docs) < SEARCH_PAGE_SIZE:
+                return results, False
+            page_query = base_query.start_after(docs[-1])
+        return results, True
+    
+    async def search_notices_page(self, query: str, category: Optional[str] = None, limit: int = 20,
+                                  start_after: Optional[str] = None) -> Tuple[List[Dict[str, Any]], bool]:
+        """Firebase에서 공지사항 검색 → (결과, 잘림 여부) (start_after: 이전 페이지 마지막 결과의 id)
+        
+        잘림 여부가 True이면 SEARCH_SCAN_LIMIT개까지만 확인해 조건에 맞는 문서 중 일부만 반환한 것이다.
+        """
+        if not self.is_initialized():
+            return [], False
+        
+        try:
+            return await asyncio.to_thread(self._search, query, category, limit, start_after)
         except Exception as e:
             logging.error(f"Firebase 검색 실패: {e}")
-            return []
+            return [], False
+    
+    async def search_notices(self, query: str, category: Optional[str] = None, limit: int = 20,
+                             start_after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Firebase에서 공지사항 검색 (start_after: 이전 페이지 마지막 결과의 id)"""
+        results, truncated = await self.search_notices_page(query, category, limit, start_after)
+        if truncated:
+            logging.warning(f"Firebase 검색 결과가 잘렸습니다 ('{query}': 문서 {SEARCH_SCAN_LIMIT}개 확인, "
+                            f"결과 {len(results)}개)")
+        return results
     
-    async def get_notices_by_category(self, category: str, limit: int = 20) -> List[Dict[str, Any]]:
-        """Firebase에서 카테고리별 공지사항 조회"""
+    async def get_notices_by_category(self, category: str, limit: int = 20,
+                                      start_after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Firebase에서 카테고리별 공지사항 조회 (start_after: 이전 페이지 마지막 결과의 id)"""
         if not self.is_initialized():
             return []
         
         try:
-            collection_ref = self.db.collection(self.collection_name)
-            collection_ref = collection_ref.where('category', '==', category)
-            collection_ref = collection_ref.order_by('firebase_created_at', direction=firestore.Query.DESCENDING)
-            
-            if limit:
-                collection_ref = collection_ref.limit(limit)
-            
-            docs = collection_ref.stream()
-            results = []
-            
-            for doc in docs:
-                data = doc.to_dict()
-                data['id'] = doc.id
-                results.append(data)
-            
-            return results
-            
+            return await asyncio.to_thread(self._fetch_page, self._list_query(category), limit, start_after)
         except Exception as e:
             logging.error(f"Firebase 카테고리 조회 실패 ({category}): {e}")
             return []
     
-    async def get_latest_notices(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Firebase에서 최신 공지사항 조회"""
+    async def get_latest_notices(self, limit: int = 10, start_after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Firebase에서 최신 공지사항 조회 (start_after: 이전 페이지 마지막 결과의 id)"""
         if not self.is_initialized():
             return []
         
         try:
-            collection_ref = self.db.collection(self.collection_name)
-            collection_ref = collection_ref.order_by('firebase_created_at', direction=firestore.Query.DESCENDING)
-            collection_ref = collection_ref.limit(limit)
-            
-            docs = collection_ref.stream()
-            results = []
-            
-            for doc in docs:
-                data = doc.to_dict()
-                data['id'] = doc.id
-                results.append(data)
-            
-            return results
-            
+            return await asyncio.to_thread(self._fetch_page, self._list_query(), limit, start_after)
         except Exception as e:
             logging.error(f"Firebase 최신 공지사항 조회 실패: {e}")
             return []
     
-    async def get_collection_stats(self) -> Dict[str, Any]:
-        """Firebase 컬렉션 통계 정보 조회"""
+    def _count_documents(self, category: Optional[str] = None) -> int:
+        """count() 집계 쿼리로 문서 수 조회 (문서를 읽지 않음)"""
+        query = self.db.collection(self.collection_name)
+        if category is not None:
+            query = query.where('category', '==', category)
+        return int(query.count(alias='count').get()[0][0].value)
+    
+    def _get_latest_update(self) -> Optional[str]:
+        """가장 최근 firebase_updated_at (필드 마스크로 해당 필드만 읽음)"""
+        docs = self.db.collection(self.collection_name)\
+            .order_by('firebase_updated_at', direction=firestore.Query.DESCENDING)\
+            .select(['firebase_updated_at'])\
+            .limit(1)\
+            .stream()
+        for doc in docs:
+            return doc.to_dict().get('firebase_updated_at')
+        return None
+    
+    async def get_collection_stats(self, categories: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Firebase 컬렉션 통계 정보 조회
+        
+        전체 및 카테고리별 문서 수는 count() 집계 쿼리로 구하므로 컬렉션 크기와 관계없이
+        (카테고리 수 + 2)번의 요청으로 끝난다. categories를 주지 않으면 전체 문서 수만 구하며,
+        카테고리별 합계와 전체 문서 수의 차이는 other_documents로 반환한다.
+        결과는 stats_cache_ttl초 동안 캐시하고, 문서를 저장하면 비운다.
+        """
         if not self.is_initialized():
             return {}
         
+        cache_key = tuple(sorted(categories or []))
+        cached = self._stats_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.stats_cache_ttl:
+            return cached[1]
+        
         try:
-            # 전체 문서 수
-            total_docs = len(list(self.db.collection(self.collection_name).stream()))
-            
-            # 카테고리별 통계
-            categories = {}
-            docs = self.db.collection(self.collection_name).stream()
-            
-            for doc in docs:
-                data = doc.to_dict()
-                category = data.get('category', 'Unknown')
-                if category not in categories:
-                    categories[category] = 0
-                categories[category] += 1
-            
-            # 최근 업데이트 시간
-            latest_doc = self.db.collection(self.collection_name)\
-                .order_by('firebase_updated_at', direction=firestore.Query.DESCENDING)\
-                .limit(1)\
-                .stream()
-            
-            latest_update = None
-            for doc in latest_doc:
-                data = doc.to_dict()
-                latest_update = data.get('firebase_updated_at')
-                break
-            
-            return {
+            # 집계 쿼리를 동시에 실행
+            total_docs, latest_update, *category_counts = await asyncio.gather(
+                asyncio.to_thread(self._count_documents),
+                asyncio.to_thread(self._get_latest_update),
+                *(asyncio.to_thread(self._count_documents, category) for category in cache_key)
+            )
+            category_stats = {category: count for category, count in zip(cache_key, category_counts) if count}
+            
+            stats = {
                 'total_documents': total_docs,
-                'categories': categories,
+                'categories': category_stats,
+                'other_documents': max(total_docs - sum(category_stats.values()), 0),
                 'latest_update': latest_update,
                 'collection_name': self.collection_name
             }
+            self._stats_cache[cache_key] = (time.monotonic(), stats)
+            return stats
             
         except Exception as e:
             logging.error(f"Firebase 통계 조회 실패: {e}")
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from threading import Lock
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+
+class ValidatorCache:
+    """ETag / Last-Modified 기반 조건부 요청용 디스크 캐시
+
+    URL + 파라미터마다 검증자(ETag, Last-Modified)와 본문 해시를 저장한다.
+    크롤링 중 받은 값은 pending에 모아 두었다가 데이터 저장이 끝난 뒤 commit()으로 반영하여,
+    저장에 실패한 크롤링의 응답 때문에 다음 크롤링이 변경을 놓치지 않도록 한다.
+    """
+
+    def __init__(self, cache_file: str):
+        self.cache_file = cache_file
+        self.entries: Dict[str, dict] = self._load()
+        self.pending: Dict[str, dict] = {}
+        self.lock = Lock()
+        self.stats = {'not_modified': 0, 'unchanged_body': 0, 'misses': 0, 'bytes_saved': 0}
+
+    def _load(self) -> Dict[str, dict]:
+        """캐시 파일 로드"""
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                logging.error(f"HTTP 캐시 로드 실패: {e}")
+        return {}
+
+    @staticmethod
+    def make_key(url: str, params: Optional[dict] = None) -> str:
+        """URL과 파라미터로 캐시 키 생성"""
+        if not params:
+            return url
+        return f"{url}{'&' if '?' in url else '?'}{urlencode(sorted(params.items()))}"
+
+    def get_conditional_headers(self, key: str) -> Dict[str, str]:
+        """저장된 검증자로 조건부 요청 헤더 생성"""
+        with self.lock:
+            entry = self.entries.get(key)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def record_not_modified(self, key: str):
+        """304 응답 기록"""
+        with self.lock:
+            entry = self.entries.get(key, {})
+            self.stats['not_modified'] += 1
+            self.stats['bytes_saved'] += entry.get('length', 0)
+
+    def record_response(self, key: str, headers, body: bytes, count: bool = True) -> bool:
+        """200 응답의 검증자와 본문 해시 기록 - 본문이 이전과 같으면 True"""
+        body_hash = hashlib.sha256(body).hexdigest()
+        with self.lock:
+            previous = self.entries.get(key)
+            unchanged = bool(previous) and previous.get('sha256') == body_hash
+            self.pending[key] = {
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified'),
+                'sha256': body_hash,
+                'length': len(body),
+                'checked_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+            if count:
+                self.stats['unchanged_body' if unchanged else 'misses'] += 1
+        return unchanged
+
+    def discard_pending(self):
+        """반영하지 않은 응답 기록 폐기"""
+        with self.lock:
+            self.pending = {}
+
+    def commit(self):
+        """크롤링 중 받은 검증자를 반영하고 파일로 저장"""
+        with self.lock:
+            if not self.pending:
+                return
+            self.entries.update(self.pending)
+            self.pending = {}
+            entries = dict(self.entries)
+
+        try:
+            temp_file = f"{self.cache_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(temp_file, self.cache_file)
+        except Exception as e:
+            logging.error(f"HTTP 캐시 저장 실패: {e}")
+
+    def get_stats(self) -> dict:
+        """캐시 적중/미적중 통계 반환"""
+        with self.lock:
+            return {**self.stats, 'entries': len(self.entries)}
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from rate_limiter import HostRateLimiter
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# 재시도할 응답 상태 코드
+RETRY_STATUS_CODES = {500, 502, 503, 504}
+
+
+class AsyncHttpClient:
+    """호스트별 keep-alive 연결 풀을 사용하는 비동기 HTTP 클라이언트
+
+    호스트(URL의 netloc, 예: csai.jbnu.ac.kr)마다 별도의 httpx.AsyncClient를 두어
+    연결 풀 크기, keep-alive, 재시도, 타임아웃을 적용하고 연결 재사용 횟수를 집계한다.
+    rate_limiter가 주어지면 모든 요청(재시도 포함) 전에 호스트별 토큰을 받는다.
+    이벤트 루프마다 새로 만들어 `async with`로 사용한다.
+    (스케줄러는 실행할 때마다 asyncio.run으로 새 루프를 만든다)
+    """
+
+    def __init__(self, max_concurrency_per_host: int = 4, timeout: float = 10,
+                 verify_ssl: bool = False, user_agent: str = DEFAULT_USER_AGENT,
+                 max_connections_per_host: int = 4, max_keepalive_connections: int = 4,
+                 keepalive_expiry: float = 30, connect_timeout: Optional[float] = None,
+                 max_retries: int = 2, retry_backoff: float = 0.5,
+                 rate_limiter: Optional[HostRateLimiter] = None):
+        self.max_concurrency_per_host = max(1, max_concurrency_per_host)
+        self.timeout = timeout
+        self.verify_ssl = verify_ssl
+        self.user_agent = user_agent
+        self.max_connections_per_host = max(1, max_connections_per_host)
+        self.max_keepalive_connections = max(0, max_keepalive_connections)
+        self.keepalive_expiry = keepalive_expiry
+        self.connect_timeout = connect_timeout or timeout
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = retry_backoff
+        self.rate_limiter = rate_limiter
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._closed = True
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    async def __aenter__(self):
+        self._closed = False
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """호스트별 연결 풀 정리"""
+        self._closed = True
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients = {}
+
+    def _get_client(self, host: str) -> httpx.AsyncClient:
+        """호스트별 연결 풀(AsyncClient) 반환"""
+        if host not in self._clients:
+            self._clients[host] = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections_per_host,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry
+                ),
+                # 연결 실패도 get()의 재시도 루프에서만 다시 시도 (재시도마다 속도 제한 적용)
+                transport=httpx.AsyncHTTPTransport(verify=self.verify_ssl),
+                follow_redirects=True,
+                headers={'User-Agent': self.user_agent}
+            )
+            self.stats[host] = {'requests': 0, 'new_connections': 0, 'reused_connections': 0, 'retries': 0, 'errors': 0}
+        return self._clients[host]
+
+    def _get_semaphore(self, host: str) -> asyncio.Semaphore:
+        """호스트별 세마포어 반환"""
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.max_concurrency_per_host)
+        return self._semaphores[host]
+
+    async def get(self, url: str, params: Optional[dict] = None,
+                  headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """GET 요청 (호스트별 연결 풀 사용, 5xx/네트워크 오류 시 재시도)"""
+        if self._closed:
+            raise RuntimeError("AsyncHttpClient는 async with 블록 안에서 사용해야 합니다.")
+
+        host = urlparse(url).netloc
+        client = self._get_client(host)
+        stats = self.stats[host]
+
+        async with self._get_semaphore(host):
+            for attempt in range(self.max_retries + 1):
+                new_connection = False
+
+                async def trace(event_name, info):
+                    nonlocal new_connection
+                    if event_name == 'connection.connect_tcp.complete':
+                        new_connection = True
+
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire_async(host)
+
+                started_at = time.monotonic()
+                try:
+                    logging.debug(f"GET {url} {params or ''}")
+                    response = await client.get(url, params=params, headers=headers, extensions={'trace': trace})
+                except httpx.TransportError:
+                    stats['errors'] += 1
+                    if self.rate_limiter:
+                        self.rate_limiter.record_response(host, None, time.monotonic() - started_at)
+                    if attempt >= self.max_retries:
+                        raise
+                else:
+                    if self.rate_limiter:
+                        self.rate_limiter.record_response(host, response.status_code, time.monotonic() - started_at,
+                                                          response.headers.get('Retry-After'))
+                    stats['requests'] += 1
+                    stats['new_connections' if new_connection else 'reused_connections'] += 1
+                    if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                        return response
+
+                stats['retries'] += 1
+                await asyncio.sleep(self.retry_backoff * (2 ** attempt))
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """호스트별 요청/연결 재사용 통계 반환"""
+        return {host: dict(host_stats) for host, host_stats in self.stats.items()}
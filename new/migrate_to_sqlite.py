@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+JSON 데이터 파일을 SQLite 저장소로 이전하는 스크립트
+
+사용법:
+    python migrate_to_sqlite.py [JSON 파일] [DB 파일]
+    python migrate_to_sqlite.py notices_data.json notices_data.db
+    python migrate_to_sqlite.py ../multi_notices_data.json multi_notices_data.db
+"""
+import os
+import sys
+
+from storage import SqliteNoticeStorage, migrate_json_to_sqlite
+
+
+def main():
+    json_file = sys.argv[1] if len(sys.argv) > 1 else 'notices_data.json'
+    db_file = sys.argv[2] if len(sys.argv) > 2 else f"{os.path.splitext(json_file)[0]}.db"
+
+    if not os.path.exists(json_file):
+        print(f"❌ {json_file} 파일을 찾을 수 없습니다")
+        print(__doc__)
+        sys.exit(1)
+
+    storage = SqliteNoticeStorage(db_file)
+    existing_count = storage.count()
+    if existing_count:
+        print(f"⚠️  {db_file}에 이미 {existing_count}개 게시글이 있습니다. {json_file}의 내용으로 교체합니다.")
+
+    count = migrate_json_to_sqlite(json_file, storage)
+    print(f"✅ {json_file} → {db_file}: {count}개 게시글 이전 완료 (저장된 게시글 {storage.count()}개)")
+    storage.close()
+
+
+if __name__ == "__main__":
+    main()
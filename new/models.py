@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 class NoticeResponse(BaseModel):
@@ -14,10 +14,23 @@ class NoticeResponse(BaseModel):
     views: str
     url: str
     content: str
-    content_html: str
+    content_html: str = ""  # 목록/검색 응답에서는 비어 있고 /notices/{notice_id}에서만 채움
     image_urls: List[str]
     crawled_at: str
 
+class NoticeSummary(BaseModel):
+    """목록 화면용 공지사항 요약 모델 (본문 제외)"""
+    id: str
+    category: str
+    number: str
+    title: str
+    author: str
+    date: str
+    attachments: str
+    views: str
+    url: str
+    crawled_at: str
+
 class CrawlStatus(BaseModel):
     """크롤링 상태 모델"""
     status: str  # "idle", "running", "completed", "error"
@@ -25,6 +38,13 @@ class CrawlStatus(BaseModel):
     timestamp: str
     last_crawl_time: Optional[str] = None
     total_notices: Optional[int] = None
+    http_stats: Optional[Dict[str, Dict[str, int]]] = None  # 호스트별 요청/연결 재사용 통계
+    http_cache_stats: Optional[Dict[str, int]] = None  # 조건부 요청 캐시 적중/미적중/절약 바이트
+    last_crawl_stats: Optional[Dict[str, Dict[str, int]]] = None  # 마지막 크롤링의 카테고리별 파싱/생략 페이지 수
+    rate_limit_stats: Optional[Dict[str, Dict[str, float]]] = None  # 호스트별 요청 속도 제한 통계
+    parse_stats: Optional[Dict[str, int]] = None  # 파싱 프로세스 풀 작업 수
+    pipeline_stats: Optional[Dict[str, Dict[str, float]]] = None  # 크롤링 파이프라인 단계별 처리량/큐 길이
+    response_cache_stats: Optional[Dict[str, int]] = None  # 조회 API 응답 캐시 적중/미적중/304 응답 수, 데이터 세대
 
 class CategorySummary(BaseModel):
     """카테고리별 요약 모델"""
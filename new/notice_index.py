@@ -0,0 +1,220 @@
+import base64
+import json
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from search_index import SearchIndex
+
+
+def encode_cursor(date: str, notice_id: str, seq: Optional[int] = None) -> str:
+    """페이지 마지막 게시글의 (날짜, id)로 다음 페이지 커서 생성 (seq: 같은 (날짜, id)가 여러 개일 때 구분용)"""
+    data = json.dumps([date, notice_id, seq], ensure_ascii=False)
+    return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str, Optional[int]]:
+    """커서를 (날짜, id, seq)로 변환 (잘못된 커서는 ValueError)"""
+    try:
+        date, notice_id, seq = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except Exception:
+        raise ValueError(f"잘못된 커서입니다: {cursor}")
+    if not isinstance(date, str) or not isinstance(notice_id, str) or not (seq is None or isinstance(seq, int)):
+        raise ValueError(f"잘못된 커서입니다: {cursor}")
+    return date, notice_id, seq
+
+
+class _DateSortedList:
+    """(date, seq) 오름차순으로 유지하는 게시글 목록 (읽을 때는 뒤에서부터 = 최신순)"""
+
+    def __init__(self, entries: Optional[List[Tuple[Tuple[str, int], dict]]] = None):
+        entries = sorted(entries or [], key=lambda entry: entry[0])
+        self.keys: List[Tuple[str, int]] = [key for key, _ in entries]
+        self.posts: List[dict] = [post for _, post in entries]
+
+    def add(self, key: Tuple[str, int], post: dict):
+        index = bisect_left(self.keys, key)
+        self.keys.insert(index, key)
+        self.posts.insert(index, post)
+
+    def remove(self, key: Tuple[str, int]):
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            del self.keys[index]
+            del self.posts[index]
+
+    def page(self, offset: int = 0, limit: Optional[int] = None) -> List[dict]:
+        """최신순으로 offset부터 limit개 반환"""
+        end = max(len(self.posts) - offset, 0)
+        start = max(end - limit, 0) if limit else 0
+        return self.posts[start:end][::-1]
+
+    def page_before(self, key: Tuple[str, int], limit: Optional[int] = None) -> List[dict]:
+        """key보다 오래된 게시글을 최신순으로 limit개 반환"""
+        end = bisect_left(self.keys, key)
+        start = max(end - limit, 0) if limit else 0
+        return self.posts[start:end][::-1]
+
+    def iter_latest(self) -> Iterator[dict]:
+        """최신순 순회"""
+        return reversed(self.posts)
+
+    def latest_date(self) -> Optional[str]:
+        return self.keys[-1][0] if self.keys else None
+
+    def __len__(self):
+        return len(self.posts)
+
+
+class NoticeIndex:
+    """조회 API용 게시글 인덱스
+
+    existing_data(새 게시글이 앞)의 각 게시글에 삽입 순서(seq)를 붙여
+    id/url → 게시글, 전체 및 카테고리별 날짜순 목록, 카테고리별 게시글 수와 최신 날짜,
+    검색용 bi-gram 역색인(search_index)을 유지한다.
+    날짜가 같으면 existing_data에서 앞선 게시글이 먼저 오므로 기존의 sorted(..., reverse=True) 결과와 같다.
+    크롤링 결과는 apply()로 바뀐 게시글만 반영한다. (호출자가 data_lock 보유)
+    """
+
+    def __init__(self, posts: Optional[List[dict]] = None):
+        self.rebuild(posts or [])
+
+    def rebuild(self, posts: List[dict]):
+        """전체 게시글로 인덱스 다시 생성"""
+        self.next_seq = 0
+        self.posts_by_seq: Dict[int, dict] = {}
+        self.seqs_by_id: Dict[str, List[int]] = {}
+        self.seqs_by_url: Dict[str, List[int]] = {}
+        self.search_index = SearchIndex()
+        self.search_doc_ids: Dict[int, int] = {}
+        entries_by_category: Dict[str, list] = {}
+        for post in reversed(posts):
+            seq = self._take_seq()
+            self._add_to_maps(seq, post)
+            entries_by_category.setdefault(post.get('category', 'Unknown'), []).append((self._key(seq, post), post))
+        # 정렬된 목록은 한 번에 정렬하여 생성
+        self.all_posts = _DateSortedList([entry for entries in entries_by_category.values() for entry in entries])
+        self.by_category: Dict[str, _DateSortedList] = {
+            category: _DateSortedList(entries) for category, entries in entries_by_category.items()
+        }
+
+    def _take_seq(self) -> int:
+        seq = self.next_seq
+        self.next_seq += 1
+        return seq
+
+    @staticmethod
+    def _key(seq: int, post: dict) -> Tuple[str, int]:
+        return post.get('date', ''), seq
+
+    def _add_to_maps(self, seq: int, post: dict):
+        self.posts_by_seq[seq] = post
+        self.search_doc_ids[seq] = self.search_index.add(post)
+        self.seqs_by_id.setdefault(post.get('id'), []).append(seq)
+        if post.get('url'):
+            self.seqs_by_url.setdefault(post['url'], []).append(seq)
+
+    def _add(self, seq: int, post: dict):
+        key = self._key(seq, post)
+        self._add_to_maps(seq, post)
+        self.all_posts.add(key, post)
+        self.by_category.setdefault(post.get('category', 'Unknown'), _DateSortedList()).add(key, post)
+
+    def _remove(self, seq: int):
+        post = self.posts_by_seq.pop(seq)
+        key = self._key(seq, post)
+        self.search_index.remove(self.search_doc_ids.pop(seq))
+        self._discard_seq(self.seqs_by_id, post.get('id'), seq)
+        if post.get('url'):
+            self._discard_seq(self.seqs_by_url, post['url'], seq)
+        self.all_posts.remove(key)
+        category = post.get('category', 'Unknown')
+        self.by_category[category].remove(key)
+        if not self.by_category[category]:
+            del self.by_category[category]
+
+    @staticmethod
+    def _discard_seq(seqs_by_value: Dict[str, List[int]], value: str, seq: int):
+        seqs = seqs_by_value[value]
+        seqs.remove(seq)
+        if not seqs:
+            del seqs_by_value[value]
+
+    def apply(self, new_posts: List[dict], updated_posts: List[dict]):
+        """URL이 같은 기존 게시글을 변경 게시글로 교체하고 새 게시글을 앞에 추가 (existing_data 병합과 동일)"""
+        for post in updated_posts:
+            for seq in list(self.seqs_by_url.get(post['url'], [])):
+                self._remove(seq)
+                self._add(seq, post)
+        for post in reversed(new_posts):
+            self._add(self._take_seq(), post)
+
+    def get_by_id(self, notice_id: str) -> Optional[dict]:
+        """id로 게시글 조회 (같은 id가 여러 개면 existing_data에서 가장 앞선 게시글)"""
+        seqs = self.seqs_by_id.get(notice_id)
+        return self.posts_by_seq[max(seqs)] if seqs else None
+
+    def get_by_url(self, url: str) -> Optional[dict]:
+        """URL로 게시글 조회"""
+        seqs = self.seqs_by_url.get(url)
+        return self.posts_by_seq[min(seqs)] if seqs else None
+
+    def has_url(self, url: str) -> bool:
+        return url in self.seqs_by_url
+
+    def get_known_posts(self) -> Dict[str, dict]:
+        """URL → 게시글 딕셔너리"""
+        return {url: self.posts_by_seq[min(seqs)] for url, seqs in self.seqs_by_url.items()}
+
+    def get_page(self, category: Optional[str] = None, offset: int = 0, limit: Optional[int] = None) -> List[dict]:
+        """날짜 최신순 게시글 목록 (category가 없으면 전체)"""
+        posts = self.all_posts if category is None else self.by_category.get(category)
+        return posts.page(offset, limit) if posts else []
+
+    def get_cursor(self, post: dict) -> str:
+        """게시글 다음부터 조회하는 커서 생성"""
+        seq = next((seq for seq in self.seqs_by_id.get(post.get('id'), []) if self.posts_by_seq[seq] is post), None)
+        return encode_cursor(post.get('date', ''), post.get('id', ''), seq)
+
+    def get_page_after(self, cursor: Tuple[str, str, Optional[int]], category: Optional[str] = None,
+                       limit: Optional[int] = None) -> List[dict]:
+        """커서(날짜, id) 게시글 다음부터 날짜 최신순 게시글 목록 (keyset 페이지네이션)
+
+        앞 페이지를 받은 뒤 새 게시글이 추가되어도 결과가 밀리지 않는다.
+        커서 게시글이 그사이 바뀌었거나 삭제되었으면 같은 날짜 게시글부터 다시 반환한다. (중복은 있어도 누락은 없음)
+        """
+        posts = self.all_posts if category is None else self.by_category.get(category)
+        return posts.page_before(self._resolve_cursor(cursor, category), limit) if posts else []
+
+    def _resolve_cursor(self, cursor: Tuple[str, str, Optional[int]], category: Optional[str] = None) -> Tuple[str, int]:
+        """커서를 날짜순 목록의 정렬 키로 변환
+
+        seq가 가리키는 게시글의 (날짜, id)가 커서와 같으면 그 위치를, 아니면(인덱스를 다시 만든 경우 등)
+        (날짜, id)가 같은 게시글 중 가장 최신 위치를 사용한다.
+        """
+        date, notice_id, hint = cursor
+        matches = [seq for seq in self.seqs_by_id.get(notice_id, [])
+                   if self.posts_by_seq[seq].get('date', '') == date
+                   and category in (None, self.posts_by_seq[seq].get('category', 'Unknown'))]
+        if hint in matches:
+            return date, hint
+        return date, max(matches) if matches else self.next_seq
+
+    def iter_latest(self, category: Optional[str] = None) -> Iterator[dict]:
+        """날짜 최신순 순회"""
+        posts = self.all_posts if category is None else self.by_category.get(category)
+        return posts.iter_latest() if posts else iter(())
+
+    def search(self, query: str, category: Optional[str] = None, offset: int = 0,
+               limit: Optional[int] = 20) -> Optional[Tuple[int, List[dict]]]:
+        """역색인 검색 (SearchIndex.search 참고)"""
+        return self.search_index.search(query, category, offset, limit)
+
+    def get_categories(self) -> List[str]:
+        return sorted(self.by_category)
+
+    def get_category_stats(self) -> Dict[str, Tuple[int, Optional[str]]]:
+        """카테고리 → (게시글 수, 최신 날짜)"""
+        return {category: (len(posts), posts.latest_date()) for category, posts in self.by_category.items()}
+
+    def __len__(self):
+        return len(self.posts_by_seq)
@@ -0,0 +1,525 @@
+import logging
+import re
+from datetime import datetime
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+try:
+    # selectolax 1.0부터는 lexbor 백엔드만 지원
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:
+        SelectolaxParser = None
+
+# 상세 페이지 본문 후보 영역 (앞에서부터 시도)
+KUNSAN_CONTENT_SELECTORS = [
+    'div.view_content', 'div.content', 'div.article-content',
+    'div.board-content', 'div.post-content', 'div.main-content',
+    'div.text-content', 'div.body-content', 'div.entry-content',
+    'div.article-body', 'div.board-view', 'div.view'
+]
+SWUNIV_CONTENT_SELECTORS = [
+    'div.content', 'div.article-content', 'div.board-content',
+    'div.view-content', 'div.post-content', 'div.main-content',
+    'div.text-content', 'div.body-content', 'div.entry-content',
+    'div.article-body', 'div.board-view', 'div.view'
+]
+MAIN_CONTENT_SELECTORS = ['main', 'article', 'div#content']
+DEFAULT_CONTENT_SELECTORS = ['div.content', 'div.article', 'div.post']
+
+
+class NoticeParser:
+    """사이트별 공지사항 목록/상세 페이지 파서
+
+    목록 페이지는 BeautifulSoup(html_parser 백엔드)으로 파싱한다.
+    html_parser가 'selectolax'이면 게시글마다 파싱하는 상세 페이지 본문 추출에 selectolax를 사용하고,
+    목록 페이지는 lxml(없으면 html.parser)로 파싱한다.
+    """
+
+    def __init__(self, base_url='https://csai.jbnu.ac.kr', max_pages=3, html_parser='selectolax'):
+        self.base_url = base_url
+        self.max_pages = max_pages
+        self.use_selectolax = html_parser == 'selectolax' and SelectolaxParser is not None
+        if html_parser == 'selectolax':
+            if self.use_selectolax:
+                logging.info("HTML 파서: selectolax (상세 페이지)")
+            else:
+                logging.warning("selectolax가 설치되어 있지 않아 BeautifulSoup으로 파싱합니다.")
+            html_parser = 'lxml'
+        self.html_parser = self._resolve_html_parser(html_parser)
+
+    def get_base_url(self, url):
+        """URL에 따라 적절한 base_url 반환"""
+        if 'swuniv.jbnu.ac.kr' in url:
+            return 'https://swuniv.jbnu.ac.kr'
+        elif 'csai.jbnu.ac.kr' in url:
+            return 'https://csai.jbnu.ac.kr'
+        elif 'sw.kunsan.ac.kr' in url:
+            return 'https://sw.kunsan.ac.kr'
+        elif 'www.kunsan.ac.kr' in url:
+            return 'https://www.kunsan.ac.kr'
+        else:
+            return self.base_url
+
+    def _resolve_html_parser(self, html_parser):
+        """사용할 BeautifulSoup 파서 백엔드 결정 (설치되지 않았으면 html.parser 사용)"""
+        if builder_registry.lookup(html_parser) is None:
+            logging.warning(f"HTML 파서 '{html_parser}'를 사용할 수 없어 html.parser를 사용합니다.")
+            return 'html.parser'
+        logging.info(f"HTML 파서: {html_parser}")
+        return html_parser
+
+    def _make_soup(self, html):
+        """설정된 파서 백엔드로 BeautifulSoup 객체 생성"""
+        return BeautifulSoup(html, self.html_parser)
+
+    def parse_first_page(self, html, url, category):
+        """첫 목록 페이지를 한 번 파싱하여 (총 페이지 수, 게시글 데이터) 반환"""
+        soup = self._make_soup(html)
+        return self.get_total_pages(soup, url), self._parse_page_soup(soup, category, len(html))
+
+    def get_total_pages(self, soup, url=''):
+        """총 페이지 수 가져오기"""
+        # 기존 csai.jbnu.ac.kr 사이트 페이지네이션
+        if 'csai.jbnu.ac.kr' in url or not url:
+            return self._get_csai_pages(soup)
+        
+        # 새로운 swuniv.jbnu.ac.kr 사이트 페이지네이션
+        elif 'swuniv.jbnu.ac.kr' in url:
+            return self._get_swuniv_pages(soup)
+        
+        # 군산대학교 사이트 페이지네이션
+        elif 'kunsan.ac.kr' in url:
+            return self._get_kunsan_pages(soup)
+        
+        return 1
+    
+    def _get_csai_pages(self, soup):
+        """CSAI 사이트 페이지 수 계산"""
+        paging_div = soup.find('div', class_='_paging')
+        if paging_div:
+            total_page_span = paging_div.find('span', class_='_totPage')
+            if total_page_span:
+                return min(int(re.search(r'\d+', total_page_span.text).group()), self.max_pages)
+        return 1
+    
+    def _get_swuniv_pages(self, soup):
+        """SWUNIV 사이트 페이지 수 계산"""
+        # 프로그램 신청 페이지의 경우 숫자 링크에서 최대 페이지 찾기
+        number_links = soup.find_all('a', href=True)
+        page_numbers = [int(link.get_text().strip()) for link in number_links 
+                       if link.get_text().strip().isdigit()]
+        
+        if page_numbers:
+            return min(max(page_numbers), self.max_pages)
+        
+        # 다양한 페이지네이션 구조 시도
+        paging_selectors = [
+            'div.paging', 'div.pagination', 'div.page-navigation',
+            'div.page-nav', 'ul.pagination', 'div.pager'
+        ]
+        
+        for selector in paging_selectors:
+            paging_div = soup.find('div', class_=selector) or soup.find('ul', class_=selector)
+            if paging_div:
+                page_links = paging_div.find_all('a', href=True)
+                if page_links:
+                    max_page = 1
+                    for link in page_links:
+                        page_text = link.get_text().strip()
+                        if page_text.isdigit():
+                            max_page = max(max_page, int(page_text))
+                    return min(max_page, self.max_pages)
+        
+        # 숫자 텍스트에서 페이지 수 찾기
+        page_text = soup.get_text()
+        page_match = re.search(r'(\d+)\s*/\s*(\d+)', page_text)
+        if page_match:
+            return min(int(page_match.group(2)), self.max_pages)
+        
+        return 1
+    
+    def _get_kunsan_pages(self, soup):
+        """군산대학교 사이트 페이지 수 계산"""
+        # 페이지네이션 요소 찾기
+        pagination_divs = soup.find_all('div', class_='paging')
+        if pagination_divs:
+            # 페이지 번호들 찾기
+            page_links = []
+            for div in pagination_divs:
+                links = div.find_all('a')
+                for link in links:
+                    page_text = link.text.strip()
+                    if page_text.isdigit():
+                        page_links.append(int(page_text))
+            
+            if page_links:
+                return min(max(page_links), self.max_pages)
+        
+        # 기본값
+        return 1
+
+    def parse_page(self, html, category):
+        """페이지 파싱하여 게시글 데이터 추출"""
+        return self._parse_page_soup(self._make_soup(html), category, len(html))
+    
+    def _parse_page_soup(self, soup, category, html_size):
+        """파싱된 목록 페이지에서 게시글 데이터 추출"""
+        logging.info(f"[{category}] 파싱 시작 - HTML 크기: {html_size} bytes")
+        
+        # 사이트 구조에 따른 파싱 방법 선택
+        if 'SW중심대학사업단' in category:
+            logging.info(f"[{category}] swuniv.jbnu.ac.kr 사이트 구조로 파싱")
+            return self._parse_swuniv_page(soup, category)
+        elif self._is_csai_category(category):
+            logging.info(f"[{category}] csai.jbnu.ac.kr 사이트 구조로 파싱")
+            return self._parse_csai_page(soup, category)
+        elif self._is_kunsan_category(category):
+            logging.info(f"[{category}] kunsan.ac.kr 사이트 구조로 파싱")
+            return self._parse_kunsan_page(soup, category)
+        else:
+            logging.warning(f"[{category}] 알 수 없는 사이트 구조입니다.")
+            return []
+    
+    def has_list_date(self, category):
+        """목록 페이지에 작성일이 있는 카테고리인지 확인 (SW중심대학사업단 프로그램 목록은 수집한 날짜 사용)"""
+        return 'SW중심대학사업단' not in category
+    
+    def _is_csai_category(self, category):
+        """CSAI 사이트 카테고리인지 확인"""
+        csai_categories = ['학과소식', '일반공지', '학사공지', '사업단공지', '취업정보']
+        return 'csai.jbnu.ac.kr' in category or category in csai_categories
+    
+    def _is_kunsan_category(self, category):
+        """군산대학교 사이트 카테고리인지 확인"""
+        kunsan_categories = ['군산대SW사업단공지', '군산대SW사업단소식', '군산대컴퓨터정보공학과공지사항', '군산대컴퓨터정보공학과취업공고']
+        return 'kunsan.ac.kr' in category or category in kunsan_categories
+    
+    def _parse_csai_page(self, soup, category):
+        """기존 csai.jbnu.ac.kr 사이트 파싱"""
+        data = []
+        
+        table = soup.find('table', class_='artclTable')
+        if not table:
+            logging.warning(f"[{category}] 공지사항 테이블을 찾을 수 없습니다.")
+            return []
+        
+        rows = table.find('tbody').find_all('tr')
+        
+        for row in rows:
+            cols = row.find_all('td')
+            if len(cols) < 6:
+                continue
+                
+            number = cols[0].text.strip()
+            
+            # 제목과 링크 추출
+            title_cell = cols[1]
+            title_link = title_cell.find('a')
+            if title_link:
+                title = title_link.get_text()
+                title = ' '.join(title.split())
+                href = title_link.get('href', '')
+                full_url = urljoin(self.base_url, href) if href else ''
+            else:
+                title = title_cell.get_text()
+                title = ' '.join(title.split())
+                full_url = ''
+            
+            author = cols[2].text.strip()
+            date = cols[3].text.strip()
+            attachments = cols[4].text.strip()
+            views = cols[5].text.strip()
+            
+            # 고유 ID 생성 (URL 기반)
+            notice_id = f"{category}_{number}_{hash(full_url) % 100000}"
+            
+            post_data = {
+                'id': notice_id,
+                'category': category,
+                'number': number,
+                'title': title,
+                'author': author,
+                'date': date,
+                'attachments': attachments,
+                'views': views,
+                'url': full_url,
+                'content': '',
+                'content_html': '',
+                'image_urls': [],
+                'crawled_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+            data.append(post_data)
+        
+        return data
+    
+    def _parse_swuniv_page(self, soup, category):
+        """새로운 swuniv.jbnu.ac.kr 사이트 파싱 (프로그램 신청 페이지)"""
+        data = []
+        
+        logging.info(f"[{category}] 프로그램 신청 페이지 파싱 시작")
+        
+        # 프로그램 링크 찾기
+        program_links = self._extract_program_links(soup)
+        logging.info(f"[{category}] 프로그램 링크 {len(program_links)}개 발견")
+        
+        # 각 프로그램 정보 파싱
+        for i, link in enumerate(program_links):
+            try:
+                post_data = self._create_swuniv_post_data(link, category, i+1)
+                data.append(post_data)
+            except Exception as e:
+                logging.warning(f"[{category}] 프로그램 파싱 중 오류: {e}")
+                continue
+        
+        return data
+    
+    def _extract_program_links(self, soup):
+        """프로그램 링크 추출"""
+        program_links = []
+        links = soup.find_all('a', href=True)
+        
+        for link in links:
+            href = link.get('href', '')
+            text = link.get_text().strip()
+            
+            # 프로그램 관련 링크 필터링 (신청하기, 접수마감 등)
+            if ('신청하기' in text or '접수마감' in text) and text and len(text) > 10:
+                full_url = self._normalize_swuniv_url(href)
+                program_links.append({
+                    'href': full_url,
+                    'text': text
+                })
+        
+        return program_links
+    
+    def _normalize_swuniv_url(self, href):
+        """SWUNIV URL 정규화"""
+        if href.startswith('/'):
+            return 'https://swuniv.jbnu.ac.kr' + href
+        elif href.startswith('http'):
+            return href
+        else:
+            return f"https://swuniv.jbnu.ac.kr/main/{href}"
+    
+    def _create_swuniv_post_data(self, link, category, index):
+        """SWUNIV 게시글 데이터 생성"""
+        title = link['text']
+        program_category = self._extract_program_category(title)
+        notice_id = f"{category}_{index}_{hash(link['href']) % 100000}"
+        
+        return {
+            'id': notice_id,
+            'category': f"{category}_{program_category}",
+            'number': str(index),
+            'title': title,
+            'author': 'SW중심대학사업단',
+            'date': datetime.now().strftime("%Y-%m-%d"),
+            'attachments': '',
+            'views': '0',
+            'url': link['href'],
+            'content': '',
+            'content_html': '',
+            'image_urls': [],
+            'crawled_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+    
+    def _extract_program_category(self, title):
+        """프로그램 카테고리 추출"""
+        category_map = {
+            'SW가치확산': 'SW가치확산',
+            'SW융합': 'SW융합',
+            'SW전공': 'SW전공',
+            '산학협력': '산학협력',
+            '교육환경지원': '교육환경지원'
+        }
+        
+        for keyword, category in category_map.items():
+            if keyword in title:
+                return category
+        return '프로그램'
+    
+    def _parse_kunsan_page(self, soup, category):
+        """군산대학교 사이트 파싱"""
+        data = []
+        
+        # 테이블 찾기 (클래스가 없으므로 첫 번째 테이블 사용)
+        table = soup.find('table')
+        if not table:
+            logging.warning(f"[{category}] 공지사항 테이블을 찾을 수 없습니다.")
+            return []
+        
+        rows = table.find_all('tr')
+        
+        for row in rows:
+            cols = row.find_all(['td', 'th'])
+            if len(cols) < 6:
+                continue
+                
+            # 헤더 행 건너뛰기
+            if cols[0].name == 'th':
+                continue
+                
+            number = cols[0].text.strip()
+            
+            # 제목과 링크 추출
+            title_cell = cols[1]
+            title_link = title_cell.find('a')
+            if title_link:
+                title = title_link.get_text()
+                title = ' '.join(title.split())
+                href = title_link.get('href', '')
+                full_url = urljoin(self.get_base_url('www.kunsan.ac.kr'), href) if href else ''
+            else:
+                title = title_cell.get_text()
+                title = ' '.join(title.split())
+                full_url = ''
+            
+            author = cols[2].text.strip()
+            date = cols[3].text.strip()
+            views = cols[4].text.strip()
+            attachments = cols[5].text.strip() if len(cols) > 5 else ''
+            
+            # 고유 ID 생성 (URL 기반)
+            notice_id = f"{category}_{number}_{hash(full_url) % 100000}"
+            
+            post_data = {
+                'id': notice_id,
+                'category': category,
+                'number': number,
+                'title': title,
+                'author': author,
+                'date': date,
+                'attachments': attachments,
+                'views': views,
+                'url': full_url,
+                'content': '',
+                'content_html': '',
+                'image_urls': [],
+                'crawled_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+            data.append(post_data)
+        
+        return data
+
+    def parse_post_content(self, html, url):
+        """상세 페이지 HTML에서 내용 추출"""
+        document = SelectolaxParser(html) if self.use_selectolax else self._make_soup(html)
+        
+        # 사이트별 내용 추출
+        if 'csai.jbnu.ac.kr' in url:
+            return self._get_csai_content(document, url)
+        elif 'swuniv.jbnu.ac.kr' in url:
+            return self._get_swuniv_content(document, url)
+        elif 'kunsan.ac.kr' in url:
+            return self._get_kunsan_content(document, url)
+        else:
+            return self._get_default_content(document, url)
+    
+    def _select_one(self, document, selector):
+        """CSS 선택자와 일치하는 첫 번째 요소 (파서 백엔드 공통)"""
+        if self.use_selectolax:
+            return document.css_first(selector)
+        return document.select_one(selector)
+    
+    def get_empty_content(self):
+        """빈 내용 반환"""
+        return {
+            'content_text': '',
+            'content_html': '',
+            'image_urls': []
+        }
+    
+    def _get_csai_content(self, document, url):
+        """기존 csai.jbnu.ac.kr 사이트 내용 추출"""
+        base_url = self.get_base_url(url)
+        
+        # artclView div에서 내용 추출
+        artcl_view = self._select_one(document, 'div.artclView')
+        if artcl_view:
+            result = self._extract_content(artcl_view, base_url)
+            # 제목 부분 제거
+            if result['content_text']:
+                lines = result['content_text'].split()
+                if len(lines) > 10:
+                    result['content_text'] = ' '.join(lines[5:])
+            return result
+        
+        # hwp_editor_board_content div에서 내용 추출
+        hwp_content = self._select_one(document, 'div.hwp_editor_board_content')
+        if hwp_content:
+            return self._extract_content(hwp_content, base_url)
+        
+        return self.get_empty_content()
+    
+    def _get_kunsan_content(self, document, url):
+        """군산대학교 사이트 내용 추출"""
+        return self._get_content_by_selectors(document, KUNSAN_CONTENT_SELECTORS, self.get_base_url(url))
+    
+    def _get_swuniv_content(self, document, url):
+        """새로운 swuniv.jbnu.ac.kr 사이트 내용 추출"""
+        return self._get_content_by_selectors(document, SWUNIV_CONTENT_SELECTORS, 'swuniv.jbnu.ac.kr')
+    
+    def _get_content_by_selectors(self, document, content_selectors, base_url):
+        """후보 영역을 순서대로 시도하고 없으면 메인 컨텐츠 영역에서 내용 추출"""
+        # 다양한 선택자로 내용 찾기
+        for selector in content_selectors:
+            content_div = self._select_one(document, selector)
+            if content_div:
+                result = self._extract_content(content_div, base_url)
+                if result['content_text'] and len(result['content_text'].strip()) > 10:
+                    return result
+        
+        # 메인 컨텐츠 영역에서 찾기
+        for selector in MAIN_CONTENT_SELECTORS:
+            main_content = self._select_one(document, selector)
+            if main_content:
+                return self._extract_content(main_content, base_url)
+        
+        return self.get_empty_content()
+    
+    def _extract_content(self, element, base_url):
+        """요소에서 내용 추출 (파서 백엔드 공통)"""
+        if self.use_selectolax:
+            content_html = element.html
+            content_text = element.text(deep=True)
+            img_srcs = [img.attributes.get('src') for img in element.css('img')]
+        else:
+            content_html = str(element)
+            content_text = element.get_text()
+            img_srcs = [img.get('src') for img in element.find_all('img')]
+        
+        return {
+            'content_text': ' '.join(content_text.split()),
+            'content_html': content_html,
+            'image_urls': [self._resolve_image_url(src, base_url) for src in img_srcs if src]
+        }
+    
+    def _resolve_image_url(self, src, base_url):
+        """이미지 URL을 절대 URL로 변환"""
+        if base_url.startswith('http'):
+            return urljoin(base_url, src)
+        return self._normalize_image_url(src, base_url)
+    
+    def _normalize_image_url(self, src, base_domain):
+        """이미지 URL 정규화"""
+        if src.startswith('/'):
+            return f"https://{base_domain}" + src
+        elif src.startswith('http'):
+            return src
+        else:
+            return f"https://{base_domain}/" + src
+    
+    def _get_default_content(self, document, url):
+        """기본 내용 추출 방법"""
+        # 일반적인 컨텐츠 영역 찾기
+        for selector in DEFAULT_CONTENT_SELECTORS:
+            content_div = self._select_one(document, selector)
+            if content_div:
+                return self._extract_content(content_div, url)
+        
+        return self.get_empty_content()
@@ -0,0 +1,119 @@
+import sys
+from collections.abc import MutableMapping
+from typing import Iterable, List
+
+# 게시글 필드 (슬롯으로 저장)
+# content_html은 API 서버에서는 블롭 저장소로 옮겨져 빈 문자열이지만, 파싱 결과와 SQLite 행,
+# 다중 URL 크롤러의 게시글에 항상 있으므로 슬롯으로 두어 게시글마다 추가 필드 dict가 생기지 않도록 한다.
+RECORD_FIELDS = ('id', 'category', 'number', 'title', 'author', 'date', 'attachments',
+                 'views', 'url', 'content', 'content_html', 'content_ref', 'image_urls', 'crawled_at')
+
+# 게시글 사이에 같은 값이 반복되는 필드 (문자열을 intern하여 한 객체를 공유)
+INTERNED_FIELDS = frozenset(('category', 'author', 'date', 'attachments', 'crawled_at'))
+
+_FIELD_SET = frozenset(RECORD_FIELDS)
+_MISSING = object()
+
+
+class NoticeRecord(MutableMapping):
+    """메모리에 보관하는 게시글 레코드 (dict와 같은 인터페이스)
+
+    필드를 __slots__에 저장하여 게시글마다 해시 테이블을 두지 않고,
+    카테고리/작성자/날짜처럼 반복되는 문자열은 intern하여 공유한다.
+    RECORD_FIELDS에 없는 키는 추가 필드 dict(_extra)에 저장한다.
+    JSON으로 저장할 때는 dict(record) 또는 to_dict()로 변환한다.
+    """
+
+    __slots__ = RECORD_FIELDS + ('_extra',)
+
+    def __init__(self, post=None):
+        """post: 게시글 dict 또는 (키, 값) 쌍 목록"""
+        for field in RECORD_FIELDS:
+            object.__setattr__(self, field, _MISSING)
+        self._extra = None
+        if post is not None:
+            for key, value in (post.items() if hasattr(post, 'items') else post):
+                self[key] = value
+
+    @classmethod
+    def from_dict(cls, post) -> 'NoticeRecord':
+        """게시글 dict를 레코드로 변환 (이미 레코드면 그대로 반환)"""
+        return post if isinstance(post, cls) else cls(post)
+
+    def __getitem__(self, key):
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+            if value is not _MISSING:
+                return value
+        elif self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+            return default if value is _MISSING else value
+        return self._extra.get(key, default) if self._extra else default
+
+    def __setitem__(self, key, value):
+        if key in _FIELD_SET:
+            if key in INTERNED_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in _FIELD_SET:
+            if getattr(self, key) is _MISSING:
+                raise KeyError(key)
+            setattr(self, key, _MISSING)
+        elif self._extra and key in self._extra:
+            del self._extra[key]
+            if not self._extra:
+                self._extra = None
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        if key in _FIELD_SET:
+            return getattr(self, key) is not _MISSING
+        return bool(self._extra) and key in self._extra
+
+    def __iter__(self):
+        for field in RECORD_FIELDS:
+            if getattr(self, field) is not _MISSING:
+                yield field
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(getattr(self, field) is not _MISSING for field in RECORD_FIELDS) + len(self._extra or ())
+
+    def to_dict(self) -> dict:
+        """일반 dict로 변환 (JSON 저장, Firebase 전송용)"""
+        return dict(self.items())
+
+    def copy(self) -> 'NoticeRecord':
+        return NoticeRecord(self)
+
+    def __reduce__(self):
+        # 비어 있는 슬롯 표시(_MISSING)가 복사되지 않도록 dict로 pickle/deepcopy
+        return NoticeRecord, (self.to_dict(),)
+
+    def __repr__(self):
+        return f"NoticeRecord({self.to_dict()!r})"
+
+
+def compact_posts(posts: Iterable[dict]) -> List[NoticeRecord]:
+    """게시글 dict 목록을 레코드 목록으로 변환"""
+    return [NoticeRecord.from_dict(post) for post in posts]
+
+
+def encode_record(value):
+    """json.dump(default=...)용 - 레코드를 dict로 변환"""
+    if isinstance(value, NoticeRecord):
+        return value.to_dict()
+    raise TypeError(f"JSON으로 변환할 수 없는 값: {type(value).__name__}")
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from typing import Optional
+
+from notice_parser import NoticeParser
+
+# 작업 프로세스마다 한 번 만들어 두는 파서
+_worker_parser: Optional[NoticeParser] = None
+
+
+def _init_worker(parser: NoticeParser):
+    """작업 프로세스 초기화"""
+    global _worker_parser
+    _worker_parser = parser
+
+
+def _run_in_worker(method_name: str, *args):
+    """작업 프로세스에서 파서 메서드 실행"""
+    return getattr(_worker_parser, method_name)(*args)
+
+
+class ParsePool:
+    """HTML 파싱을 프로세스 풀에서 실행하는 파싱 단계
+
+    파싱은 CPU 작업이라 스레드로는 GIL 때문에 한 코어만 사용하므로,
+    원본 HTML을 작업 프로세스로 보내고 추출된 dict만 돌려받는다.
+    workers가 0이면(또는 프로세스 풀을 쓸 수 없으면) 기존처럼 스레드에서 파싱한다.
+    목록 페이지는 항상 BeautifulSoup으로 파싱하므로 프로세스 풀에서 실행한다.
+    상세 페이지를 selectolax로 파싱하면 문서당 파싱 시간보다 프로세스 간 전송 비용이 더 커서 스레드에서 파싱한다.
+    workers가 None이면 코어가 여러 개일 때 코어 수만큼 사용하되, 프로세스 풀이 목록 페이지만 파싱하면
+    동시에 파싱하는 목록 페이지 수(게시판마다 한 페이지씩, board_count)를 넘지 않게 한다.
+    프로세스 풀은 첫 파싱 때 만들고 크롤링 실행 간에 재사용한다.
+    """
+
+    # BeautifulSoup으로 파싱하는 목록 페이지 메서드
+    LIST_PAGE_METHODS = ('parse_page', 'parse_first_page')
+
+    def __init__(self, parser: NoticeParser, workers: Optional[int] = None, board_count: int = 1):
+        self.parser = parser
+        self.board_count = max(1, board_count)
+        self.workers = self._default_workers() if workers is None else max(0, workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.lock = Lock()
+        self.stats = {'process_tasks': 0, 'thread_tasks': 0, 'pool_restarts': 0}
+
+    def _default_workers(self) -> int:
+        """기본 작업 프로세스 수"""
+        cpu_count = os.cpu_count() or 1
+        if cpu_count <= 1:
+            return 0
+        return min(cpu_count, self.board_count) if self.parser.use_selectolax else cpu_count
+
+    def _uses_process(self, method_name: str) -> bool:
+        """프로세스 풀에서 실행할 파서 메서드인지 여부"""
+        return method_name in self.LIST_PAGE_METHODS or not self.parser.use_selectolax
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """프로세스 풀 반환 (필요하면 생성)"""
+        with self.lock:
+            if self._executor is None and self.workers > 0:
+                try:
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                         initargs=(self.parser,))
+                    logging.info(f"파싱 프로세스 풀 시작: {self.workers}개")
+                except (OSError, NotImplementedError) as e:
+                    logging.warning(f"파싱 프로세스 풀을 만들 수 없어 스레드에서 파싱합니다: {e}")
+                    self.workers = 0
+            return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor):
+        """손상된 프로세스 풀 폐기 (다음 파싱 때 다시 생성)"""
+        with self.lock:
+            if self._executor is executor:
+                self._executor = None
+                self.stats['pool_restarts'] += 1
+        executor.shutdown(wait=False)
+
+    async def run(self, method_name: str, *args):
+        """파서 메서드(parse_page, parse_first_page, parse_post_content)를 비동기로 실행"""
+        executor = self._get_executor() if self._uses_process(method_name) else None
+        if executor is not None:
+            try:
+                result = await asyncio.get_running_loop().run_in_executor(executor, _run_in_worker, method_name, *args)
+                self.stats['process_tasks'] += 1
+                return result
+            except BrokenProcessPool as e:
+                logging.error(f"파싱 프로세스 풀 오류 - 스레드에서 다시 파싱합니다: {e}")
+                self._discard_executor(executor)
+
+        self.stats['thread_tasks'] += 1
+        return await asyncio.to_thread(getattr(self.parser, method_name), *args)
+
+    def shutdown(self):
+        """프로세스 풀 종료"""
+        with self.lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_stats(self) -> dict:
+        """파싱 작업 통계 반환"""
+        return {**self.stats, 'workers': self.workers}
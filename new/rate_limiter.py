@@ -0,0 +1,128 @@
+import asyncio
+import logging
+import time
+from threading import Lock
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """토큰 버킷 (초당 rate개 토큰 충전, 최대 capacity개 보관)
+
+    토큰을 미리 예약하고 필요한 대기 시간을 돌려주는 방식이라
+    스레드와 이벤트 루프에 관계없이 같은 버킷을 공유할 수 있다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = Lock()
+
+    def reserve(self) -> float:
+        """토큰 1개를 예약하고 대기해야 할 시간(초) 반환"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.paused_until - now)
+
+    def pause(self, seconds: float):
+        """지정한 시간 동안 요청 중지 (Retry-After 등)"""
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 기반 요청 속도 제한
+
+    adaptive가 켜져 있으면 429/5xx 응답이나 느린 응답에서 속도를 절반으로 줄이고,
+    정상 응답이 이어지면 설정된 속도까지 조금씩 회복한다.
+    """
+
+    def __init__(self, requests_per_second: float = 2.0, burst: float = 2,
+                 adaptive: bool = True, min_requests_per_second: float = 0.2,
+                 slow_response_seconds: float = 3.0, host_overrides: Optional[Dict[str, float]] = None):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.adaptive = adaptive
+        self.min_requests_per_second = min(min_requests_per_second, requests_per_second)
+        self.slow_response_seconds = slow_response_seconds
+        # 호스트는 URL의 netloc으로 구분 ('https://host' 형식으로 설정해도 netloc으로 변환)
+        self.host_overrides = {urlparse(host).netloc if '://' in host else host: rate
+                               for host, rate in (host_overrides or {}).items()}
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self.lock = Lock()
+
+    def _get_bucket(self, host: str) -> TokenBucket:
+        """호스트별 버킷 반환"""
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self._base_rate(host), self.burst)
+                self.stats[host] = {'requests': 0, 'throttled': 0, 'wait_seconds': 0.0, 'backoffs': 0}
+            return self.buckets[host]
+
+    def _base_rate(self, host: str) -> float:
+        """호스트에 설정된 기본 초당 요청 수"""
+        return self.host_overrides.get(host, self.requests_per_second)
+
+    def _reserve(self, host: str) -> float:
+        wait = self._get_bucket(host).reserve()
+        stats = self.stats[host]
+        stats['requests'] += 1
+        if wait > 0:
+            stats['throttled'] += 1
+            stats['wait_seconds'] += wait
+        return wait
+
+    def acquire(self, host: str):
+        """요청 전에 호출 (동기, 필요하면 대기)"""
+        wait = self._reserve(host)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, host: str):
+        """요청 전에 호출 (비동기, 필요하면 대기)"""
+        wait = self._reserve(host)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def record_response(self, host: str, status_code: Optional[int], elapsed: float,
+                        retry_after: Optional[str] = None):
+        """응답 결과에 따라 호스트의 요청 속도 조정 (status_code가 None이면 네트워크 오류)"""
+        if not self.adaptive:
+            return
+
+        bucket = self._get_bucket(host)
+        base_rate = self._base_rate(host)
+        overloaded = status_code is None or status_code == 429 or status_code >= 500
+        slow = elapsed > self.slow_response_seconds
+
+        with bucket.lock:
+            if overloaded or slow:
+                bucket.rate = max(self.min_requests_per_second, bucket.rate / 2)
+            else:
+                bucket.rate = min(base_rate, bucket.rate + base_rate * 0.1)
+            current_rate = bucket.rate
+
+        if overloaded or slow:
+            self.stats[host]['backoffs'] += 1
+            logging.warning(f"[{host}] 요청 속도 감소: {current_rate:.2f}회/초 "
+                            f"(상태: {status_code}, 응답 시간: {elapsed:.2f}초)")
+
+        if status_code == 429 and retry_after and retry_after.isdigit():
+            bucket.pause(float(retry_after))
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """호스트별 현재 속도 및 대기 통계 반환"""
+        with self.lock:
+            return {
+                host: {**stats, 'wait_seconds': round(stats['wait_seconds'], 2),
+                       'requests_per_second': round(self.buckets[host].rate, 2)}
+                for host, stats in self.stats.items()
+            }
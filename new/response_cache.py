@@ -0,0 +1,100 @@
+import hashlib
+import json
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Hashable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode_default(value):
+    """JSON 기본 타입이 아닌 값 변환 (pydantic 모델)"""
+    if hasattr(value, 'model_dump'):
+        return value.model_dump(mode='json')
+    raise TypeError(f"JSON으로 변환할 수 없는 값: {type(value).__name__}")
+
+
+class ResponseCache:
+    """조회 API 응답 캐시 (LRU)
+
+    키는 (경로, 쿼리 파라미터, 데이터 세대)이고 값은 {'body': 직렬화된 JSON 본문, 'etag', 'headers'}이다.
+    크롤링 결과가 반영될 때마다 세대(generation)를 올리고 캐시를 비우므로,
+    같은 데이터에 대한 반복 요청은 다시 계산하거나 직렬화하지 않는다.
+    항목 수가 max_entries, 본문 합계가 max_bytes를 넘으면 가장 오래 쓰지 않은 항목부터 버린다.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.generation = 0
+        self.entries: 'OrderedDict[Hashable, dict]' = OrderedDict()
+        self.total_bytes = 0
+        self.lock = Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'not_modified': 0, 'evictions': 0}
+
+    @staticmethod
+    def serialize(content, headers: Optional[Dict[str, str]] = None) -> dict:
+        """dict/list/pydantic 모델을 JSON으로 직렬화하고 본문 해시로 ETag 생성
+
+        orjson이 설치되어 있으면 사용하고, 없으면 json 모듈로 같은 형식(공백 없음, UTF-8)으로 만든다.
+        """
+        if orjson is not None:
+            body = orjson.dumps(content, default=_encode_default)
+        else:
+            body = json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None,
+                              separators=(',', ':'), default=_encode_default).encode('utf-8')
+        return {'body': body, 'etag': f'"{hashlib.sha1(body).hexdigest()}"', 'headers': headers or {}}
+
+    def get(self, key: Hashable) -> Optional[dict]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            self.entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry
+
+    def put(self, key: Hashable, entry: dict) -> dict:
+        with self.lock:
+            if len(entry['body']) > self.max_bytes:
+                return entry
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= len(previous['body'])
+            self.entries[key] = entry
+            self.total_bytes += len(entry['body'])
+            while len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= len(evicted['body'])
+                self.stats['evictions'] += 1
+        return entry
+
+    def invalidate(self) -> int:
+        """데이터가 바뀌었을 때 세대를 올리고 캐시 비우기 → 새 세대 반환"""
+        with self.lock:
+            self.generation += 1
+            self.entries.clear()
+            self.total_bytes = 0
+            return self.generation
+
+    @staticmethod
+    def matches(if_none_match: Optional[str], etag: str) -> bool:
+        """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교)"""
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        return '*' in tags or etag in (tag[2:] if tag.startswith('W/') else tag for tag in tags)
+
+    def record_not_modified(self):
+        with self.lock:
+            self.stats['not_modified'] += 1
+
+    def get_stats(self) -> dict:
+        """캐시 적중/미적중/304 응답 수와 크기 반환"""
+        with self.lock:
+            return {**self.stats, 'entries': len(self.entries), 'bytes': self.total_bytes,
+                    'generation': self.generation}
@@ -0,0 +1,151 @@
+import heapq
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional, Set, Tuple
+
+# 카테고리 필터를 게시글 목록(포스팅)으로 처리하기 위한 토큰 접두어 (검색어에는 나오지 않음)
+CATEGORY_TOKEN_PREFIX = '\x00category:'
+
+# 점수 가중치 - 제목의 검색어 1회는 본문 TITLE_WEIGHT회와 같고, 검색어가 여러 개일 때 전체 문구가 있으면 가산
+TITLE_WEIGHT = 5
+PHRASE_BONUS = 10
+
+
+def tokenize(text: str) -> Set[str]:
+    """공백으로 나눈 단어별 문자 bi-gram 집합 (형태소 분석 없이 한국어 부분 일치 검색)"""
+    return {word[i:i + 2] for word in text.lower().split() for i in range(len(word) - 1)}
+
+
+def ordered_tokens(text: str) -> List[str]:
+    """tokenize()와 같은 bi-gram을 처음 나온 순서대로 반환 (Firestore search_tokens 필드용)"""
+    return list(dict.fromkeys(word[i:i + 2] for word in text.lower().split() for i in range(len(word) - 1)))
+
+
+def split_terms(query: str) -> List[str]:
+    """검색어를 소문자 단어 목록으로 분리 (중복 제거)"""
+    return list(dict.fromkeys(query.lower().split()))
+
+
+class SearchIndex:
+    """제목 + 본문(content) 문자 bi-gram 역색인
+
+    게시글마다 증가하는 문서 번호를 붙이고, bi-gram마다 문서 번호 배열(오름차순)을 유지한다.
+    검색은 가장 짧은 배열부터 교집합을 구해 후보를 줄이고(카테고리 필터도 배열 하나로 취급),
+    후보 게시글에 검색어 단어가 모두 들어 있는지 확인한 뒤 제목/본문 출현 횟수로 점수를 매긴다.
+    게시글이 바뀌면 이전 문서는 삭제 표시만 하고, 삭제된 문서가 절반을 넘으면 배열에서 정리한다.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, array] = {}
+        self.docs: List[Optional[dict]] = []
+        self.live_docs = 0
+        self.dead_docs = 0
+
+    def add(self, post: dict) -> int:
+        """게시글을 색인하고 문서 번호 반환"""
+        doc_id = len(self.docs)
+        self.docs.append(post)
+        self.live_docs += 1
+        tokens = tokenize(f"{post.get('title', '')} {post.get('content', '')}")
+        tokens.add(CATEGORY_TOKEN_PREFIX + post.get('category', 'Unknown'))
+        for token in tokens:
+            doc_ids = self.postings.get(token)
+            if doc_ids is None:
+                doc_ids = self.postings[token] = array('I')
+            doc_ids.append(doc_id)
+        return doc_id
+
+    def remove(self, doc_id: int):
+        """문서 삭제 표시"""
+        if self.docs[doc_id] is not None:
+            self.docs[doc_id] = None
+            self.live_docs -= 1
+            self.dead_docs += 1
+            if self.dead_docs * 2 > len(self.docs):
+                self._compact()
+
+    def _compact(self):
+        """삭제된 문서 번호를 배열에서 제거"""
+        docs = self.docs
+        for token, doc_ids in list(self.postings.items()):
+            live_ids = array('I', (doc_id for doc_id in doc_ids if docs[doc_id] is not None))
+            if live_ids:
+                self.postings[token] = live_ids
+            else:
+                del self.postings[token]
+        self.dead_docs = 0
+
+    @staticmethod
+    def _contains(doc_ids: array, doc_id: int) -> bool:
+        index = bisect_left(doc_ids, doc_id)
+        return index < len(doc_ids) and doc_ids[index] == doc_id
+
+    def _get_candidates(self, tokens: List[str]) -> List[int]:
+        """모든 토큰을 포함하는 문서 번호 (가장 짧은 배열부터 교집합)"""
+        posting_lists = []
+        for token in tokens:
+            doc_ids = self.postings.get(token)
+            if not doc_ids:
+                return []
+            posting_lists.append(doc_ids)
+        posting_lists.sort(key=len)
+        candidates = posting_lists[0]
+        for doc_ids in posting_lists[1:]:
+            if len(candidates) * 16 < len(doc_ids):
+                # 후보가 훨씬 적으면 이진 탐색으로 확인
+                candidates = [doc_id for doc_id in candidates if self._contains(doc_ids, doc_id)]
+            else:
+                candidates = sorted(set(candidates).intersection(doc_ids))
+            if not candidates:
+                break
+        return list(candidates)
+
+    def _score(self, post: dict, terms: List[str], query: str) -> int:
+        """검색어 점수 (단어가 하나라도 없으면 0)"""
+        title = post.get('title', '').lower()
+        content = post.get('content', '').lower()
+        score = 0
+        for term in terms:
+            title_hits, content_hits = title.count(term), content.count(term)
+            if not (title_hits or content_hits):
+                return 0
+            score += title_hits * TITLE_WEIGHT + content_hits
+        if len(terms) > 1 and (query in title or query in content):
+            score += PHRASE_BONUS
+        return score
+
+    def search(self, query: str, category: Optional[str] = None, offset: int = 0,
+               limit: Optional[int] = 20) -> Optional[Tuple[int, List[dict]]]:
+        """검색어 단어를 모두 포함하는 게시글을 점수순(같으면 최신순)으로 반환 → (전체 결과 수, 결과)
+
+        검색어에 두 글자 이상인 단어가 없으면 색인을 쓸 수 없으므로 None을 반환한다.
+        """
+        terms = split_terms(query)
+        tokens = {token for term in terms for token in tokenize(term)}
+        if not tokens:
+            return None
+        if category:
+            tokens.add(CATEGORY_TOKEN_PREFIX + category)
+
+        query = ' '.join(terms)
+        ranked = []
+        for doc_id in self._get_candidates(list(tokens)):
+            post = self.docs[doc_id]
+            if post is None:
+                continue
+            score = self._score(post, terms, query)
+            if score:
+                ranked.append((score, post.get('date', ''), doc_id))
+
+        # 필요한 페이지까지만 정렬
+        top = heapq.nlargest(offset + limit, ranked) if limit else sorted(ranked, reverse=True)
+        return len(ranked), [self.docs[doc_id] for _, _, doc_id in top[offset:]]
+
+    def get_stats(self) -> dict:
+        """색인 크기 반환"""
+        return {
+            'documents': self.live_docs,
+            'deleted_documents': self.dead_docs,
+            'tokens': len(self.postings),
+            'postings': sum(len(doc_ids) for doc_ids in self.postings.values())
+        }
@@ -0,0 +1,356 @@
+import json
+import logging
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from datetime import datetime
+from threading import Event, Lock, Thread
+from typing import Callable, List, Optional
+
+from notice_record import NoticeRecord, compact_posts, encode_record
+
+# 저장하는 게시글 필드 (NoticeResponse 필드 + 본문 블롭 참조)
+# content_html은 블롭 저장소(content_store.py)로 옮겨져 content_ref만 저장되며, 이전 데이터 호환용으로 남겨 둔다.
+NOTICE_FIELDS = ('id', 'category', 'number', 'title', 'author', 'date', 'attachments',
+                 'views', 'url', 'content', 'content_html', 'image_urls', 'crawled_at', 'content_ref')
+
+
+def merge_posts(existing_posts: List[dict], posts: List[dict]) -> List[dict]:
+    """새 게시글은 앞에 추가하고 URL이 같은 기존 게시글은 제자리에서 교체한 목록 반환"""
+    posts_by_url = {post['url']: post for post in posts if post.get('url')}
+    existing_urls = {post.get('url') for post in existing_posts if post.get('url')}
+    new_posts = [post for post in posts if not post.get('url') or post['url'] not in existing_urls]
+    return new_posts + [posts_by_url.get(post.get('url'), post) for post in existing_posts]
+
+
+def unique_posts(posts: List[dict]) -> List[dict]:
+    """URL이 같은 게시글은 처음 나온 것만 남긴 목록 반환 (URL이 없는 게시글은 모두 유지)"""
+    seen_urls = set()
+    result = []
+    for post in posts:
+        url = post.get('url')
+        if url:
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+        result.append(post)
+    return result
+
+
+def write_json_atomic(path: str, data, indent: Optional[int] = 2):
+    """임시 파일에 쓰고 교체하여 저장 도중 중단되어도 기존 파일이 남도록 저장"""
+    temp_file = f"{path}.tmp"
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent, default=encode_record)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_file, path)
+
+
+def replay_journal(journal_file: str, apply: Callable[[dict], None]) -> int:
+    """JSONL 저널의 줄을 순서대로 apply에 전달하고 적용한 건수 반환
+
+    손상된 줄은 건너뛴다. 기록 도중 중단되어 파일 끝이 잘려 있으면 마지막 정상 줄까지로 잘라내어,
+    다음에 추가하는 줄이 잘린 줄 뒤에 이어 붙어 함께 손상되지 않도록 한다.
+    """
+    if not os.path.exists(journal_file):
+        return 0
+
+    applied = 0
+    offset = 0
+    valid_size = 0
+    missing_newline = False
+    with open(journal_file, 'rb') as f:
+        for line_number, line in enumerate(f, 1):
+            offset += len(line)
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                logging.warning(f"저널 {line_number}번째 줄이 손상되어 건너뜁니다: {journal_file}")
+                continue
+            apply(entry)
+            applied += 1
+            valid_size = offset
+            missing_newline = not line.endswith(b'\n')
+
+    if valid_size < offset or missing_newline:
+        with open(journal_file, 'r+b') as f:
+            f.truncate(valid_size)
+            if missing_newline:
+                f.seek(valid_size)
+                f.write(b'\n')
+            f.flush()
+            os.fsync(f.fileno())
+        if valid_size < offset:
+            logging.warning(f"저널 끝의 잘린 내용 {offset - valid_size}바이트를 잘라냈습니다: {journal_file}")
+    return applied
+
+
+class NoticeStorage(ABC):
+    """게시글 저장소 인터페이스
+
+    게시글 목록은 최신 수집 순(새 게시글이 앞)으로 다루며, 로드한 게시글은 NoticeRecord로 반환한다.
+    """
+
+    @abstractmethod
+    def load_all(self) -> List[dict]:
+        """저장된 모든 게시글 로드"""
+
+    @abstractmethod
+    def upsert(self, posts: List[dict]):
+        """새 게시글은 앞에 추가하고, URL이 같은 기존 게시글은 제자리에서 교체"""
+
+    @abstractmethod
+    def replace_all(self, posts: List[dict]):
+        """저장된 게시글 전체 교체"""
+
+    def close(self):
+        """저장소 정리"""
+
+
+class JsonNoticeStorage(NoticeStorage):
+    """JSON 파일 저장소 (저장할 때마다 파일 전체를 다시 쓴다)"""
+
+    def __init__(self, data_file: str):
+        self.data_file = data_file
+        self.posts: List[dict] = []
+
+    def load_all(self) -> List[dict]:
+        if os.path.exists(self.data_file):
+            with open(self.data_file, 'r', encoding='utf-8') as f:
+                self.posts = compact_posts(json.load(f))
+        return list(self.posts)
+
+    def upsert(self, posts: List[dict]):
+        self.posts = merge_posts(self.posts, posts)
+        self._write()
+
+    def replace_all(self, posts: List[dict]):
+        self.posts = list(posts)
+        self._write()
+
+    def _write(self):
+        write_json_atomic(self.data_file, self.posts)
+
+
+class JournalNoticeStorage(JsonNoticeStorage):
+    """JSON 스냅샷 + 추가 전용 JSONL 저널 저장소
+
+    새/변경 게시글은 저널 파일에 한 줄(JSON)씩 추가하고 fsync하므로 저장 비용이 변경분에 비례한다.
+    시작할 때 스냅샷(data_file)을 읽고 저널을 순서대로 다시 적용하며,
+    백그라운드 스레드가 compact_interval초마다 스냅샷을 다시 쓰고 저널을 비운다.
+    기록 도중 중단되어 마지막 줄이 잘렸으면 시작할 때 그 줄을 잘라낸다.
+    """
+
+    def __init__(self, data_file: str, journal_file: str, compact_interval: float = 600):
+        super().__init__(data_file)
+        self.journal_file = journal_file
+        self.compact_interval = compact_interval
+        self.journal_entries = 0
+        self.lock = Lock()
+        self._stop = Event()
+        self._compactor: Optional[Thread] = None
+
+    def load_all(self) -> List[dict]:
+        with self.lock:
+            super().load_all()
+            self.journal_entries = self._replay_journal()
+        if self.journal_entries:
+            logging.info(f"저널 {self.journal_entries}건 적용 완료: {self.journal_file}")
+        self._start_compactor()
+        return list(self.posts)
+
+    def _replay_journal(self) -> int:
+        """저널의 변경 내용을 스냅샷에 순서대로 적용하고 적용한 건수 반환"""
+        def apply(entry):
+            self.posts = merge_posts(self.posts, compact_posts(entry['posts']))
+        return replay_journal(self.journal_file, apply)
+
+    def upsert(self, posts: List[dict]):
+        line = json.dumps({'op': 'upsert', 'at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 'posts': posts},
+                          ensure_ascii=False, default=encode_record)
+        with self.lock:
+            with open(self.journal_file, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self.posts = merge_posts(self.posts, posts)
+            self.journal_entries += 1
+
+    def replace_all(self, posts: List[dict]):
+        with self.lock:
+            self.posts = list(posts)
+            self._write_snapshot()
+
+    def compact(self):
+        """스냅샷을 다시 쓰고 저널 비우기"""
+        with self.lock:
+            if not self.journal_entries and not os.path.exists(self.journal_file):
+                return
+            entries = self.journal_entries
+            self._write_snapshot()
+        logging.info(f"저널 압축 완료: {entries}건 → {self.data_file}")
+
+    def _write_snapshot(self):
+        """스냅샷 저장 후 저널 삭제 (lock 보유 상태에서 호출)
+
+        스냅샷 교체 후 저널 삭제 전에 중단되어도 저널을 다시 적용한 결과는 같다.
+        """
+        self._write()
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+        self.journal_entries = 0
+
+    def _start_compactor(self):
+        """주기적 압축 스레드 시작"""
+        if self._compactor is None and self.compact_interval > 0:
+            self._compactor = Thread(target=self._run_compactor, name='journal-compactor', daemon=True)
+            self._compactor.start()
+
+    def _run_compactor(self):
+        while not self._stop.wait(self.compact_interval):
+            try:
+                self.compact()
+            except Exception as e:
+                logging.error(f"저널 압축 실패: {e}")
+
+    def close(self):
+        self._stop.set()
+        self.compact()
+
+
+class SqliteNoticeStorage(NoticeStorage):
+    """SQLite 저장소 (WAL 모드, 새/변경 게시글만 upsert)
+
+    seq는 삽입 순서로, seq 내림차순이 JSON 파일의 게시글 순서(새 게시글이 앞)와 같다.
+    URL은 고유하며(URL이 없는 게시글 제외), 변경된 게시글은 INSERT ... ON CONFLICT(url)로
+    seq를 유지한 채 해당 행만 갱신한다. 전체 교체 시 URL이 같은 게시글은 처음 나온 것만 저장한다.
+    """
+
+    def __init__(self, db_file: str):
+        self.db_file = db_file
+        self.lock = Lock()
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        """테이블 및 인덱스 생성"""
+        with self.lock, self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS notices (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id TEXT NOT NULL,
+                    category TEXT NOT NULL DEFAULT '',
+                    number TEXT NOT NULL DEFAULT '',
+                    title TEXT NOT NULL DEFAULT '',
+                    author TEXT NOT NULL DEFAULT '',
+                    date TEXT NOT NULL DEFAULT '',
+                    attachments TEXT NOT NULL DEFAULT '',
+                    views TEXT NOT NULL DEFAULT '',
+                    url TEXT NOT NULL DEFAULT '',
+                    content TEXT NOT NULL DEFAULT '',
+                    content_html TEXT NOT NULL DEFAULT '',
+                    image_urls TEXT NOT NULL DEFAULT '[]',
+                    crawled_at TEXT NOT NULL DEFAULT '',
+                    content_ref TEXT NOT NULL DEFAULT ''
+                )
+            """)
+            # content_ref 컬럼이 없는 이전 DB 갱신
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(notices)")}
+            if 'content_ref' not in columns:
+                self.conn.execute("ALTER TABLE notices ADD COLUMN content_ref TEXT NOT NULL DEFAULT ''")
+            # URL 고유 색인 (이전 DB는 URL이 같은 행 중 가장 최근 행만 남기고 일반 색인을 교체)
+            unique_index = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_notices_url_unique'").fetchone()
+            if not unique_index:
+                removed = self.conn.execute("""
+                    DELETE FROM notices WHERE url != '' AND seq NOT IN (
+                        SELECT MAX(seq) FROM notices WHERE url != '' GROUP BY url)
+                """).rowcount
+                if removed:
+                    logging.info(f"URL이 중복된 게시글 {removed}개 정리: {self.db_file}")
+                self.conn.execute("DROP INDEX IF EXISTS idx_notices_url")
+                self.conn.execute("CREATE UNIQUE INDEX idx_notices_url_unique ON notices(url) WHERE url != ''")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_notices_id ON notices(id)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_notices_category_date ON notices(category, date)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_notices_date ON notices(date)")
+
+    def _to_row(self, post: dict) -> tuple:
+        """게시글 dict를 테이블 행으로 변환"""
+        return tuple(json.dumps(post.get(field) or [], ensure_ascii=False) if field == 'image_urls'
+                     else post.get(field) or '' for field in NOTICE_FIELDS)
+
+    def _to_post(self, row: tuple) -> NoticeRecord:
+        """테이블 행을 게시글 레코드로 변환"""
+        post = NoticeRecord(zip(NOTICE_FIELDS, row))
+        post['image_urls'] = json.loads(post['image_urls'])
+        return post
+
+    def load_all(self) -> List[dict]:
+        with self.lock:
+            rows = self.conn.execute(f"SELECT {', '.join(NOTICE_FIELDS)} FROM notices ORDER BY seq DESC").fetchall()
+        return [self._to_post(row) for row in rows]
+
+    def _upsert_sql(self) -> str:
+        """URL이 같은 행이 있으면 seq를 유지한 채 갱신하는 INSERT 문"""
+        columns = ', '.join(NOTICE_FIELDS)
+        placeholders = ', '.join('?' for _ in NOTICE_FIELDS)
+        assignments = ', '.join(f"{field} = excluded.{field}" for field in NOTICE_FIELDS)
+        return (f"INSERT INTO notices ({columns}) VALUES ({placeholders}) "
+                f"ON CONFLICT(url) WHERE url != '' DO UPDATE SET {assignments}")
+
+    def upsert(self, posts: List[dict]):
+        with self.lock, self.conn:
+            # 목록의 앞쪽 게시글이 가장 큰 seq를 갖도록 역순으로 삽입
+            self.conn.executemany(self._upsert_sql(), [self._to_row(post) for post in reversed(unique_posts(posts))])
+
+    def replace_all(self, posts: List[dict]):
+        columns = ', '.join(NOTICE_FIELDS)
+        placeholders = ', '.join('?' for _ in NOTICE_FIELDS)
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM notices")
+            self.conn.executemany(f"INSERT INTO notices ({columns}) VALUES ({placeholders})",
+                                  [self._to_row(post) for post in reversed(unique_posts(posts))])
+
+    def count(self) -> int:
+        """저장된 게시글 수"""
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM notices").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+def migrate_json_to_sqlite(json_file: str, storage: SqliteNoticeStorage) -> int:
+    """JSON 데이터 파일의 게시글을 SQLite 저장소로 옮기고 옮긴 게시글 수 반환"""
+    with open(json_file, 'r', encoding='utf-8') as f:
+        posts = json.load(f)
+    storage.replace_all(posts)
+    logging.info(f"{json_file} → {storage.db_file}: {len(posts)}개 게시글 이전 완료")
+    return len(posts)
+
+
+def create_storage(backend: str, data_file: str, db_file: str, journal_file: Optional[str] = None,
+                   compact_interval: float = 600) -> NoticeStorage:
+    """설정에 따른 저장소 생성
+
+    SQLite 저장소를 처음 만들 때 기존 JSON 데이터 파일이 있으면 자동으로 이전한다.
+    """
+    if backend == 'json':
+        return JsonNoticeStorage(data_file)
+    if backend == 'journal':
+        return JournalNoticeStorage(data_file, journal_file or f"{os.path.splitext(data_file)[0]}.journal.jsonl",
+                                    compact_interval)
+    if backend != 'sqlite':
+        logging.warning(f"알 수 없는 저장소 '{backend}' - sqlite를 사용합니다.")
+
+    is_new = not os.path.exists(db_file)
+    storage = SqliteNoticeStorage(db_file)
+    if is_new and os.path.exists(data_file):
+        migrate_json_to_sqlite(data_file, storage)
+    return storage
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 동기화 여부를 판단하는 게시글 필드
+# 조회수(views)와 수집 시각(crawled_at)은 게시글이 바뀌지 않아도 크롤링마다 달라지므로 제외하고,
+# HTML 본문은 블롭 해시(content_ref)로 비교한다. (content_ref가 없는 이전 데이터는 content_html 사용)
+LEDGER_FIELDS = ('category', 'number', 'title', 'author', 'date', 'attachments', 'url', 'content',
+                 'image_urls', 'content_ref')
+
+# Firestore 문서 형식 버전 - 저장하는 필드가 바뀌면 올려서 다음 동기화 때 전체 게시글을 다시 저장한다.
+# (2: search_tokens 추가)
+DOCUMENT_VERSION = 2
+
+# 장부 줄 수가 문서 수의 몇 배를 넘으면 압축하는지 (압축 비용이 동기화마다 장부 전체에 비례하지 않도록)
+LEDGER_COMPACT_RATIO = 2
+
+
+def notice_hash(notice) -> str:
+    """Firebase 문서 내용 비교용 게시글 해시"""
+    values = [DOCUMENT_VERSION] + [notice.get(field, '') for field in LEDGER_FIELDS]
+    if not notice.get('content_ref'):
+        values.append(notice.get('content_html', ''))
+    return hashlib.sha256(json.dumps(values, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+class SyncLedger:
+    """Firebase 동기화 장부 (JSONL)
+
+    문서 ID마다 마지막으로 Firestore에 저장한 게시글 해시를 기록한다.
+    동기화할 때 해시가 같은 게시글은 건너뛰고, 배치를 커밋할 때마다 장부 파일에 한 줄씩 추가하므로
+    동기화 도중 중단되어도 다시 실행하면 커밋된 배치 이후부터 이어서 저장한다.
+    동기화가 끝나면 compact()로 문서마다 한 줄만 남긴다. (장부 줄 수가 문서 수의 LEDGER_COMPACT_RATIO배를 넘었을 때만)
+    첫 줄에 컬렉션 이름을 기록하며, 컬렉션이 바뀌면 장부를 비운다.
+    """
+
+    def __init__(self, ledger_file: str, collection_name: str):
+        self.ledger_file = ledger_file
+        self.collection_name = collection_name
+        self.lock = Lock()
+        self.entries: Dict[str, dict] = {}
+        self.appended = 0
+        self._load()
+
+    def _load(self):
+        """장부 파일 로드 (잘린 마지막 줄은 무시)"""
+        if not os.path.exists(self.ledger_file):
+            return
+        try:
+            with open(self.ledger_file, 'r', encoding='utf-8') as f:
+                header = json.loads(f.readline() or '{}')
+                if header.get('collection') == self.collection_name:
+                    for line in f:
+                        self.appended += 1
+                        try:
+                            doc_id, content_hash, synced_at = json.loads(line)
+                        except ValueError:
+                            # 기록 도중 중단되어 잘린 줄 (다음 압축 때 정리)
+                            continue
+                        self.entries[doc_id] = {'hash': content_hash, 'synced_at': synced_at}
+                    return
+            logging.info(f"Firebase 컬렉션이 바뀌어 동기화 장부를 비웁니다: {header.get('collection')} → {self.collection_name}")
+            os.remove(self.ledger_file)
+        except Exception as e:
+            logging.error(f"Firebase 동기화 장부 로드 실패: {e}")
+
+    def get_pending(self, documents: Iterable[Tuple[str, dict]]) -> List[Tuple[str, dict]]:
+        """(문서 ID, 게시글) 중 장부의 해시와 다른(새/변경) 게시글만 반환"""
+        with self.lock:
+            return [(doc_id, notice) for doc_id, notice in documents
+                    if self.entries.get(doc_id, {}).get('hash') != notice_hash(notice)]
+
+    def record(self, documents: Iterable[Tuple[str, dict]]):
+        """커밋한 게시글의 해시를 장부에 추가"""
+        synced_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        lines = []
+        with self.lock:
+            for doc_id, notice in documents:
+                content_hash = notice_hash(notice)
+                self.entries[doc_id] = {'hash': content_hash, 'synced_at': synced_at}
+                lines.append(json.dumps([doc_id, content_hash, synced_at], ensure_ascii=False))
+            if not lines:
+                return
+            try:
+                header = [] if os.path.exists(self.ledger_file) else [json.dumps({'collection': self.collection_name}, ensure_ascii=False)]
+                with open(self.ledger_file, 'a', encoding='utf-8') as f:
+                    f.write('\n'.join(header + lines) + '\n')
+                    f.flush()
+                    os.fsync(f.fileno())
+                self.appended += len(lines)
+            except Exception as e:
+                logging.error(f"Firebase 동기화 장부 저장 실패: {e}")
+
+    def compact(self):
+        """문서마다 마지막 기록 한 줄만 남기도록 장부 파일 다시 쓰기
+
+        장부 줄 수가 문서 수의 LEDGER_COMPACT_RATIO배를 넘을 때만 다시 쓴다.
+        (게시글 몇 개를 다시 저장할 때마다 장부 전체를 다시 쓰지 않도록)
+        """
+        with self.lock:
+            if self.appended <= LEDGER_COMPACT_RATIO * len(self.entries):
+                return
+            try:
+                temp_file = f"{self.ledger_file}.tmp"
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    f.write(json.dumps({'collection': self.collection_name}, ensure_ascii=False) + '\n')
+                    for doc_id, entry in self.entries.items():
+                        f.write(json.dumps([doc_id, entry['hash'], entry['synced_at']], ensure_ascii=False) + '\n')
+                os.replace(temp_file, self.ledger_file)
+                self.appended = len(self.entries)
+            except Exception as e:
+                logging.error(f"Firebase 동기화 장부 압축 실패: {e}")
+
+    def clear(self):
+        """장부 비우기 (다음 동기화에서 전체 게시글 저장)"""
+        with self.lock:
+            self.entries = {}
+            self.appended = 0
+            if os.path.exists(self.ledger_file):
+                os.remove(self.ledger_file)
+
+    def get_stats(self) -> Dict[str, Optional[str]]:
+        with self.lock:
+            last_synced = max((entry['synced_at'] for entry in self.entries.values()), default=None)
+            return {'documents': len(self.entries), 'last_synced_at': last_synced}
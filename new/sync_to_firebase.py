@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 """
-로컬 JSON 데이터를 Firebase에 동기화하는 스크립트
+로컬 데이터(SQLite 저장소 또는 JSON 파일)를 Firebase에 동기화하는 스크립트
+
+저장소, 블롭 저장소, 동기화 장부 경로는 API 서버와 같은 설정 파일(crawler_config.json)에서 읽습니다.
+
+사용법:
+    python sync_to_firebase.py [--force] [--config 설정 파일]
 """
 import json
 import os
@@ -12,9 +17,46 @@ from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from firebase_service import FirebaseService
+from storage import JournalNoticeStorage, JsonNoticeStorage, SqliteNoticeStorage
+from content_store import ContentBlobStore
+from sync_ledger import SyncLedger
+
+def load_paths(config_file='crawler_config.json'):
+    """설정 파일에서 저장소/블롭 저장소/동기화 장부 경로 읽기 (CrawlerService와 같은 기본값)"""
+    config = {}
+    if os.path.exists(config_file):
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    
+    data_file = config.get('data_file', 'notices_data.json')
+    base_name = os.path.splitext(data_file)[0]
+    return {
+        'storage': config.get('storage', 'sqlite'),
+        'data_file': data_file,
+        'storage_file': config.get('storage_file') or f"{base_name}.db",
+        'journal_file': config.get('journal_file') or f"{base_name}.journal.jsonl",
+        'content_store_dir': config.get('content_store_dir') or f"{base_name}_content",
+        'content_compression': config.get('content_compression', 'zstd'),
+        'firebase_ledger_file': config.get('firebase_ledger_file') or f"{base_name}_firebase_ledger.jsonl"
+    }
 
-async def sync_to_firebase():
-    """로컬 JSON 데이터를 Firebase에 동기화"""
+def open_storage(paths):
+    """설정된 저장소 열기 - (읽을 파일, 저장소) 또는 데이터가 없으면 None
+    
+    SQLite 저장소가 아직 없으면 JSON 데이터 파일을 읽는다. (DB는 API 서버가 처음 시작할 때 이전)
+    """
+    data_file, db_file = paths['data_file'], paths['storage_file']
+    if paths['storage'] == 'journal' and os.path.exists(data_file):
+        # 압축은 API 서버에 맡기고 스냅샷과 저널만 읽음
+        return data_file, JournalNoticeStorage(data_file, paths['journal_file'], compact_interval=0)
+    if paths['storage'] not in ('json', 'journal') and os.path.exists(db_file):
+        return db_file, SqliteNoticeStorage(db_file)
+    if os.path.exists(data_file):
+        return data_file, JsonNoticeStorage(data_file)
+    return None
+
+async def sync_to_firebase(force=False, config_file='crawler_config.json'):
+    """로컬 데이터 중 새/변경 게시글을 Firebase에 동기화 (force: 장부를 비우고 전체 저장)"""
     
     print("🔄 Firebase 동기화 시작...")
     
@@ -31,26 +73,42 @@ async def sync_to_firebase():
     
     print("✅ Firebase 연결 성공")
     
-    # 로컬 JSON 파일 읽기
-    json_file = "notices_data.json"
-    if not os.path.exists(json_file):
-        print(f"❌ {json_file} 파일을 찾을 수 없습니다")
+    # 로컬 데이터 읽기 (설정된 저장소)
+    paths = load_paths(config_file)
+    opened = open_storage(paths)
+    if opened is None:
+        print(f"❌ {paths['storage_file']} 또는 {paths['data_file']} 파일을 찾을 수 없습니다")
         return False
+    data_file, storage = opened
     
-    print(f"📄 {json_file} 파일 읽는 중...")
+    print(f"📄 {data_file} 파일 읽는 중...")
     
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            notices_data = json.load(f)
+        notices_data = storage.load_all()
+        if isinstance(storage, SqliteNoticeStorage):
+            storage.close()
+        
+        # HTML 본문은 저장할 게시글만 블롭 저장소에서 읽어 채움 (이전 데이터처럼 레코드에 있으면 그대로 사용)
+        content_store = ContentBlobStore(paths['content_store_dir'], paths['content_compression'])
+        
+        def load_contents(notices):
+            for notice in notices:
+                if not notice.get('content_html'):
+                    notice['content_html'] = content_store.get(notice.get('content_ref', ''))
+            return notices
         
         print(f"📊 총 {len(notices_data)}개의 공지사항 발견")
         
-        # Firebase에 배치 저장
+        # 동기화 장부와 비교하여 새/변경 게시글만 배치 저장 (중단된 동기화는 이어서 저장)
+        ledger = SyncLedger(paths['firebase_ledger_file'], firebase_service.collection_name)
+        if force:
+            await asyncio.to_thread(ledger.clear)
         print("🚀 Firebase에 데이터 업로드 중...")
-        result = await firebase_service.save_notices_batch(notices_data)
+        result = await firebase_service.sync_notices(notices_data, ledger, load_contents)
         
         print("✅ 동기화 완료!")
-        print(f"   - 성공: {result['success']}개")
+        print(f"   - 저장: {result['pushed']}개")
+        print(f"   - 변경 없음: {result['skipped']}개")
         print(f"   - 실패: {result['failed']}개")
         
         if result['failed'] > 0:
@@ -60,9 +118,9 @@ async def sync_to_firebase():
         
         # Firebase 통계 조회
         print("\n📈 Firebase 통계:")
-        stats = await firebase_service.get_firebase_stats()
+        stats = await firebase_service.get_collection_stats(sorted({notice.get('category', 'Unknown') for notice in notices_data}))
         print(f"   - 총 문서 수: {stats.get('total_documents', 0)}")
-        print(f"   - 최근 업데이트: {stats.get('last_updated', 'N/A')}")
+        print(f"   - 최근 업데이트: {stats.get('latest_update', 'N/A')}")
         
         return True
         
@@ -76,7 +134,8 @@ async def main():
     print("🔥 Firebase 동기화 도구")
     print("=" * 50)
     
-    success = await sync_to_firebase()
+    config_file = sys.argv[sys.argv.index('--config') + 1] if '--config' in sys.argv[:-1] else 'crawler_config.json'
+    success = await sync_to_firebase(force='--force' in sys.argv, config_file=config_file)
     
     print("\n" + "=" * 50)
     if success:
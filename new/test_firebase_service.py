@@ -0,0 +1,131 @@
+"""
+Firebase 배치 저장 테스트 (Firestore 대신 커밋을 기록하는 가짜 클라이언트 사용)
+
+사용법:
+    python -m pytest -q test_firebase_service.py
+"""
+import asyncio
+
+from google.api_core.exceptions import InvalidArgument, PermissionDenied, ServiceUnavailable
+
+from firebase_service import FirebaseService
+from sync_ledger import SyncLedger
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, exists):
+        self.id = doc_id
+        self.exists = exists
+
+
+class FakeDocument:
+    def __init__(self, doc_id):
+        self.id = doc_id
+
+
+class FakeCollection:
+    def document(self, doc_id):
+        return FakeDocument(doc_id)
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self.db = db
+        self.doc_ids = []
+
+    def set(self, doc_ref, data, merge=False):
+        self.doc_ids.append(doc_ref.id)
+
+    def commit(self):
+        self.db.commits.append(list(self.doc_ids))
+        if self.db.errors:
+            raise self.db.errors.pop(0)
+        if self.db.error_for_all:
+            raise self.db.error_for_all
+        if self.db.bad_doc_ids.intersection(self.doc_ids):
+            raise InvalidArgument('문서 크기 초과')
+        self.db.stored.update(self.doc_ids)
+
+
+class FakeFirestore:
+    """배치 커밋마다 문서 ID 목록을 기록하고, 지정한 문서가 들어 있으면 배치 전체를 실패시킨다"""
+
+    def __init__(self, bad_doc_ids=(), error_for_all=None, errors=()):
+        self.bad_doc_ids = set(bad_doc_ids)
+        self.error_for_all = error_for_all
+        self.errors = list(errors)
+        self.commits = []
+        self.stored = set()
+
+    def collection(self, name):
+        return FakeCollection()
+
+    def batch(self):
+        return FakeBatch(self)
+
+    def get_all(self, doc_refs, field_paths=None):
+        return [FakeSnapshot(doc_ref.id, doc_ref.id in self.stored) for doc_ref in doc_refs]
+
+
+def make_notices(count):
+    return [{'category': '학과소식', 'number': str(number), 'title': f"공지 {number}",
+             'url': f"https://csai.jbnu.ac.kr/bbs/{number}"} for number in range(count)]
+
+
+def make_service(db):
+    service = FirebaseService()
+    service.db = db
+    service.initialized = True
+    service.commit_retry_backoff = 0
+    return service
+
+
+def save(service, notices, ledger):
+    return asyncio.run(service.save_notices_batch(notices, ledger))
+
+
+def test_bisects_to_the_failing_document(tmp_path):
+    """한 문서 때문에 배치가 실패하면 나머지 문서는 커밋하고 장부에 기록한다"""
+    notices = make_notices(8)
+    service = make_service(None)
+    doc_ids = [service._generate_doc_id(notice) for notice in notices]
+    db = FakeFirestore(bad_doc_ids=[doc_ids[5]])
+    service.db = db
+    ledger = SyncLedger(str(tmp_path / 'ledger.jsonl'), service.collection_name)
+
+    result = save(service, notices, ledger)
+
+    assert (result['success'], result['failed']) == (7, 1)
+    assert [detail['doc_id'] for detail in result['details'] if detail['status'] == 'failed'] == [doc_ids[5]]
+    assert db.stored == set(doc_ids) - {doc_ids[5]}
+    # 실패한 문서가 없는 절반은 한 번에 커밋된다
+    assert doc_ids[:4] in db.commits
+    assert [doc_id for doc_id, _ in ledger.get_pending(zip(doc_ids, notices))] == [doc_ids[5]]
+
+
+def test_batch_wide_error_fails_without_bisecting(tmp_path):
+    """권한 오류는 배치를 나누지 않고 바로 실패로 처리하며, 남은 배치도 커밋하지 않는다"""
+    db = FakeFirestore(error_for_all=PermissionDenied('권한 없음'))
+    service = make_service(db)
+    service.commit_concurrency = 1
+    ledger = SyncLedger(str(tmp_path / 'ledger.jsonl'), service.collection_name)
+
+    result = save(service, make_notices(1200), ledger)
+
+    assert (result['success'], result['failed']) == (0, 1200)
+    assert len(db.commits) == 1
+    assert {detail['error'] for detail in result['details']} == {'403 권한 없음'}
+    assert ledger.get_stats()['documents'] == 0
+
+
+def test_transient_error_is_retried(tmp_path):
+    """일시적인 오류는 같은 배치를 다시 커밋한다"""
+    db = FakeFirestore(errors=[ServiceUnavailable('잠시 후 다시 시도')])
+    service = make_service(db)
+    ledger = SyncLedger(str(tmp_path / 'ledger.jsonl'), service.collection_name)
+
+    result = save(service, make_notices(3), ledger)
+
+    assert (result['success'], result['failed'], result['retries']) == (3, 0, 1)
+    assert len(db.commits) == 2 and db.commits[0] == db.commits[1]
+    assert ledger.get_stats()['documents'] == 3
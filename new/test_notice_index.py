@@ -0,0 +1,171 @@
+"""
+조회 API용 게시글 인덱스 테스트 (날짜순 목록, id/url 조회, 크롤링 결과 반영, 커서 페이지네이션)
+
+사용법:
+    python -m pytest -q test_notice_index.py
+"""
+import base64
+
+import pytest
+
+from notice_index import NoticeIndex, decode_cursor, encode_cursor
+from storage import merge_posts
+
+
+def make_post(number, date, category='학과소식', **fields):
+    return {
+        'id': f"{category}_{number}",
+        'category': category,
+        'number': str(number),
+        'title': f"공지 {number}",
+        'date': date,
+        'url': f"https://csai.jbnu.ac.kr/bbs/{number}",
+        'content': f"본문 {number}",
+        **fields
+    }
+
+
+def numbers(posts):
+    return [post['number'] for post in posts]
+
+
+def test_page_is_sorted_by_date_then_existing_order():
+    """날짜 최신순이며, 날짜가 같으면 existing_data에서 앞선 게시글이 먼저 온다"""
+    posts = [make_post(4, '2025.01.02'), make_post(3, '2025.01.03'), make_post(2, '2025.01.02'),
+             make_post(1, '2025.01.01')]
+    index = NoticeIndex(posts)
+
+    expected = sorted(posts, key=lambda post: post['date'], reverse=True)
+    assert numbers(index.get_page()) == numbers(expected) == ['3', '4', '2', '1']
+    assert numbers(index.get_page(offset=1, limit=2)) == ['4', '2']
+    assert numbers(list(index.iter_latest())) == ['3', '4', '2', '1']
+
+
+def test_category_pages_and_stats():
+    """카테고리별 목록, 카테고리 목록, 게시글 수와 최신 날짜"""
+    index = NoticeIndex([make_post(3, '2025.01.03', '일반공지'), make_post(2, '2025.01.02'),
+                         make_post(1, '2025.01.01', '일반공지')])
+
+    assert numbers(index.get_page('일반공지')) == ['3', '1']
+    assert index.get_page('없는카테고리') == []
+    assert index.get_categories() == ['일반공지', '학과소식']
+    assert index.get_category_stats() == {'일반공지': (2, '2025.01.03'), '학과소식': (1, '2025.01.02')}
+    assert len(index) == 3
+
+
+def test_lookup_by_id_and_url():
+    """id 조회는 같은 id 중 existing_data에서 가장 앞선 게시글을 반환한다"""
+    newer = make_post(1, '2025.01.02', title='최신')
+    older = make_post(1, '2025.01.01', title='이전')
+    index = NoticeIndex([newer, older])
+
+    assert index.get_by_id(newer['id']) is newer
+    assert index.get_by_id('없는 id') is None
+    assert index.has_url(newer['url'])
+    assert not index.has_url('https://csai.jbnu.ac.kr/bbs/999')
+
+
+def test_apply_matches_rebuild_of_merged_data():
+    """apply()로 반영한 결과는 병합한 전체 데이터로 다시 만든 인덱스와 같다"""
+    existing = [make_post(3, '2025.01.03'), make_post(2, '2025.01.02', '일반공지'), make_post(1, '2025.01.01')]
+    new_posts = [make_post(5, '2025.01.02'), make_post(4, '2025.01.04', '일반공지')]
+    updated_posts = [make_post(2, '2025.01.05', '일반공지', title='수정된 제목'), make_post(1, '2025.01.01', title='수정')]
+
+    index = NoticeIndex(existing)
+    index.apply(new_posts, updated_posts)
+    rebuilt = NoticeIndex(merge_posts(existing, new_posts + updated_posts))
+
+    for category in (None, '학과소식', '일반공지'):
+        assert index.get_page(category) == rebuilt.get_page(category)
+    assert index.get_category_stats() == rebuilt.get_category_stats()
+    assert index.get_by_url(updated_posts[0]['url'])['title'] == '수정된 제목'
+    assert index.search('수정된')[0] == 1
+    assert index.search('공지 2') == rebuilt.search('공지 2')
+    assert len(index) == len(rebuilt) == 5
+
+
+def test_apply_removes_emptied_category():
+    """변경으로 게시글이 모두 빠진 카테고리는 목록에서 사라진다"""
+    index = NoticeIndex([make_post(1, '2025.01.01', '일반공지')])
+    index.apply([], [make_post(1, '2025.01.01', '학과소식')])
+
+    assert index.get_categories() == ['학과소식']
+    assert index.get_page('일반공지') == []
+
+
+def test_rebuild_replaces_everything():
+    """rebuild()는 이전 게시글을 모두 버리고 새 목록으로 인덱스를 만든다"""
+    index = NoticeIndex([make_post(1, '2025.01.01')])
+    index.rebuild([make_post(2, '2025.01.02', '일반공지')])
+
+    assert numbers(index.get_page()) == ['2']
+    assert index.get_categories() == ['일반공지']
+    assert index.get_by_url(make_post(1, '2025.01.01')['url']) is None
+    assert index.search('공지 1') == (0, [])
+
+
+def test_cursor_round_trip():
+    """커서는 (날짜, id, seq)를 URL에 쓸 수 있는 문자열로 담는다"""
+    cursor = encode_cursor('2025.01.02', '학과소식_1', 7)
+    assert '=' not in cursor and '/' not in cursor and '+' not in cursor
+    assert decode_cursor(cursor) == ('2025.01.02', '학과소식_1', 7)
+    assert decode_cursor(encode_cursor('', '', None)) == ('', '', None)
+
+
+def test_invalid_cursor_raises_value_error():
+    """형식이 잘못된 커서는 ValueError"""
+    for cursor in ('잘못된커서', base64.urlsafe_b64encode(b'[1, 2, 3]').decode(),
+                   base64.urlsafe_b64encode(b'["2025.01.01", "id"]').decode(),
+                   base64.urlsafe_b64encode(b'["2025.01.01", "id", "seq"]').decode()):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+def read_all_pages(index, limit, category=None):
+    """커서로 limit개씩 끝까지 읽은 게시글 번호"""
+    result = []
+    page = index.get_page(category, limit=limit)
+    while page:
+        result += numbers(page)
+        page = index.get_page_after(decode_cursor(index.get_cursor(page[-1])), category, limit)
+    return result
+
+
+def test_cursor_pages_cover_every_post_once():
+    """같은 날짜 게시글이 페이지 경계에 걸쳐도 커서로 모든 게시글을 한 번씩 읽는다"""
+    posts = [make_post(number, f"2025.01.0{number % 3 + 1}", '일반공지' if number % 2 else '학과소식')
+             for number in range(10, 0, -1)]
+    index = NoticeIndex(posts)
+
+    assert read_all_pages(index, 3) == numbers(index.get_page())
+    assert read_all_pages(index, 2, '일반공지') == numbers(index.get_page('일반공지'))
+
+
+def test_cursor_is_stable_when_new_posts_are_added():
+    """앞 페이지를 받은 뒤 새 게시글이 추가되어도 다음 페이지가 밀리지 않는다"""
+    index = NoticeIndex([make_post(number, f"2025.01.0{number}") for number in range(5, 0, -1)])
+    first_page = index.get_page(limit=2)
+    cursor = decode_cursor(index.get_cursor(first_page[-1]))
+
+    index.apply([make_post(6, '2025.01.06'), make_post(7, '2025.01.04')], [])
+    assert numbers(index.get_page_after(cursor, limit=2)) == ['3', '2']
+
+
+def test_cursor_distinguishes_duplicate_date_and_id():
+    """(날짜, id)가 같은 게시글이 여러 개면 seq로 커서 위치를 구분한다"""
+    posts = [{**make_post(1, '2025.01.01'), 'title': title, 'url': f'u{title}'} for title in 'abc']
+    index = NoticeIndex(posts)
+    first = index.get_page(limit=1)
+
+    assert [post['title'] for post in first] == ['a']
+    assert [post['title'] for post in index.get_page_after(decode_cursor(index.get_cursor(first[0])))] == ['b', 'c']
+
+
+def test_cursor_for_changed_post_resumes_from_same_date():
+    """커서 게시글이 바뀌었으면 같은 날짜 게시글부터 다시 반환한다 (중복은 있어도 누락은 없음)"""
+    index = NoticeIndex([make_post(3, '2025.01.03'), make_post(2, '2025.01.02'), make_post(1, '2025.01.01')])
+    cursor = decode_cursor(index.get_cursor(index.get_page(limit=2)[-1]))
+
+    index.apply([], [make_post(2, '2025.01.05', title='날짜 변경')])
+    assert numbers(index.get_page_after(cursor)) == ['1']
+    assert numbers(index.get_page_after(('2025.01.02', '없는 id', None))) == ['1']
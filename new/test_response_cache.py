@@ -0,0 +1,117 @@
+"""
+조회 API 응답 캐시 테스트 (ETag, If-None-Match, LRU, 데이터 세대 무효화, 304 응답)
+
+사용법:
+    python -m pytest -q test_response_cache.py
+"""
+import importlib
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from response_cache import ResponseCache
+from test_storage import make_post
+
+
+def test_serialize_is_compact_json_with_body_etag():
+    """공백 없는 UTF-8 JSON으로 직렬화하고 본문이 같으면 ETag도 같다"""
+    entry = ResponseCache.serialize({'title': '공지', 'items': [1, 2]}, {'X-Next-Cursor': 'abc'})
+
+    assert entry['body'] == '{"title":"공지","items":[1,2]}'.encode('utf-8')
+    assert entry['etag'] == ResponseCache.serialize({'title': '공지', 'items': [1, 2]})['etag']
+    assert entry['etag'] != ResponseCache.serialize({'title': '공지', 'items': [2, 1]})['etag']
+    assert entry['headers'] == {'X-Next-Cursor': 'abc'}
+
+
+def test_if_none_match_comparison():
+    """약한 비교: W/ 접두어, 여러 값, *를 허용한다"""
+    etag = '"abc"'
+    assert ResponseCache.matches('"abc"', etag)
+    assert ResponseCache.matches('W/"abc"', etag)
+    assert ResponseCache.matches('"xyz", "abc"', etag)
+    assert ResponseCache.matches('*', etag)
+    assert not ResponseCache.matches('"xyz"', etag)
+    assert not ResponseCache.matches(None, etag)
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    """항목 수나 본문 합계를 넘으면 가장 오래 쓰지 않은 항목부터 버린다"""
+    cache = ResponseCache(max_entries=2, max_bytes=10)
+    cache.put('a', {'body': b'1234'})
+    cache.put('b', {'body': b'1234'})
+    cache.get('a')
+    cache.put('c', {'body': b'1234'})
+    assert cache.get('b') is None and cache.get('a') and cache.get('c')
+
+    cache.put('d', {'body': b'12345678'})
+    assert list(cache.entries) == ['d']
+    assert cache.total_bytes == 8
+
+    cache.put('e', {'body': b'12345678901'})
+    assert cache.get('e') is None
+    assert cache.get_stats()['evictions'] == 3
+
+
+def test_invalidate_bumps_generation_and_clears():
+    """데이터가 바뀌면 세대를 올리고 캐시를 비운다"""
+    cache = ResponseCache()
+    cache.put(('/notices', (), cache.generation), ResponseCache.serialize([]))
+
+    assert cache.invalidate() == 1
+    assert cache.get_stats() == {'hits': 0, 'misses': 0, 'not_modified': 0, 'evictions': 0,
+                                 'entries': 0, 'bytes': 0, 'generation': 1}
+
+
+@pytest.fixture(scope='module')
+def api(tmp_path_factory):
+    """임시 디렉토리의 빈 저장소로 API 서버 모듈 로드 (설정/데이터 파일은 작업 디렉토리 기준)"""
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp('api'))
+    try:
+        app_module = importlib.import_module('app')
+        yield app_module
+        app_module.crawler_service.storage.close()
+    finally:
+        os.chdir(cwd)
+
+
+def test_not_modified_until_crawl_results_change(api):
+    """같은 데이터에는 캐시된 본문과 ETag로, If-None-Match가 같으면 304로 응답하고, 크롤링 결과가 반영되면 새 ETag로 응답한다"""
+    service = api.crawler_service
+    service._apply_crawl_results([make_post(1)], [])
+    client = TestClient(api.app)
+
+    first = client.get('/notices', params={'fields': 'id,title'})
+    assert first.status_code == 200
+    assert first.json() == [{'id': make_post(1)['id'], 'title': make_post(1)['title']}]
+    etag = first.headers['etag']
+    assert first.headers['cache-control'] == 'no-cache'
+
+    not_modified = client.get('/notices', params={'fields': 'id,title'}, headers={'If-None-Match': etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b''
+    assert not_modified.headers['etag'] == etag
+
+    # 쿼리 파라미터가 다르면 다른 캐시 항목
+    assert client.get('/notices', params={'fields': 'id'}).headers['etag'] != etag
+
+    stats = service.response_cache.get_stats()
+    assert stats['hits'] == 1 and stats['not_modified'] == 1
+
+    service._apply_crawl_results([make_post(2)], [])
+    changed = client.get('/notices', params={'fields': 'id,title'}, headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert changed.headers['etag'] != etag
+    assert [notice['id'] for notice in changed.json()] == [make_post(2)['id'], make_post(1)['id']]
+    assert service.response_cache.get_stats()['generation'] == stats['generation'] + 1
+
+
+def test_next_cursor_header_is_cached(api):
+    """다음 페이지 커서 헤더도 캐시된 응답과 함께 보낸다"""
+    client = TestClient(api.app)
+
+    first = client.get('/notices', params={'limit': 1})
+    cached = client.get('/notices', params={'limit': 1})
+    assert first.headers['x-next-cursor'] == cached.headers['x-next-cursor']
+    assert first.content == cached.content
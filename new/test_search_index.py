@@ -0,0 +1,93 @@
+"""
+검색 색인 테스트 (bi-gram 토큰화, 검색어 단어 AND 일치, 점수순 정렬, 삭제 정리)
+
+사용법:
+    python -m pytest -q test_search_index.py
+"""
+from search_index import PHRASE_BONUS, TITLE_WEIGHT, SearchIndex, ordered_tokens, split_terms, tokenize
+
+
+def make_post(number, title, content='', category='학과소식', date='2025.01.01'):
+    return {'id': f"{category}_{number}", 'category': category, 'number': str(number), 'title': title,
+            'content': content, 'date': date}
+
+
+def build_index(posts):
+    index = SearchIndex()
+    doc_ids = [index.add(post) for post in posts]
+    return index, doc_ids
+
+
+def numbers(result):
+    total, posts = result
+    return total, [post['number'] for post in posts]
+
+
+def test_tokenize_splits_words_into_bigrams():
+    """단어별 bi-gram (단어 경계를 넘는 bi-gram 없음, 소문자)"""
+    assert tokenize('장학금 AI') == {'장학', '학금', 'ai'}
+    assert ordered_tokens('장학금 안내 장학') == ['장학', '학금', '안내']
+    assert split_terms('장학금  안내 장학금') == ['장학금', '안내']
+
+
+def test_all_terms_must_match():
+    """검색어 단어가 모두 제목이나 본문에 있는 게시글만 반환한다"""
+    index, _ = build_index([
+        make_post(1, '장학금 신청 안내'),
+        make_post(2, '장학금 수혜자 발표'),
+        make_post(3, '수강 신청', '장학금 관련 문의'),
+    ])
+
+    assert numbers(index.search('장학금 신청')) == (2, ['1', '3'])
+    assert numbers(index.search('장학금 없는단어')) == (0, [])
+
+
+def test_bigram_candidates_are_verified():
+    """bi-gram이 모두 있어도 단어 자체가 없으면 제외한다"""
+    index, _ = build_index([make_post(1, '장학 학금'), make_post(2, '장학금')])
+
+    assert numbers(index.search('장학금')) == (1, ['2'])
+
+
+def test_ranking_prefers_title_then_phrase_then_date():
+    """제목 출현은 본문 TITLE_WEIGHT회와 같고, 전체 문구 가산 후 같은 점수는 최신 날짜가 먼저 온다"""
+    assert TITLE_WEIGHT > 1 and PHRASE_BONUS > 0
+    index, _ = build_index([
+        make_post(1, '공지', '졸업 요건 졸업 요건', date='2025.01.03'),
+        make_post(2, '졸업 요건 안내', date='2025.01.01'),
+        make_post(3, '요건 졸업 안내', date='2025.01.02'),
+        make_post(4, '요건 졸업 공지', date='2025.01.01'),
+    ])
+
+    # 2: 제목 2단어(10) + 문구(10), 3/4: 제목 2단어(10), 1: 본문 4회(4) + 문구(10)
+    assert numbers(index.search('졸업 요건')) == (4, ['2', '1', '3', '4'])
+
+
+def test_category_filter_and_paging():
+    """카테고리 필터, offset/limit과 전체 결과 수"""
+    index, _ = build_index([make_post(number, f'학사 일정 {number}', category='학사공지' if number % 2 else '학과소식',
+                                      date=f'2025.01.{number:02d}') for number in range(1, 7)])
+
+    assert numbers(index.search('학사', category='학사공지')) == (3, ['5', '3', '1'])
+    assert numbers(index.search('학사', offset=1, limit=2)) == (6, ['5', '4'])
+    assert numbers(index.search('학사', category='없는카테고리')) == (0, [])
+
+
+def test_single_character_query_cannot_use_index():
+    """두 글자 이상인 단어가 없으면 None (호출자가 부분 문자열 검색으로 처리)"""
+    index, _ = build_index([make_post(1, '공지')])
+
+    assert index.search('공') is None
+
+
+def test_removed_posts_are_excluded_and_compacted():
+    """삭제 표시한 게시글은 검색되지 않고, 절반을 넘으면 포스팅에서 정리된다 (세미/미나/카테고리 토큰)"""
+    index, doc_ids = build_index([make_post(number, f'세미나 {number}') for number in range(1, 5)])
+    index.remove(doc_ids[0])
+    assert numbers(index.search('세미나')) == (3, ['4', '3', '2'])
+    assert index.get_stats()['deleted_documents'] == 1
+
+    index.remove(doc_ids[1])
+    index.remove(doc_ids[2])
+    assert numbers(index.search('세미나')) == (1, ['4'])
+    assert index.get_stats() == {'documents': 1, 'deleted_documents': 0, 'tokens': 3, 'postings': 3}
@@ -0,0 +1,207 @@
+"""
+게시글 저장소 테스트 (SQLite 저장소, JSON → SQLite 이전, 저널 저장소)
+
+사용법:
+    python -m pytest -q test_storage.py
+"""
+import json
+import sqlite3
+import sys
+
+import migrate_to_sqlite
+from notice_record import NoticeRecord
+from storage import JournalNoticeStorage, SqliteNoticeStorage, create_storage
+
+
+def make_post(number, category='학과소식', **fields):
+    return {
+        'id': f"{category}_{number}",
+        'category': category,
+        'number': str(number),
+        'title': f"공지 {number}",
+        'author': '관리자',
+        'date': f"2025.01.{number:02d}",
+        'attachments': '',
+        'views': '10',
+        'url': f"https://csai.jbnu.ac.kr/bbs/{number}",
+        'content': f"본문 {number}",
+        'image_urls': [f"https://csai.jbnu.ac.kr/img/{number}.png"],
+        'crawled_at': '2025-01-31 12:00:00',
+        'content_ref': f"{number:064x}",
+        **fields
+    }
+
+
+def urls(posts):
+    return [post['url'] for post in posts]
+
+
+def test_sqlite_round_trip(tmp_path):
+    """저장한 게시글을 같은 순서, 같은 값으로 다시 읽는다"""
+    posts = [make_post(3), make_post(2), make_post(1)]
+    storage = SqliteNoticeStorage(str(tmp_path / 'notices.db'))
+    storage.replace_all(posts)
+    storage.close()
+
+    storage = SqliteNoticeStorage(str(tmp_path / 'notices.db'))
+    loaded = storage.load_all()
+    assert storage.count() == 3
+    storage.close()
+
+    assert all(isinstance(post, NoticeRecord) for post in loaded)
+    assert [{field: post.get(field) for field in expected} for post, expected in zip(loaded, posts)] == posts
+
+
+def test_sqlite_upsert_adds_new_posts_first(tmp_path):
+    """새 게시글은 기존 게시글보다 앞에 추가된다"""
+    storage = SqliteNoticeStorage(str(tmp_path / 'notices.db'))
+    storage.replace_all([make_post(2), make_post(1)])
+    storage.upsert([make_post(4), make_post(3)])
+
+    assert urls(storage.load_all()) == urls([make_post(4), make_post(3), make_post(2), make_post(1)])
+    assert storage.count() == 4
+    storage.close()
+
+
+def test_sqlite_upsert_updates_by_url_in_place(tmp_path):
+    """URL이 같은 게시글은 새 행을 만들지 않고 제자리에서 교체한다"""
+    storage = SqliteNoticeStorage(str(tmp_path / 'notices.db'))
+    storage.replace_all([make_post(3), make_post(2), make_post(1)])
+    storage.upsert([make_post(2, title='수정된 제목', image_urls=[])])
+
+    loaded = storage.load_all()
+    assert urls(loaded) == urls([make_post(3), make_post(2), make_post(1)])
+    assert loaded[1]['title'] == '수정된 제목'
+    assert loaded[1]['image_urls'] == []
+    assert storage.count() == 3
+    storage.close()
+
+
+def test_sqlite_keeps_one_row_per_url(tmp_path):
+    """여러 카테고리에서 수집한 같은 URL의 게시글은 처음 나온 것만 저장한다"""
+    storage = SqliteNoticeStorage(str(tmp_path / 'notices.db'))
+    storage.replace_all([make_post(1, category='학과소식'), make_post(1, category='일반공지')])
+    storage.upsert([make_post(2), make_post(2, category='일반공지')])
+
+    loaded = storage.load_all()
+    assert [(post['url'], post['category']) for post in loaded] == [
+        (make_post(2)['url'], '학과소식'), (make_post(1)['url'], '학과소식')]
+    storage.close()
+
+
+def test_sqlite_migrates_duplicate_urls(tmp_path):
+    """URL 고유 색인이 없는 이전 DB는 URL이 같은 행 중 가장 최근 행만 남긴다"""
+    db_file = str(tmp_path / 'notices.db')
+    SqliteNoticeStorage(db_file).close()
+    conn = sqlite3.connect(db_file)
+    conn.execute("DROP INDEX idx_notices_url_unique")
+    conn.execute("CREATE INDEX idx_notices_url ON notices(url)")
+    conn.executemany("INSERT INTO notices (id, category, url) VALUES (?, ?, ?)",
+                     [('일반공지_1', '일반공지', 'u1'), ('학과소식_1', '학과소식', 'u1'), ('학과소식_2', '학과소식', 'u2')])
+    conn.commit()
+    conn.close()
+
+    storage = SqliteNoticeStorage(db_file)
+    assert [(post['id'], post['url']) for post in storage.load_all()] == [('학과소식_2', 'u2'), ('학과소식_1', 'u1')]
+    storage.upsert([{**make_post(1), 'url': 'u1', 'title': '수정된 제목'}])
+    assert [post['title'] for post in storage.load_all()] == ['', '수정된 제목']
+    storage.close()
+
+
+def test_create_storage_migrates_existing_json(tmp_path):
+    """SQLite 저장소를 처음 만들 때 기존 JSON 데이터 파일을 이전한다"""
+    data_file = tmp_path / 'notices_data.json'
+    db_file = tmp_path / 'notices_data.db'
+    posts = [make_post(2), make_post(1)]
+    data_file.write_text(json.dumps(posts, ensure_ascii=False), encoding='utf-8')
+
+    storage = create_storage('sqlite', str(data_file), str(db_file))
+    assert urls(storage.load_all()) == urls(posts)
+    storage.upsert([make_post(3)])
+    storage.close()
+
+    # DB가 이미 있으면 JSON 파일로 덮어쓰지 않는다
+    storage = create_storage('sqlite', str(data_file), str(db_file))
+    assert urls(storage.load_all()) == urls([make_post(3)] + posts)
+    storage.close()
+
+
+def test_migrate_script(tmp_path, monkeypatch):
+    """migrate_to_sqlite.py는 JSON 파일의 내용으로 DB를 교체한다"""
+    data_file = tmp_path / 'notices_data.json'
+    db_file = tmp_path / 'notices_data.db'
+    posts = [make_post(2), make_post(1)]
+    data_file.write_text(json.dumps(posts, ensure_ascii=False), encoding='utf-8')
+
+    storage = SqliteNoticeStorage(str(db_file))
+    storage.replace_all([make_post(9)])
+    storage.close()
+
+    monkeypatch.setattr(sys, 'argv', ['migrate_to_sqlite.py', str(data_file), str(db_file)])
+    migrate_to_sqlite.main()
+
+    storage = SqliteNoticeStorage(str(db_file))
+    assert urls(storage.load_all()) == urls(posts)
+    storage.close()
+
+
+def open_journal(tmp_path):
+    return JournalNoticeStorage(str(tmp_path / 'notices_data.json'), str(tmp_path / 'notices_data.journal.jsonl'),
+                                compact_interval=0)
+
+
+def test_journal_replays_upserts_after_restart(tmp_path):
+    """저널에 추가한 새/변경 게시글을 다시 시작할 때 스냅샷에 적용한다"""
+    storage = open_journal(tmp_path)
+    storage.load_all()
+    storage.replace_all([make_post(1)])
+    storage.upsert([make_post(2)])
+    storage.upsert([make_post(1, title='수정된 제목')])
+
+    loaded = open_journal(tmp_path).load_all()
+    assert urls(loaded) == urls([make_post(2), make_post(1)])
+    assert loaded[1]['title'] == '수정된 제목'
+
+
+def test_journal_truncates_torn_tail(tmp_path):
+    """잘린 마지막 줄을 잘라내어 이후 기록이 다시 시작해도 남는다"""
+    storage = open_journal(tmp_path)
+    storage.load_all()
+    storage.upsert([make_post(1)])
+    with open(storage.journal_file, 'a', encoding='utf-8') as f:
+        f.write('{"op": "upsert", "posts": [{"url": "https://csai')
+
+    storage = open_journal(tmp_path)
+    assert urls(storage.load_all()) == urls([make_post(1)])
+    storage.upsert([make_post(3)])
+
+    assert urls(open_journal(tmp_path).load_all()) == urls([make_post(3), make_post(1)])
+
+
+def test_journal_keeps_last_line_without_newline(tmp_path):
+    """줄바꿈만 빠진 마지막 줄은 적용하고 다음 기록이 같은 줄에 붙지 않도록 줄바꿈을 추가한다"""
+    storage = open_journal(tmp_path)
+    storage.load_all()
+    storage.upsert([make_post(1)])
+    with open(storage.journal_file, 'rb+') as f:
+        f.truncate(len(f.read().rstrip(b'\n')))
+
+    storage = open_journal(tmp_path)
+    assert urls(storage.load_all()) == urls([make_post(1)])
+    storage.upsert([make_post(2)])
+
+    assert urls(open_journal(tmp_path).load_all()) == urls([make_post(2), make_post(1)])
+
+
+def test_journal_compact_writes_snapshot(tmp_path):
+    """압축하면 스냅샷에 모든 변경이 반영되고 저널이 삭제된다"""
+    storage = open_journal(tmp_path)
+    storage.load_all()
+    storage.upsert([make_post(1)])
+    storage.upsert([make_post(2)])
+    storage.compact()
+
+    assert not (tmp_path / 'notices_data.journal.jsonl').exists()
+    snapshot = json.loads((tmp_path / 'notices_data.json').read_text(encoding='utf-8'))
+    assert urls(snapshot) == urls([make_post(2), make_post(1)])
+    assert urls(open_journal(tmp_path).load_all()) == urls([make_post(2), make_post(1)])